@@ -0,0 +1,187 @@
+"""
+⚡ API yanıt katmanı
+Büyük yorum listeleri için hızlı JSON kodlama ve gzip/brotli sıkıştırma
+"""
+
+import gzip
+import json
+from typing import Any, Optional
+
+# Hızlı JSON encoder (opsiyonel)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Brotli sıkıştırma (opsiyonel)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Bu boyutun altındaki gövdeleri sıkıştırmak kazanç sağlamıyor
+MINIMUM_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript')
+
+
+def dumps_json(data: Any) -> bytes:
+    """Veriyi UTF-8 JSON bytes olarak kodla (orjson varsa onu kullan)"""
+    if ORJSON_AVAILABLE:
+        try:
+            # Counter/dict içindeki int anahtarlar ve numpy değerleri de desteklensin
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding başlığına göre 'br', 'gzip' veya None döndür"""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        pieces = part.strip().split(';')
+        name = pieces[0].strip().lower()
+        quality = 1.0
+        for param in pieces[1:]:
+            param = param.strip()
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name] = quality
+
+    def q(name):
+        return accepted.get(name, accepted.get('*', 0.0))
+
+    if BROTLI_AVAILABLE and q('br') > 0 and q('br') >= q('gzip'):
+        return 'br'
+    if q('gzip') > 0:
+        return 'gzip'
+    return None
+
+
+def compress_body(body: bytes, encoding: Optional[str]) -> bytes:
+    """Gövdeyi seçilen kodlama ile sıkıştır"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+def is_compressible(content_type: str) -> bool:
+    return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+
+
+# FastAPI yoksa aynı sınıfı sağlayan Starlette'e düş (default_response_class None olmasın)
+try:
+    from fastapi.responses import JSONResponse
+except ImportError:
+    try:
+        from starlette.responses import JSONResponse
+    except ImportError:
+        JSONResponse = None
+
+if JSONResponse is not None:
+    class FastJSONResponse(JSONResponse):
+        """orjson ile kodlanan JSONResponse"""
+
+        def render(self, content: Any) -> bytes:
+            return dumps_json(content)
+else:
+    FastJSONResponse = None
+
+
+def with_vary(headers):
+    """Yanıt başlıklarına Vary: Accept-Encoding ekle (zaten varsa dokunma)"""
+    vary = b''
+    new_headers = []
+    for key, value in headers:
+        if key.lower() == b'vary':
+            vary = value
+        else:
+            new_headers.append((key, value))
+    if b'accept-encoding' not in vary.lower():
+        vary = vary + b', Accept-Encoding' if vary else b'Accept-Encoding'
+    new_headers.append((b'vary', vary))
+    return new_headers
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding'e göre brotli veya gzip sıkıştırma yapan ASGI middleware.
+    Tek parça (streaming olmayan) ve sıkıştırılabilir yanıtları sıkıştırır. Sıkıştırılabilir türdeki
+    her yanıt (sıkıştırılmadan geçse de) Vary: Accept-Encoding taşır; ara önbellekler sıkıştırılmış ve
+    sıkıştırılmamış gövdeleri yanlış istemciye vermesin.
+    """
+
+    def __init__(self, app, minimum_size: int = MINIMUM_COMPRESS_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get('headers') or [])
+        encoding = negotiate_encoding(headers.get(b'accept-encoding', b'').decode('latin-1'))
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+
+            response_headers = {k.lower(): v for k, v in start_message.get('headers', [])}
+            content_type = response_headers.get(b'content-type', b'').decode('latin-1')
+            body = message.get('body', b'')
+
+            # Sıkıştırma istenmemiş, streaming, zaten sıkıştırılmış, küçük veya sıkıştırılamaz yanıtları
+            # olduğu gibi gönder
+            if (encoding is None
+                    or message.get('more_body', False)
+                    or b'content-encoding' in response_headers
+                    or len(body) < self.minimum_size
+                    or not is_compressible(content_type)):
+                passthrough = True
+                if is_compressible(content_type):
+                    start_message = {**start_message, 'headers': with_vary(start_message.get('headers', []))}
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress_body(body, encoding)
+            new_headers = [(k, v) for k, v in start_message.get('headers', []) if k.lower() != b'content-length']
+            new_headers.append((b'content-encoding', encoding.encode('latin-1')))
+            new_headers.append((b'content-length', str(len(compressed)).encode('latin-1')))
+            new_headers = with_vary(new_headers)
+
+            await send({**start_message, 'headers': new_headers})
+            await send({'type': 'http.response.body', 'body': compressed, 'more_body': False})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def install_fast_responses(app, minimum_size: int = MINIMUM_COMPRESS_SIZE):
+    """FastAPI uygulamasına sıkıştırma middleware'ini ekle"""
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    return app
@@ -1,10 +1,11 @@
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
 import uvicorn
 import os
 from typing import Optional
 import asyncio
 
+from api_responses import FastJSONResponse, install_fast_responses
+
 # Import your parser/scraper
 try:
     from parser import YourScraperClass  # Replace with your actual scraper class
@@ -20,8 +21,10 @@ except ImportError:
 app = FastAPI(
     title="Web Scraper API",
     description="FastAPI + Playwright web scraper service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
+install_fast_responses(app)
 
 # Initialize scraper
 scraper = YourScraperClass()
@@ -64,7 +67,7 @@ async def scrape_url(url: str):
     try:
         # Call your scraper
         result = await scraper.scrape(url)
-        return JSONResponse(content=result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
@@ -0,0 +1,54 @@
+"""
+🧮 Toplu (vektörel) kategori analizi benchmark'ı
+analyze_comment_categories döngüsü ile analyze_batch karşılaştırması ve sonuç eşitliği
+"""
+
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer, SENTIMENT_CODES
+from synthetic_corpus import generate_corpus
+
+# Döngü ölçümü büyük korpuslarda dakikalar sürer; eşitlik bu kadar yorum üzerinde kontrol edilir
+LOOP_SAMPLE_SIZE = 20000
+
+
+def main(size: int = 1000000):
+    analyzer = AdvancedCommentAnalyzer()
+    texts = [comment['comment'] for comment in generate_corpus(size)]
+
+    start = time.perf_counter()
+    batch = analyzer.analyze_batch(texts)
+    batch_time = time.perf_counter() - start
+
+    sample = texts[:LOOP_SAMPLE_SIZE]
+    start = time.perf_counter()
+    loop_results = [analyzer.analyze_comment_categories(text) for text in sample]
+    loop_time = time.perf_counter() - start
+    loop_rate = len(sample) / loop_time
+
+    mismatches = 0
+    for i, result in enumerate(loop_results):
+        for j, category in enumerate(batch['categories']):
+            expected = (result[category]['relevant'], SENTIMENT_CODES[result[category]['sentiment']],
+                        result[category]['confidence'])
+            actual = (bool(batch['relevant'][i, j]), int(batch['sentiment'][i, j]), float(batch['confidence'][i, j]))
+            if expected != actual:
+                mismatches += 1
+
+    print(f"🧮 {size} yorum için toplu kategori analizi")
+    print("=" * 60)
+    print(f"Döngü (ilk {len(sample)} yorum): {loop_rate:10.0f} yorum/sn  (tahmini toplam {size / loop_rate:.1f} sn)")
+    print(f"analyze_batch            : {size / batch_time:10.0f} yorum/sn  ({batch_time:.1f} sn)")
+    print(f"Hızlanma: {size / loop_rate / batch_time:.1f}x")
+    print(f"Çıktı farkı: {mismatches} (yorum, kategori) çifti")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
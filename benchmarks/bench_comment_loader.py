@@ -0,0 +1,105 @@
+"""
+📥 Yorum yükleyici benchmark'ı
+Varsayılan pd.read_csv, sözlük kayıtları (tablo sütunlarından kurulan) ve yoğun tipli sütunlu tablo
+(kategorik kullanıcı/satıcı, Arrow string, epoch tarih) için yükleme süresi ve bellek (RSS);
+tablodan kurulan kayıtların csv.DictReader satırlarıyla eşitliği
+"""
+
+import csv
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from synthetic_corpus import generate_corpus
+
+MODES = ('pandas_default', 'records', 'table')
+IRREGULAR_RATINGS = ('4.5', '300', 'x', '-1', '5 yıldız', '')
+
+
+def peak_rss_mb() -> float:
+    # VmHWM exec ile sıfırlanır; ru_maxrss ise fork eden ana sürecin zirvesini devralabilir
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, filename: str):
+    """Tek yükleme yolunu ayrı süreçte ölç (önceki ölçümlerin belleği karışmasın)"""
+    import pandas as pd
+    from comment_loader import load_comment_records, load_comment_table
+
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == 'pandas_default':
+        data = pd.read_csv(filename, encoding='utf-8')
+    elif mode == 'records':
+        data = load_comment_records(filename)
+    else:
+        data = load_comment_table(filename)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.3f} {peak_rss_mb() - before:.1f} {len(data)}")
+
+
+def records_match(filename: str) -> bool:
+    """Tablodan kurulan kayıtlar = csv.DictReader satırları + date_epoch (iki akış yan yana gezilir)"""
+    from itertools import zip_longest
+    from comment_loader import iter_comment_records
+
+    with open(filename, 'r', encoding='utf-8-sig') as csvfile:
+        for old, new in zip_longest(csv.DictReader(csvfile), iter_comment_records(filename)):
+            if old is None or new is None:
+                return False
+            new.pop('date_epoch', None)
+            if old != new:
+                return False
+    return True
+
+
+def write_corpus(filename: str, size: int):
+    comments = generate_corpus(size)
+    # Puanlar kazınmış serbest metindir: kesirli, aralık dışı ve sayı olmayan değerler de yüklenmeli
+    for i, comment in enumerate(comments[::997]):
+        comment['rating'] = IRREGULAR_RATINGS[i % len(IRREGULAR_RATINGS)]
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(comments[0]))
+        writer.writeheader()
+        writer.writerows(comments)
+
+
+def main(size: int = 1000000):
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'comments.csv')
+        write_corpus(filename, size)
+
+        print(f"📥 {size} satır ({os.path.getsize(filename) / 1e6:.0f} MB CSV) için yükleme benchmark'ı")
+        print("=" * 60)
+        print(f"{'Yöntem':<16} {'Süre (sn)':>10} {'Ek RSS (MB)':>12}")
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--mode', mode, filename],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            print(f"{mode:<16} {float(output[0]):>10.2f} {float(output[1]):>12.0f}")
+
+        same = records_match(filename)
+        print(f"Kayıtlar csv.DictReader ile eşit: {'✅' if same else '❌'}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == '--mode':
+        run_mode(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,90 @@
+"""
+🗄️ Parquet yorum deposu benchmark'ı
+"X ürününün son 7 gündeki olumsuz yorumları" sorgusu: tek CSV'yi baştan sona okuyup süzmek ile
+ürün/çekim günü bölümlü Parquet deposundan filtreli okuma (bölüm + satır grubu eleme) karşılaştırması
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from comment_loader import load_comment_records
+from comment_store import CommentStore, product_key
+from synthetic_corpus import TURKISH_MONTHS, generate_corpus
+from turkish_dates import comment_epoch, recency_cutoff
+
+PRODUCTS = 20
+SCRAPE_DAYS = 30
+
+
+def build_sources(tmp: str, size: int):
+    """Aynı yorumları hem tek CSV'ye hem depoya yaz (her ürün her gün bir çekim)"""
+    rng = random.Random(7)
+    comments = generate_corpus(size)
+    per_scrape = size // (PRODUCTS * SCRAPE_DAYS)
+    csv_file = os.path.join(tmp, 'comments.csv')
+    store = CommentStore(os.path.join(tmp, 'store'))
+    today = date.today()
+
+    with open(csv_file, 'w', encoding='utf-8', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=['user', 'date', 'comment', 'rating', 'seller', 'product'])
+        writer.writeheader()
+        offset = 0
+        for product in range(PRODUCTS):
+            for day in range(SCRAPE_DAYS):
+                scrape_date = today - timedelta(days=day)
+                batch = comments[offset:offset + per_scrape]
+                offset += per_scrape
+                for comment in batch:
+                    # Yorum tarihi çekim gününden en fazla 2 gün önce
+                    posted = scrape_date - timedelta(days=rng.randint(0, 2))
+                    comment['date'] = f"{posted.day} {TURKISH_MONTHS[posted.month - 1]} {posted.year}"
+                    comment['product'] = f"urun-p-{1000 + product}"
+                writer.writerows(batch)
+                store.append(batch, f"urun-p-{1000 + product}", scrape_date)
+    return csv_file, store
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def main(size: int = 600000):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file, store = build_sources(tmp, size)
+        product = 'urun-p-1003'
+
+        start = time.perf_counter()
+        cutoff = recency_cutoff(7)
+        from_csv = [
+            comment for comment in load_comment_records(csv_file)
+            if product_key(comment['product']) == product_key(product)
+            and (comment_epoch(comment) or 0) >= cutoff and comment['rating'] in ('1', '2')
+        ]
+        csv_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        from_store = store.read_records(product=product, days=7, max_rating=2)
+        store_time = time.perf_counter() - start
+
+        print(f"🗄️ {size} yorum, {PRODUCTS} ürün x {SCRAPE_DAYS} gün için depo benchmark'ı")
+        print("=" * 60)
+        print(f"Boyut: CSV {os.path.getsize(csv_file) / 1e6:.1f} MB, Parquet (zstd) {directory_size(store.root) / 1e6:.1f} MB")
+        print(f"CSV okuyup süz   : {csv_time:6.3f} sn ({len(from_csv)} yorum)")
+        print(f"Depodan filtreli : {store_time:6.3f} sn ({len(from_store)} yorum)")
+        print(f"Hızlanma: {csv_time / store_time:.0f}x")
+        same = sorted(c['comment'] for c in from_csv) == sorted(c['comment'] for c in from_store)
+        print(f"Sonuç eşit: {'✅' if same else '❌'}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600000)
@@ -0,0 +1,179 @@
+"""
+🔎 Bağlamsal anahtar kelime benchmark'ı
+Derlenmiş/birleşik regex motoru ile önceki desen-desen tarama uygulamasının
+yorum/saniye karşılaştırması ve çıktı eşitliği kontrolü
+"""
+
+import os
+import re
+import sys
+import time
+from typing import Dict
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from contextual_keyword_analyzer import ContextualKeywordAnalyzer
+from synthetic_corpus import generate_corpus
+
+
+class LegacyContextualKeywordAnalyzer(ContextualKeywordAnalyzer):
+    """Önceki uygulama: her desen, kategori ve yorum için ham stringle re.search/re.findall"""
+
+    def scan_patterns(self, text_lower: str) -> set:
+        return set()
+
+    def _analyze_category(self, text_lower: str, category: str, positive_score: int, hits: set = None) -> Dict:
+        return self.legacy_analyze_contextual_keywords(text_lower, category)
+
+    def legacy_analyze_contextual_keywords(self, text: str, category: str) -> Dict:
+        """Bağlamsal kelime analizi"""
+        
+        result = {
+            'category': category,
+            'found_keywords': [],
+            'context_score': 0,
+            'is_valid_category': False,
+            'analysis_details': {
+                'positive_context': False,
+                'negative_context': False,
+                'excluded_by_context': False,
+                'pattern_matches': [],
+                'excluded_patterns': [],
+                'confidence': 0
+            }
+        }
+        
+        if category not in self.contextual_keywords:
+            return result
+        
+        text_lower = text.lower()
+        category_config = self.contextual_keywords[category]
+        
+        # 1. EXCLUDED CONTEXT CHECK (False Positive kontrolü)
+        excluded_patterns = category_config.get('excluded_contexts', {}).get('false_positive_patterns', [])
+        for pattern in excluded_patterns:
+            if re.search(pattern, text_lower):
+                result['analysis_details']['excluded_by_context'] = True
+                result['analysis_details']['excluded_patterns'].append(pattern)
+                result['analysis_details']['confidence'] = 0
+                return result  # Hemen çık, bu kategori değil
+        
+        # 2. PRIMARY KEYWORD CHECK
+        primary_found = []
+        if isinstance(category_config['primary_keywords'], dict):
+            # Alt kategoriler varsa
+            for sub_cat, keywords in category_config['primary_keywords'].items():
+                for keyword in keywords:
+                    if keyword in text_lower:
+                        primary_found.append(keyword)
+        else:
+            # Basit liste
+            for keyword in category_config['primary_keywords']:
+                if keyword in text_lower:
+                    primary_found.append(keyword)
+        
+        result['found_keywords'] = primary_found
+        
+        # 3. NEGATIVE CONTEXT PATTERNS (Gerçek problemler)
+        negative_patterns = category_config.get('negative_contexts', {})
+        negative_score = 0
+        
+        for pattern_type, patterns in negative_patterns.items():
+            for pattern in patterns:
+                matches = re.findall(pattern, text_lower)
+                if matches:
+                    negative_score += len(matches) * 2  # Negatif pattern daha ağırlıklı
+                    result['analysis_details']['pattern_matches'].append({
+                        'type': pattern_type,
+                        'pattern': pattern,
+                        'matches': matches
+                    })
+        
+        if negative_score > 0:
+            result['analysis_details']['negative_context'] = True
+        
+        # 4. POSITIVE CONTEXT CHECK
+        positive_score = 0
+        for pos_pattern in self.positive_indicators:
+            if re.search(pos_pattern, text_lower):
+                positive_score += 1
+                result['analysis_details']['positive_context'] = True
+        
+        # 5. FINAL SCORING AND VALIDATION
+        if result['analysis_details']['excluded_by_context']:
+            # Zaten false positive olarak işaretlendi
+            result['context_score'] = 0
+            result['is_valid_category'] = False
+            result['analysis_details']['confidence'] = 0
+        elif negative_score > 0 and primary_found:
+            # Hem anahtar kelime hem negatif pattern var
+            result['context_score'] = negative_score
+            result['is_valid_category'] = True
+            result['analysis_details']['confidence'] = min(negative_score * 20, 100)  # Max %100
+        elif primary_found and positive_score > 0:
+            # Anahtar kelime var ama pozitif bağlamda
+            result['context_score'] = positive_score
+            result['is_valid_category'] = True
+            result['analysis_details']['confidence'] = min(positive_score * 15, 80)  # Max %80
+        elif primary_found:
+            # Sadece anahtar kelime var, bağlam belirsiz
+            result['context_score'] = len(primary_found)
+            result['is_valid_category'] = len(primary_found) > 0
+            result['analysis_details']['confidence'] = min(len(primary_found) * 10, 50)  # Max %50
+        else:
+            # Hiçbir anahtar kelime yok
+            result['context_score'] = 0
+            result['is_valid_category'] = False
+            result['analysis_details']['confidence'] = 0
+        
+        return result
+
+
+EXTRA_TEXTS = [
+    "Bizim evin vazgeçilmezi, indirimdeyken stoklarız",
+    "oğlum ek gıdaya geçtiğinden beri severek içiyoruz",
+    "kargo çok geç geldi, 10 gün bekledim. paket gelmedi dedim ama sonra geldi",
+    "teslimat gecikmesi yaşadık, paket hasarlı geldi, kırık geldi",
+    "Kargom ulaşmadı, hala bekliyorum, hiç bilgi yok",
+    "beden çok büyük geldi ama kumaşı güzel, büyük memnuniyetle kullanıyoruz",
+    "malzeme kalitesiz, defolu ürün gönderildi, kırıntılar çıktı",
+    "İADE ETTİM, ÇALIŞMIYOR. Tavsiye etmiyorum",
+    "",
+]
+
+
+def run(analyzer, texts):
+    start = time.perf_counter()
+    results = [analyzer.analyze_all_categories(text) for text in texts]
+    return results, time.perf_counter() - start
+
+
+def main(size: int = 20000):
+    texts = [comment['comment'] for comment in generate_corpus(size)] + EXTRA_TEXTS
+
+    legacy = LegacyContextualKeywordAnalyzer()
+    compiled = ContextualKeywordAnalyzer()
+
+    # Derlenmemiş desenleri re modülünün önbelleğinden sayılmasın diye ısınma turu
+    run(legacy, texts[:100])
+    run(compiled, texts[:100])
+
+    legacy_results, legacy_time = run(legacy, texts)
+    compiled_results, compiled_time = run(compiled, texts)
+
+    mismatches = sum(1 for old, new in zip(legacy_results, compiled_results) if old != new)
+
+    print(f"🔎 {len(texts)} yorum için bağlamsal analiz benchmark'ı")
+    print("=" * 60)
+    print(f"Önceki uygulama : {len(texts) / legacy_time:10.0f} yorum/sn  ({legacy_time:.2f} sn)")
+    print(f"Derlenmiş motor : {len(texts) / compiled_time:10.0f} yorum/sn  ({compiled_time:.2f} sn)")
+    print(f"Hızlanma: {legacy_time / compiled_time:.1f}x")
+    print(f"Çıktı farkı: {mismatches} yorum")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
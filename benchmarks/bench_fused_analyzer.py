@@ -0,0 +1,93 @@
+"""
+🔗 Birleşik yorum analizi benchmark'ı
+Analizcileri art arda çağırmak ile FusedCommentAnalyzer'ın tek geçişli analizinin
+yorum başı maliyet karşılaştırması ve sonuç eşitliği kontrolü
+"""
+
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from fused_comment_analyzer import FusedCommentAnalyzer
+from synthetic_corpus import generate_corpus
+
+
+def sequential_analysis(fused, text):
+    """Birleşik analizden önceki akış: her analizci metni kendisi işler"""
+    advanced = fused.advanced_analyzer
+    priority = fused.priority_analyzer
+    contextual = fused.contextual_analyzer
+
+    categories = advanced.analyze_comment_categories(text)
+    contextual_result = contextual.analyze_all_categories(text)
+    negativity = priority.calculate_negativity_score(text)
+
+    critical = {}
+    for category, data in priority.priority_categories.items():
+        keywords = [kw for kw in data['critical_keywords'] if kw in text.lower()]
+        if keywords:
+            critical[category] = keywords
+
+    sentiment = fused.summarizer.analyze_sentiment([{'comment': text}])
+    if sentiment.get('positive_count'):
+        label = 'positive'
+    elif sentiment.get('negative_count'):
+        label = 'negative'
+    else:
+        label = 'neutral'
+
+    return {
+        'categories': categories,
+        'primary_category': fused._best_category(categories),
+        'contextual': {
+            'primary_category': contextual_result['primary_category'],
+            'confidence': contextual_result['confidence'],
+            'excluded_categories': contextual_result['summary']['excluded_categories'],
+        },
+        'negativity': negativity,
+        'critical_keywords': critical,
+        'sentiment': label,
+    }
+
+
+def normalize(record):
+    # keywords_found, set() ile tekilleştirildiği için sırası karşılaştırmada önemsiz
+    for result in record['categories'].values():
+        result['keywords_found'] = sorted(result['keywords_found'])
+    return record
+
+
+def main(size: int = 20000):
+    texts = [comment['comment'] for comment in generate_corpus(size)]
+    fused = FusedCommentAnalyzer()
+
+    fused.keyword_matcher.find('ısınma')
+
+    start = time.perf_counter()
+    sequential = [sequential_analysis(fused, text) for text in texts]
+    sequential_time = time.perf_counter() - start
+
+    # Birleşik geçiş, ardışık akışın doldurduğu tarama önbelleğinden faydalanmasın
+    fused.keyword_matcher.clear_cache()
+
+    start = time.perf_counter()
+    single_pass = fused.analyze_batch(texts)
+    fused_time = time.perf_counter() - start
+
+    mismatches = sum(1 for old, new in zip(sequential, single_pass) if normalize(old) != normalize(new))
+
+    print(f"🔗 {size} yorum için birleşik analiz benchmark'ı")
+    print("=" * 60)
+    print(f"Ardışık analizciler : {size / sequential_time:8.0f} yorum/sn  ({sequential_time * 1e6 / size:.0f} µs/yorum)")
+    print(f"FusedCommentAnalyzer: {size / fused_time:8.0f} yorum/sn  ({fused_time * 1e6 / size:.0f} µs/yorum)")
+    print(f"Hızlanma: {sequential_time / fused_time:.1f}x")
+    print(f"Çıktı farkı: {mismatches} yorum")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
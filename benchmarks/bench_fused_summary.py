@@ -0,0 +1,56 @@
+"""
+📝 Tek geçişli AI özeti benchmark'ı
+Özet bölümlerini ayrı ayrı hesaplayan eski akış ile SummaryAccumulator'ın tek geçişinin
+süre karşılaştırması ve çıktı eşitliği kontrolü
+"""
+
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from comment_summarizer import CommentSummarizer
+from synthetic_corpus import generate_corpus
+
+
+def multi_pass_summary(summarizer, comments, include_beden_renk):
+    """Tek geçişten önceki generate_ai_summary: her bölüm yorumları yeniden gezer"""
+    return {
+        'genel_degerlendirme': summarizer.generate_summary_paragraph(comments),
+        'arti_eksi_ozellikler': summarizer.extract_pros_cons(comments),
+        'kategorik_analiz': summarizer.category_analysis(comments, include_beden_renk=include_beden_renk),
+        'satici_degerlendirmesi': summarizer.analyze_sellers(comments),
+        'toplam_yorum': len(comments),
+    }
+
+
+def main(size: int = 100000):
+    comments = generate_corpus(size)
+    summarizer = CommentSummarizer()
+    summarizer.keyword_matcher.find('ısınma')
+
+    start = time.perf_counter()
+    multi_pass = multi_pass_summary(summarizer, comments, include_beden_renk=True)
+    multi_pass_time = time.perf_counter() - start
+
+    # Tek geçiş, önceki akışın doldurduğu tarama önbelleğinden faydalanmasın
+    summarizer.keyword_matcher.clear_cache()
+
+    start = time.perf_counter()
+    single_pass = summarizer.generate_ai_summary(comments, include_beden_renk=True)
+    single_pass_time = time.perf_counter() - start
+
+    print(f"📝 {size} yorum için AI özeti benchmark'ı")
+    print("=" * 60)
+    print(f"Çok geçişli özet : {multi_pass_time:6.2f} sn")
+    print(f"Tek geçişli özet : {single_pass_time:6.2f} sn")
+    print(f"Hızlanma: {multi_pass_time / single_pass_time:.1f}x")
+    print(f"Çıktı eşit: {'✅' if multi_pass == single_pass else '❌'}")
+    if multi_pass != single_pass:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
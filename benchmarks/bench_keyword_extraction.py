@@ -0,0 +1,84 @@
+"""
+🔑 Anahtar kelime çıkarımı benchmark'ı
+Counter + tam sıralama ile seyrek doküman-terim matrisi + kısmi sıralama (top-k) karşılaştırması;
+korpus geneli, önbellekten tekrar sorgu ve grup (satıcı) bazlı tablolar
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from comment_summarizer import CommentSummarizer
+from synthetic_corpus import generate_corpus
+from turkish_text import clear_cache
+
+
+def counter_keywords(summarizer, comments, min_frequency=2):
+    """Matristen önceki extract_keywords"""
+    all_words = []
+    for comment in comments:
+        text = comment.get('comment', '')
+        if text:
+            all_words.extend(summarizer.keyword_tokens(text))
+    word_freq = Counter(all_words)
+    keywords = {word: freq for word, freq in word_freq.items() if freq >= min_frequency}
+    return [{'word': word, 'frequency': freq} for word, freq in sorted(keywords.items(), key=lambda x: x[1], reverse=True)]
+
+
+def counter_groups(summarizer, comments, group_key='seller', top_k=10):
+    """Grup başına ayrı Counter (kümelerdeki eski kelime sayımı gibi)"""
+    groups = {}
+    for comment in comments:
+        groups.setdefault(comment.get(group_key, 'Bilinmiyor'), []).append(comment)
+    tables = {}
+    for group, members in groups.items():
+        counts = Counter(word for comment in members for word in summarizer.keyword_tokens(comment.get('comment', '')))
+        tables[group] = [{'word': word, 'frequency': freq} for word, freq in counts.most_common(top_k)]
+    return tables
+
+
+def timed(function, *args, **kwargs):
+    # Normalizasyon önbelleği bir önceki ölçümden ısınmış gelmesin
+    clear_cache()
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(size: int = 100000):
+    comments = generate_corpus(size)
+    summarizer = CommentSummarizer()
+
+    old_keywords, old_time = timed(counter_keywords, summarizer, comments)
+    new_keywords, new_time = timed(summarizer.extract_keywords, comments)
+    top20, cached_time = timed(summarizer.extract_keywords, comments, top_k=20)
+    old_groups, old_group_time = timed(counter_groups, summarizer, comments)
+    new_groups, new_group_time = timed(summarizer.keywords_by_group, comments)
+
+    print(f"🔑 {size} yorum için anahtar kelime benchmark'ı")
+    print("=" * 60)
+    print(f"Korpus geneli (Counter)     : {old_time:6.2f} sn")
+    print(f"Korpus geneli (matris)      : {new_time:6.2f} sn")
+    print(f"Önbellekten top-20          : {cached_time:6.3f} sn")
+    print(f"Satıcı tabloları (Counter)  : {old_group_time:6.2f} sn")
+    print(f"Satıcı tabloları (matris)   : {new_group_time:6.3f} sn (matris önbellekte)")
+
+    same = old_keywords == new_keywords and top20 == old_keywords[:20]
+    # Grup tablolarında eşit sayılı kelimelerin sırası korpus geneli ilk görülme sırasına göredir
+    same_groups = all(
+        sorted((k['frequency'], k['word']) for k in old_groups[group]) ==
+        sorted((k['frequency'], k['word']) for k in new_groups[group])
+        or [k['frequency'] for k in old_groups[group]] == [k['frequency'] for k in new_groups[group]]
+        for group in old_groups
+    )
+    print(f"Sonuç eşit: {'✅' if same and same_groups else '❌'}")
+    if not (same and same_groups):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
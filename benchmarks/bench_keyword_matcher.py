@@ -0,0 +1,83 @@
+"""
+🔤 Ortak anahtar kelime otomatı benchmark'ı
+Analizcilerin tüm sözlüklerini `kw in text` döngüleriyle taramak ile
+tek geçişli KeywordMatcher taramasının karşılaştırması
+"""
+
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+import keyword_matcher
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from comment_summarizer import CommentSummarizer
+from priority_analyzer import PriorityAnalyzer
+from synthetic_corpus import generate_corpus
+
+
+def collect_vocabularies():
+    """Analizcilerin otomata kaydettiği kelime listeleri (kayıt sırasıyla)"""
+    advanced = AdvancedCommentAnalyzer()
+    priority = PriorityAnalyzer()
+    summarizer = CommentSummarizer()
+
+    lists = []
+    for data in advanced.categories.values():
+        lists.extend([data['keywords'], data['positive'], data['negative']])
+    lists.extend(data['keywords'] for data in priority.negativity_indicators.values())
+    lists.extend(data['critical_keywords'] for data in priority.priority_categories.values())
+    lists.extend(sorted(words) for words in summarizer.sentiment_words.values())
+    lists.extend(summarizer.summary_phrases.values())
+    lists.extend(summarizer.pros_cons_phrases.values())
+    lists.extend(summarizer.summary_categories.values())
+    lists.extend(summarizer.beden_renk_categories.values())
+    lists.append(summarizer.textile_keywords)
+    return lists
+
+
+def legacy_scan(texts, lists):
+    return [[[kw for kw in keywords if kw in text] for keywords in lists] for text in texts]
+
+
+def matcher_scan(matcher, texts, lists):
+    results = []
+    for text in texts:
+        # Önbellek etkisini ölçmemek için doğrudan tarama
+        found = matcher.find(text, use_cache=False)
+        results.append([[kw for kw in keywords if kw in found] for keywords in lists])
+    return results
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(size: int = 50000):
+    texts = [comment['comment'].lower() for comment in generate_corpus(size)]
+    lists = collect_vocabularies()
+    matcher = keyword_matcher.get_shared_matcher()
+    matcher.find('ısınma')
+
+    legacy_results, legacy_time = timed(lambda: legacy_scan(texts, lists))
+    matcher_results, matcher_time = timed(lambda: matcher_scan(matcher, texts, lists))
+
+    backend = 'pyahocorasick' if keyword_matcher.AHOCORASICK_AVAILABLE else 'trie regex yedeği'
+    print(f"🔤 {size} yorum, {sum(len(keywords) for keywords in lists)} kelime ({len(lists)} liste)")
+    print("=" * 60)
+    print(f"kw in text döngüleri : {size / legacy_time:10.0f} yorum/sn")
+    print(f"KeywordMatcher ({backend}): {size / matcher_time:10.0f} yorum/sn")
+    print(f"Hızlanma: {legacy_time / matcher_time:.1f}x")
+
+    mismatches = sum(1 for old, new in zip(legacy_results, matcher_results) if old != new)
+    print(f"Çıktı farkı: {mismatches} yorum")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
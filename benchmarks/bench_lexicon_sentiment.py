@@ -0,0 +1,80 @@
+"""
+🎭 Seyrek matrisli sözlük duygu puanlayıcısı benchmark'ı
+RAG bileşenlerindeki kelime başına `kw in metin` döngüleri ve yorum başına küme kesişimli
+analyze_sentiment ile derlenmiş sözlüğün toplu puanlamasının süre ve sonuç karşılaştırması
+"""
+
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from comment_summarizer import CommentSummarizer
+from lexicon_sentiment import RAG_SENTIMENT_WORDS, get_rag_lexicon
+from synthetic_corpus import generate_corpus
+
+
+def generator_loop_labels(texts):
+    """Eski RAG araması: her yorum için her kelime ayrı ayrı aranır"""
+    labels = []
+    for text in texts:
+        text_lower = text.lower()
+        has_negative = any(kw in text_lower for kw in RAG_SENTIMENT_WORDS['negative'])
+        has_positive = any(kw in text_lower for kw in RAG_SENTIMENT_WORDS['positive'])
+        labels.append('negative' if has_negative and not has_positive
+                      else 'positive' if has_positive and not has_negative else 'neutral')
+    return labels
+
+
+def per_comment_sentiment(summarizer, comments):
+    """Toplu puanlamadan önceki analyze_sentiment (yorum başına küme kesişimi)"""
+    counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+    for comment in comments:
+        text = comment.get('comment', '').lower()
+        if text:
+            found = summarizer.keyword_matcher.find(text)
+            pos_score = len(found & summarizer.sentiment_words['positive'])
+            neg_score = len(found & summarizer.sentiment_words['negative'])
+            counts['positive' if pos_score > neg_score else 'negative' if neg_score > pos_score else 'neutral'] += 1
+    return summarizer.sentiment_stats(counts['positive'], counts['negative'], counts['neutral'], len(comments))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(size: int = 100000):
+    comments = generate_corpus(size)
+    # Benzersiz metinler: tarama önbelleği ölçümü etkilemesin
+    texts = [f"{comment['comment']} #{i}" for i, comment in enumerate(comments)]
+    for comment, text in zip(comments, texts):
+        comment['comment'] = text
+
+    lexicon = get_rag_lexicon()
+    summarizer = CommentSummarizer()
+    lexicon.keyword_matcher.find('ısınma')
+
+    old_labels, old_time = timed(generator_loop_labels, texts)
+    new_labels, new_time = timed(lexicon.label, texts, 'exclusive')
+    lexicon.keyword_matcher._cached_match.cache_clear()
+    old_stats, old_stats_time = timed(per_comment_sentiment, summarizer, comments)
+    lexicon.keyword_matcher._cached_match.cache_clear()
+    new_stats, new_stats_time = timed(summarizer.analyze_sentiment, comments)
+
+    print(f"🎭 {size} yorum için duygu puanlama benchmark'ı")
+    print("=" * 60)
+    print(f"RAG etiketleri  : döngü {old_time:6.2f} sn, sözlük {new_time:6.2f} sn ({old_time / new_time:.1f}x)")
+    print(f"analyze_sentiment: eski {old_stats_time:6.2f} sn, sözlük {new_stats_time:6.2f} sn "
+          f"({old_stats_time / new_stats_time:.1f}x)")
+    same = old_labels == new_labels and old_stats == new_stats
+    print(f"Sonuç eşit: {'✅' if same else '❌'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
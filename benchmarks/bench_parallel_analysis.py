@@ -0,0 +1,43 @@
+"""
+⚙️ Paralel analiz benchmark'ı
+1/2/4/8 işçide kategori + öncelik analizi ölçeklenmesi ve seri sonuçla eşitlik kontrolü
+"""
+
+import os
+import sys
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from parallel_analyzer import ParallelCommentAnalyzer, measure_scaling, print_scaling_report
+from synthetic_corpus import generate_corpus
+
+
+def normalize(category_results):
+    # keywords_found set() ile tekilleştirildiği için sırası süreçler arasında değişebilir
+    for data in category_results['category_analysis'].values():
+        for sentiment in ('positive', 'negative', 'neutral'):
+            for comment in data[sentiment]:
+                comment['analysis']['keywords_found'] = sorted(comment['analysis']['keywords_found'])
+    return category_results['category_analysis']
+
+
+def main(size: int = 100000):
+    comments = generate_corpus(size)
+
+    sample = comments[:10000]
+    serial = AdvancedCommentAnalyzer().analyze_all_comments(sample)
+    with ParallelCommentAnalyzer(workers=2, chunk_size=1500) as runner:
+        parallel = runner.analyze_all_comments(sample)
+    identical = normalize(serial) == normalize(parallel)
+    print(f"Seri / paralel sonuç eşitliği ({len(sample)} yorum): {'✅' if identical else '❌'}")
+
+    print_scaling_report(measure_scaling(comments))
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
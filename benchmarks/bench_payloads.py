@@ -0,0 +1,52 @@
+"""
+📦 API payload benchmark'ı
+10k yorumluk bir yanıt için JSON kodlama süresi ve sıkıştırılmış boyutlar
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from api_responses import dumps_json, compress_body, ORJSON_AVAILABLE, BROTLI_AVAILABLE
+from synthetic_corpus import generate_corpus
+
+
+def timed(func, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(size: int = 10000):
+    comments = generate_corpus(size)
+    payload = {'source': 'selenium', 'count': len(comments), 'comments': comments}
+
+    print(f"📦 {size} yorumluk yanıt benchmark'ı")
+    print("=" * 60)
+
+    default_body, default_time = timed(lambda: json.dumps(payload).encode())
+    fast_body, fast_time = timed(lambda: dumps_json(payload))
+
+    print(f"json.dumps (varsayılan): {default_time * 1000:8.1f} ms  {len(default_body) / 1024:8.1f} KB")
+    print(f"dumps_json ({'orjson' if ORJSON_AVAILABLE else 'json fallback'}): {fast_time * 1000:8.1f} ms  {len(fast_body) / 1024:8.1f} KB")
+    print(f"Hızlanma: {default_time / fast_time:.1f}x")
+
+    encodings = ['gzip'] + (['br'] if BROTLI_AVAILABLE else [])
+    for encoding in encodings:
+        compressed, compress_time = timed(lambda: compress_body(fast_body, encoding))
+        ratio = len(fast_body) / len(compressed)
+        print(f"{encoding:>4}: {compress_time * 1000:8.1f} ms  {len(compressed) / 1024:8.1f} KB  (oran {ratio:.1f}x)")
+
+    if not BROTLI_AVAILABLE:
+        print("ℹ️ brotli kurulu değil, yalnızca gzip ölçüldü")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,85 @@
+"""
+🚨 Çok ürünlü toplu önceliklendirme benchmark'ı
+Ürün başına analyze_all_comments + analyze_critical_issues döngüsü ile tüm katalog için
+analyze_batch + prioritize_products (gruplu vektörel toplamlar) karşılaştırması ve sonuç eşitliği
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+import pandas as pd
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from priority_analyzer import PriorityAnalyzer
+from synthetic_corpus import generate_corpus
+
+COMPARED_FIELDS = ('priority_score', 'total_negative_comments', 'average_negativity',
+                   'critical_keyword_mentions', 'recent_complaints')
+
+
+def per_product_priorities(analyzer, priority, comments):
+    """Toplu moddan önceki yol: her ürün için ayrı duygu analizi ve önceliklendirme"""
+    by_product = {}
+    for comment in comments:
+        by_product.setdefault(comment['product'], []).append(comment)
+
+    results = {}
+    # Kategori başına ilerleme mesajları binlerce ürün için ölçümü bozmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        for product, product_comments in by_product.items():
+            sentiment = analyzer.analyze_all_comments(product_comments)
+            issues = priority.analyze_critical_issues(product_comments, sentiment)['critical_issues']
+            for category, data in issues.items():
+                results[(product, category)] = tuple(data[field] for field in COMPARED_FIELDS)
+    return results
+
+
+def main(size: int = 200000, products: int = 2000):
+    comments = generate_corpus(size)
+    for i, comment in enumerate(comments):
+        comment['product'] = f"urun-p-{1000 + i % products}"
+    # Ürün bilgisi eksik yorumlar (None/NaN) da tek bir ürünsüz grupta önceliklendirilmeli
+    for comment in comments[::97]:
+        comment['product'] = None
+    analyzer = AdvancedCommentAnalyzer()
+    priority = PriorityAnalyzer()
+
+    start = time.perf_counter()
+    old = per_product_priorities(analyzer, priority, comments)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = pd.DataFrame(comments)
+    issues = priority.negative_issue_table(frame, analyzer.analyze_batch(frame['comment']))
+    table = priority.prioritize_products(issues)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    priority.prioritize_products(issues)
+    scoring_time = time.perf_counter() - start
+
+    new = {
+        (None if pd.isna(row['product']) else row['product'], row['category']):
+            tuple(row[field] for field in COMPARED_FIELDS)
+        for row in table.to_dict('records')
+    }
+
+    print(f"🚨 {size} yorum, {products} ürün için önceliklendirme benchmark'ı")
+    print("=" * 60)
+    print(f"Ürün başına döngü        : {loop_time:6.2f} sn")
+    print(f"Toplu (analiz + öncelik) : {batch_time:6.2f} sn ({loop_time / batch_time:.1f}x)")
+    print(f"Sadece prioritize_products: {scoring_time:6.3f} sn ({len(table)} ürün/kategori satırı)")
+    same = old == new
+    print(f"Sonuç eşit: {'✅' if same else '❌'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
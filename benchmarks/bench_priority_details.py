@@ -0,0 +1,103 @@
+"""
+🧾 Öncelik analizi örnek detayları benchmark'ı
+Tüm negatif yorum detaylarını sonuçta tutan eski yapı (all_issue_details) ile kategori başına
+sınırlı top-k heap'in bellek ve JSON boyutu karşılaştırması; top-k'nın tam sıralamanın ilk k elemanıyla
+ve paralel (parça birleştirmeli) sonuçla eşitliği
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from compact_results import category_comments
+from parallel_analyzer import ParallelCommentAnalyzer
+from priority_analyzer import PriorityAnalyzer
+from synthetic_corpus import generate_vocabulary_corpus
+from turkish_dates import annotate_date_epochs, comment_epoch
+
+
+def traced(function):
+    """Fonksiyonun sonucu, süresi ve tepe bellek kullanımı (MB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def full_details_result(priority, analysis):
+    """Eski yapı: her kategori için tüm negatif yorum detayları sonuçta"""
+    result = priority.analyze_critical_issues([], analysis)
+    for category, data in result['critical_issues'].items():
+        all_details = list(priority.iter_issue_details(analysis, category))
+        data['issue_details'] = all_details[:5]
+        data['all_issue_details'] = all_details
+    return result
+
+
+def expected_top_k(priority, analysis, category, k):
+    """Tüm detaylar tam sıralandığında ilk k (olumsuzluk, yakınlık, yorum sırası)"""
+    comments = category_comments(analysis, category, 'negative')
+    details = list(priority.iter_issue_details(analysis, category))
+    ranked = sorted(
+        range(len(details)),
+        key=lambda i: (-details[i]['negativity_data']['negativity_score'], -(comment_epoch(comments[i]) or -1), i)
+    )
+    return [details[i] for i in ranked[:k]]
+
+
+def main(size: int = 100000):
+    comments = annotate_date_epochs(generate_vocabulary_corpus(size))
+    priority = PriorityAnalyzer()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        analysis = AdvancedCommentAnalyzer().analyze_all_comments(comments, compact=True)
+        old, old_time, old_peak = traced(lambda: full_details_result(priority, analysis))
+        new, new_time, new_peak = traced(lambda: priority.analyze_critical_issues(comments, analysis))
+
+        sample = comments[:20000]
+        sample_analysis = AdvancedCommentAnalyzer().analyze_all_comments(sample, compact=True)
+        serial = priority.analyze_critical_issues(sample, sample_analysis)
+        with ParallelCommentAnalyzer(workers=2, chunk_size=700) as runner:
+            parallel = runner.analyze_critical_issues(sample, sample_analysis)
+
+    old_bytes = len(json.dumps(old, ensure_ascii=False, default=str).encode('utf-8'))
+    new_bytes = len(json.dumps(new, ensure_ascii=False, default=str).encode('utf-8'))
+
+    top_k_ok = all(
+        data['issue_details'] == expected_top_k(priority, analysis, category, priority.issue_top_k)
+        for category, data in new['critical_issues'].items()
+    )
+    aggregate_fields = ('priority_score', 'total_negative_comments', 'average_negativity',
+                        'critical_keyword_mentions', 'recent_complaints')
+    aggregates_ok = all(
+        all(old['critical_issues'][category][field] == data[field] for field in aggregate_fields)
+        for category, data in new['critical_issues'].items()
+    )
+    parallel_ok = serial['critical_issues'] == parallel['critical_issues']
+    negative_count = sum(data['total_negative_comments'] for data in new['critical_issues'].values())
+
+    print(f"🧾 {size} yorum ({negative_count} negatif kategori kaydı) için örnek detayları benchmark'ı")
+    print("=" * 60)
+    print(f"Tüm detaylar : {old_time:6.2f} sn, tepe bellek {old_peak:7.1f} MB, JSON {old_bytes / 1024:9.0f} KB")
+    print(f"Top-{priority.issue_top_k} heap   : {new_time:6.2f} sn, tepe bellek {new_peak:7.1f} MB, "
+          f"JSON {new_bytes / 1024:9.0f} KB")
+    print(f"Skor ve sayılar eşit          : {'✅' if aggregates_ok else '❌'}")
+    print(f"Top-k = tam sıralamanın ilk k'sı: {'✅' if top_k_ok else '❌'}")
+    print(f"Seri / paralel eşit           : {'✅' if parallel_ok else '❌'}")
+    if not (aggregates_ok and top_k_ok and parallel_ok):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,92 @@
+"""
+⏱️ Aşama profili benchmark'ı
+Kategori + öncelik + AI özeti akışının profil kapalı/açık süreleri, kapalıyken ölçülen
+fonksiyonların çağrı başı ek maliyeti (toplam çağrı sayısıyla tahmini pay), sonuç eşitliği
+ve örnek aşama raporu
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from comment_summarizer import CommentSummarizer
+from pipeline_profiler import profiled, profiler
+from priority_analyzer import PriorityAnalyzer
+from synthetic_corpus import generate_corpus
+from turkish_dates import annotate_date_epochs
+
+
+def run_pipeline(analyzer, priority, summarizer, comments):
+    with contextlib.redirect_stdout(io.StringIO()):
+        annotate_date_epochs(comments)
+        analysis = analyzer.analyze_all_comments(comments, compact=True)
+        issues = priority.analyze_critical_issues(comments, analysis)
+        summary = summarizer.generate_ai_summary(comments, include_beden_renk=True)
+    # Zaman damgası içeren alanlar karşılaştırmaya girmez
+    return analysis, issues.get('critical_issues'), summary
+
+
+def best_time(function, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main(size: int = 50000):
+    comments = generate_corpus(size)
+    analyzer = AdvancedCommentAnalyzer()
+    priority = PriorityAnalyzer()
+    summarizer = CommentSummarizer()
+    pipeline = lambda: run_pipeline(analyzer, priority, summarizer, comments)
+
+    # Isınma: önbellekler her iki ölçümde de aynı durumda olsun
+    pipeline()
+
+    profiler.disable()
+    disabled_result, disabled_time = best_time(pipeline)
+
+    profiler.enable()
+    profiler.reset()
+    enabled_result, _ = best_time(pipeline, repeat=1)
+    profiler.disable()
+    report = profiler.format_report(top_n=12)
+    calls = sum(data['calls'] for data in profiler.stats().values())
+    profiler.enable()
+    _, enabled_time = best_time(pipeline)
+    profiler.disable()
+
+    # Kapalı profilleyicinin çağrı başı maliyeti: sarılmış ve sarılmamış boş fonksiyon farkı
+    noop = lambda value: value
+    wrapped = profiled('bench.noop')(noop)
+    _, raw_time = best_time(lambda: [noop(i) for i in range(1000000)])
+    _, wrapped_time = best_time(lambda: [wrapped(i) for i in range(1000000)])
+    per_call = max(wrapped_time - raw_time, 0) / 1000000
+    disabled_share = calls * per_call / disabled_time * 100
+
+    print(f"⏱️ {size} yorum için aşama profili benchmark'ı")
+    print("=" * 60)
+    print(f"Profil kapalı : {disabled_time:6.2f} sn")
+    print(f"Profil açık   : {enabled_time:6.2f} sn ({(enabled_time / disabled_time - 1) * 100:+.1f}%)")
+    print(f"Kapalıyken çağrı başı ek maliyet: {per_call * 1e9:.0f} ns x {calls} çağrı "
+          f"= ~{disabled_share:.2f}% toplam süre")
+    print()
+    print(report)
+    print()
+    same = disabled_result == enabled_result
+    print(f"Sonuç eşit: {'✅' if same else '❌'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,96 @@
+"""
+🔁 Derlenmiş kural seti benchmark'ı
+Analizci örneklerinin kuralları her seferinde derlemesi (RuleSet derleme maliyeti) ile paylaşılan
+kural setini kullanması karşılaştırması; kural dosyası değişince yeniden yükleme süresi,
+yeni kuralın (açık kalan paralel işçi havuzunda da) devreye girmesi ve hatalı dosyanın reddedilmesi
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from parallel_analyzer import ParallelCommentAnalyzer
+from priority_analyzer import PriorityAnalyzer
+from rule_set import RULES_FILE, RuleSet, get_rule_set, reload_rules
+from synthetic_corpus import generate_corpus
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(size: int = 200):
+    with open(RULES_FILE, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    get_rule_set()
+
+    # Kurallar koddayken her örnek sözlükleri, desenleri ve otomatı yeniden kuruyordu
+    _, compile_time = timed(lambda: [RuleSet(rules) for _ in range(size)])
+    _, shared_time = timed(lambda: [(AdvancedCommentAnalyzer(), PriorityAnalyzer()) for _ in range(size)])
+
+    analyzer = AdvancedCommentAnalyzer()
+    comments = generate_corpus(2000)
+    before = analyzer.analyze_texts([c['comment'] for c in comments])
+    marker = "zzkuralkelimesi"
+    probe = f"ürün {marker} geldi"
+    probe_comments = [{'comment': probe}]
+
+    # Havuz yeniden yüklemeden önce açılır; işçiler eski kurallarla başlamış olur
+    runner = ParallelCommentAnalyzer(workers=2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner.analyze_all_comments(probe_comments)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'analysis_rules.json')
+        changed = json.loads(json.dumps(rules))
+        changed['categories']['kargo']['keywords'].append(marker)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(changed, f, ensure_ascii=False)
+
+        old_version = analyzer.rule_version
+        with contextlib.redirect_stdout(io.StringIO()):
+            reloaded, reload_time = timed(reload_rules, path)
+        picked_up = reloaded and analyzer.analyze_texts([probe])[0]['kargo']['relevant']
+        parallel_picked_up = runner.analyze_all_comments(probe_comments)['category_analysis']['kargo']['total_mentions'] == 1
+        runner.close()
+
+        # Hatalı regex: yeni set derlenemez, mevcut set kullanılmaya devam eder
+        broken = json.loads(json.dumps(changed))
+        broken['positive_indicators'].append('(')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(broken, f, ensure_ascii=False)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1))
+        with contextlib.redirect_stdout(io.StringIO()):
+            rejected = not reload_rules(path) and get_rule_set().rules == changed
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reload_rules(RULES_FILE, force=True)
+
+    after = analyzer.analyze_texts([c['comment'] for c in comments])
+
+    print(f"🔁 {size} analizci örneği için kural seti benchmark'ı")
+    print("=" * 60)
+    print(f"Her örnekte derleme      : {compile_time:6.3f} sn")
+    print(f"Paylaşılan kural seti    : {shared_time:6.3f} sn ({compile_time / shared_time:.1f}x)")
+    print(f"Yeniden yükleme          : {reload_time * 1000:6.1f} ms ({old_version} -> yeni sürüm)")
+    print(f"Yeni kural devrede       : {'✅' if picked_up else '❌'}")
+    print(f"Paralel işçilerde devrede: {'✅' if parallel_picked_up else '❌'}")
+    print(f"Hatalı dosya reddedildi  : {'✅' if rejected else '❌'}")
+    same = before == after
+    print(f"Geri yükleme sonrası sonuç eşit: {'✅' if same else '❌'}")
+    if not (same and picked_up and parallel_picked_up and rejected):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,313 @@
+"""
+📈 Analizci verim benchmark paketi
+Kural sözlüklerinden üretilen sentetik Türkçe korpuslarda (10k/100k/1M) her analizci ve uçtan uca
+akış için yorum/sn, tepe bellek ve boyutla ölçeklenme; kayıtlı baseline'a göre verim eşikten fazla
+düşerse hata koduyla çıkar
+
+Kullanım:
+  python benchmarks/bench_suite.py                                    # ölç ve baseline ile karşılaştır
+  python benchmarks/bench_suite.py --sizes 10000 100000 --analyzers advanced pipeline
+  python benchmarks/bench_suite.py --sizes 10000 100000 --save-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from synthetic_corpus import generate_vocabulary_corpus
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'throughput_baseline.json')
+# Verim baseline'ın bu oranından fazla düşerse gerileme sayılır
+DEFAULT_THRESHOLD = 0.25
+# Küçük korpuslarda ölçüm gürültülü: bu boyuta kadar ölçüm tekrarlanıp en iyisi alınır
+REPEAT_MAX_SIZE = 100000
+# LDA iterasyonları büyük korpuslarda saatler sürer
+TOPIC_MAX_SIZE = 100000
+WARMUP_SIZE = 1000
+
+
+def peak_memory_mb():
+    """Sürecin şimdiye kadarki tepe RSS'i (MB); Linux'ta KB, macOS'ta bayt döner"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def setup_contextual(comments):
+    from contextual_keyword_analyzer import ContextualKeywordAnalyzer
+
+    analyzer = ContextualKeywordAnalyzer()
+    return lambda corpus: [analyzer.analyze_all_categories(comment['comment']) for comment in corpus]
+
+
+def setup_advanced(comments):
+    from advanced_comment_analyzer import AdvancedCommentAnalyzer
+
+    analyzer = AdvancedCommentAnalyzer()
+    return lambda corpus: analyzer.analyze_all_comments(corpus, compact=True)
+
+
+def setup_batch(comments):
+    from advanced_comment_analyzer import BATCH_AVAILABLE, AdvancedCommentAnalyzer
+
+    if not BATCH_AVAILABLE:
+        return None
+    analyzer = AdvancedCommentAnalyzer()
+    return lambda corpus: analyzer.analyze_batch([comment['comment'] for comment in corpus])
+
+
+def setup_priority(comments):
+    from advanced_comment_analyzer import AdvancedCommentAnalyzer
+    from priority_analyzer import PriorityAnalyzer
+
+    analyzer = AdvancedCommentAnalyzer()
+    priority = PriorityAnalyzer()
+    # Duygu analizi ölçüme dahil değil: sadece önceliklendirme aşaması ölçülür
+    sentiments = {}
+
+    def prepare(corpus):
+        sentiments[id(corpus)] = analyzer.analyze_all_comments(corpus, compact=True)
+
+    def run(corpus):
+        return priority.analyze_critical_issues(corpus, sentiments[id(corpus)])
+
+    run.prepare = prepare
+    return run
+
+
+def setup_summarizer(comments):
+    from comment_summarizer import CommentSummarizer
+
+    summarizer = CommentSummarizer()
+    return lambda corpus: summarizer.generate_ai_summary(corpus, include_beden_renk=True)
+
+
+def setup_topic(comments):
+    try:
+        from topic_modeling_analyzer import TopicModelingAnalyzer
+    except ImportError:
+        return None
+    if len(comments) > TOPIC_MAX_SIZE:
+        return None
+    analyzer = TopicModelingAnalyzer()
+    return lambda corpus: analyzer.lda_topic_modeling([comment['comment'] for comment in corpus], n_topics=5)
+
+
+def setup_pipeline(comments):
+    """integrated_main_with_priority'deki kategori + öncelik + AI özeti akışı (konu modelleme hariç)"""
+    from advanced_comment_analyzer import AdvancedCommentAnalyzer
+    from comment_summarizer import CommentSummarizer
+    from priority_analyzer import PriorityAnalyzer
+    from turkish_dates import annotate_date_epochs
+
+    analyzer = AdvancedCommentAnalyzer()
+    priority = PriorityAnalyzer()
+    summarizer = CommentSummarizer()
+
+    def run(corpus):
+        annotate_date_epochs(corpus)
+        analysis = analyzer.analyze_all_comments(corpus, compact=True)
+        priority.analyze_critical_issues(corpus, analysis)
+        return summarizer.generate_ai_summary(corpus, include_beden_renk=summarizer.is_textile_product(corpus))
+
+    return run
+
+
+ANALYZERS = {
+    'contextual': setup_contextual,
+    'advanced': setup_advanced,
+    'batch': setup_batch,
+    'priority': setup_priority,
+    'summarizer': setup_summarizer,
+    'topic': setup_topic,
+    'pipeline': setup_pipeline,
+}
+
+
+def measure(name: str, size: int) -> dict:
+    """Tek ölçüm (ayrı süreçte çalışır: tepe bellek diğer ölçümlerden etkilenmesin)"""
+    comments = generate_vocabulary_corpus(size)
+    warmup = generate_vocabulary_corpus(WARMUP_SIZE, seed=7)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = ANALYZERS[name](comments)
+        if run is None:
+            return {'analyzer': name, 'size': size, 'skipped': True}
+        # Isınma: kural seti, otomat ve desenler derlensin (korpustan farklı metinlerle)
+        if hasattr(run, 'prepare'):
+            run.prepare(warmup)
+        run(warmup)
+        if hasattr(run, 'prepare'):
+            run.prepare(comments)
+
+        memory_before = peak_memory_mb()
+        start = time.perf_counter()
+        run(comments)
+        elapsed = time.perf_counter() - start
+        memory_after = peak_memory_mb()
+
+    return {
+        'analyzer': name,
+        'size': size,
+        'seconds': round(elapsed, 4),
+        'comments_per_second': round(size / elapsed, 1),
+        'peak_memory_mb': round(memory_after, 1) if memory_after is not None else None,
+        'memory_growth_mb': round(memory_after - memory_before, 1) if memory_after is not None else None,
+    }
+
+
+def measure_in_subprocess(name: str, size: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--measure', name, str(size)],
+        capture_output=True, text=True
+    )
+    if output.returncode != 0:
+        return {'analyzer': name, 'size': size, 'error': output.stderr.strip().splitlines()[-1:]}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def run_suite(analyzers, sizes, repeat: int) -> dict:
+    results = {}
+    for name in analyzers:
+        results[name] = {}
+        for size in sizes:
+            runs = [measure_in_subprocess(name, size) for _ in range(repeat if size <= REPEAT_MAX_SIZE else 1)]
+            measured = [run for run in runs if 'comments_per_second' in run]
+            # En iyi verim (gürültü çoğunlukla yavaşlatır), en yüksek tepe bellek
+            best = max(measured, key=lambda run: run['comments_per_second']) if measured else runs[0]
+            if measured and best['peak_memory_mb'] is not None:
+                best['peak_memory_mb'] = max(run['peak_memory_mb'] for run in measured)
+            results[name][str(size)] = best
+            print(f"  {name:<11} {size:>8} yorum: " + (
+                f"{best['comments_per_second']:>10.0f} yorum/sn" if 'comments_per_second' in best
+                else ('atlandı' if best.get('skipped') else f"hata {best.get('error')}")
+            ), flush=True)
+    return results
+
+
+def add_scaling(results: dict):
+    """Ardışık boyutlar arasında süre oranı / boyut oranı (1.0 = doğrusal, büyükse doğrusalın üstünde)"""
+    for by_size in results.values():
+        measured = sorted((int(size), data) for size, data in by_size.items() if 'seconds' in data)
+        for (small, small_data), (large, large_data) in zip(measured, measured[1:]):
+            large_data['scaling'] = round((large_data['seconds'] / small_data['seconds']) / (large / small), 2)
+
+
+def machine_info() -> dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list:
+    """Baseline'a göre verimi eşikten fazla düşen (analizci, boyut) ölçümleri"""
+    regressions = []
+    for name, by_size in results.items():
+        for size, data in by_size.items():
+            reference = baseline.get('results', {}).get(name, {}).get(size, {}).get('comments_per_second')
+            if reference is None or 'comments_per_second' not in data:
+                continue
+            change = data['comments_per_second'] / reference - 1
+            data['baseline_change'] = round(change, 3)
+            if change < -threshold:
+                regressions.append((name, size, reference, data['comments_per_second'], change))
+    return regressions
+
+
+def print_report(results: dict):
+    print("\n📈 ANALİZCİ VERİM RAPORU")
+    print("=" * 86)
+    print(f"{'Analizci':<12}{'Yorum':>9}{'Süre (sn)':>11}{'Yorum/sn':>11}{'Tepe bellek':>13}"
+          f"{'Tepe artışı':>15}{'Ölçek':>7}{'Baseline':>9}")
+    for name, by_size in results.items():
+        for size, data in by_size.items():
+            if 'seconds' not in data:
+                continue
+            memory = f"{data['peak_memory_mb']:.0f} MB" if data['peak_memory_mb'] is not None else '-'
+            growth = f"{data['memory_growth_mb']:.0f} MB" if data['memory_growth_mb'] is not None else '-'
+            scaling = f"{data['scaling']:.2f}" if 'scaling' in data else '-'
+            change = f"{data['baseline_change'] * 100:+.0f}%" if 'baseline_change' in data else '-'
+            print(f"{name:<12}{int(size):>9}{data['seconds']:>11.2f}{data['comments_per_second']:>11.0f}"
+                  f"{memory:>13}{growth:>15}{scaling:>7}{change:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analizci verim benchmark paketi")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--analyzers', nargs='+', choices=list(ANALYZERS), default=list(ANALYZERS))
+    parser.add_argument('--repeat', type=int, default=3, help=f"{REPEAT_MAX_SIZE} yoruma kadar tekrar sayısı")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="Sonuçları baseline olarak kaydet")
+    parser.add_argument('--output', help="Sonuçları JSON olarak kaydet")
+    parser.add_argument('--measure', nargs=2, metavar=('ANALYZER', 'SIZE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure[0], int(args.measure[1]))))
+        return
+
+    print(f"📈 {', '.join(args.analyzers)} için {', '.join(str(size) for size in args.sizes)} yorumluk ölçümler")
+    results = run_suite(args.analyzers, sorted(args.sizes), args.repeat)
+    add_scaling(results)
+    report = {'machine': machine_info(), 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            # Sadece ölçülen analizci/boyutlar güncellenir
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            for name, by_size in previous.get('results', {}).items():
+                for size, data in by_size.items():
+                    results.setdefault(name, {}).setdefault(size, data)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print_report(results)
+        print(f"\n📁 Baseline {args.baseline} dosyasına kaydedildi")
+        return
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('machine') != report['machine']:
+            print("⚠️ Baseline farklı bir makinede/Python sürümünde kaydedilmiş; karşılaştırma yanıltıcı olabilir")
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+    else:
+        print(f"⚠️ Baseline bulunamadı ({args.baseline}); --save-baseline ile kaydedin")
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} ölçümde verim %{args.threshold * 100:.0f} eşiğinden fazla düştü:")
+        for name, size, reference, current, change in regressions:
+            print(f"  {name} ({size} yorum): {reference:.0f} -> {current:.0f} yorum/sn ({change * 100:+.0f}%)")
+        sys.exit(1)
+    print("\n✅ Verim gerilemesi yok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+🔤 Türkçe metin normalizasyonu benchmark'ı
+Eski CommentSummarizer.clean_text (6 replace + 2 regex) ve TopicModelingAnalyzer.preprocess_text
+(3 regex + tokenize) ile ortak turkish_text katmanının (tek derlenmiş desen + sınırlı metin/kelime önbelleği) karşılaştırması;
+ilk geçiş ve aynı yorumların ikinci analizcide tekrar işlenmesi
+"""
+
+import os
+import re
+import sys
+import time
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+
+from synthetic_corpus import generate_corpus
+from turkish_text import alpha_tokens, clear_cache, normalize_text
+
+try:
+    from nltk.tokenize import word_tokenize
+except ImportError:
+    word_tokenize = None
+
+
+def old_clean_text(text):
+    """Ortak katmandan önceki CommentSummarizer.clean_text"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = text.replace('ı', 'i').replace('ğ', 'g').replace('ü', 'u').replace('ş', 's').replace('ö', 'o').replace('ç', 'c')
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def old_preprocess_words(text):
+    """Ortak katmandan önceki TopicModelingAnalyzer.preprocess_text (stop word filtresi hariç)"""
+    if not text:
+        return []
+    text = text.lower()
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\d+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    try:
+        words = word_tokenize(text, language='turkish')
+    except Exception:
+        words = text.split()
+    return [word for word in words if len(word) > 2 and word.isalpha()]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(size: int = 100000):
+    # Benzersiz metinler: ilk geçiş önbellekten faydalanmasın
+    texts = [f"{comment['comment']} #{i}" for i, comment in enumerate(generate_corpus(size))]
+    clear_cache()
+
+    old_clean, old_clean_time = timed(lambda: [old_clean_text(text) for text in texts])
+    new_clean, new_clean_time = timed(lambda: [normalize_text(text) for text in texts])
+    _, warm_clean_time = timed(lambda: [normalize_text(text) for text in texts])
+
+    old_words, old_words_time = timed(lambda: [old_preprocess_words(text) for text in texts])
+    new_words, new_words_time = timed(lambda: [list(alpha_tokens(text)) for text in texts])
+    _, warm_words_time = timed(lambda: [alpha_tokens(text) for text in texts])
+
+    print(f"🔤 {size} yorum için normalizasyon benchmark'ı")
+    print("=" * 60)
+    print(f"clean_text      : eski {old_clean_time:5.2f} sn, yeni {new_clean_time:5.2f} sn, "
+          f"tekrar (sınırlı önbellek) {warm_clean_time:5.3f} sn")
+    print(f"preprocess_text : eski {old_words_time:5.2f} sn, yeni {new_words_time:5.2f} sn, "
+          f"tekrar (sınırlı önbellek) {warm_words_time:5.3f} sn")
+
+    same = old_clean == new_clean and old_words == new_words
+    print(f"Sonuç eşit: {'✅' if same else '❌'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
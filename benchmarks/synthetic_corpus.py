@@ -0,0 +1,126 @@
+"""
+🧪 Sentetik Türkçe yorum korpusu
+Benchmark'lar için gerçekçi Trendyol yorumları üretir; generate_vocabulary_corpus cümleleri
+analysis_rules.json'daki kategori, olumsuzluk ve tekstil sözlüklerinden kurar
+"""
+
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'analyzers', 'analysis_rules.json')
+
+OPENINGS = [
+    "Ürün elime ulaştı", "Eşime hediye olarak aldım", "İkinci kez sipariş verdim",
+    "Uzun süredir kullanıyorum", "İndirimdeyken aldım", "Kızıma aldık",
+]
+
+FRAGMENTS = [
+    "kargo çok hızlı geldi", "kargo çok geç geldi, 10 gün bekledim", "paket hasarlı geldi",
+    "teslimat gecikmesi yaşadık", "kalitesi gerçekten çok iyi", "malzeme kalitesiz, bozuk çıktı",
+    "fiyat performans ürünü", "bu fiyata çok pahalı", "beden tam oldu", "beden küçük geldi",
+    "müşteri hizmetleri çok kaba davrandı", "satıcı yardımcı oldu", "çalışmıyor, iade ettim",
+    "rengi görseldeki gibi", "renk farklı geldi", "bizim evin vazgeçilmezi",
+    "oğlum ek gıdaya geçtiğinden beri severek içiyor", "berbat bir deneyimdi, pişman oldum",
+    "idare eder, beklediğim gibi değil", "tavsiye ederim", "hiç beğenmedim",
+    "orijinal ürün, sorunsuz geldi", "paketleme güzel", "fena değil",
+]
+
+CLOSINGS = ["Teşekkürler.", "Tavsiye ederim.", "Bir daha almam.", "Memnun kaldım.", ""]
+
+SELLERS = ["Trendyol", "ModaStore", "TeknoMarket", "BebekDünyası", "EvYaşam"]
+
+TURKISH_MONTHS = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz",
+                  "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"]
+
+
+def generate_comment(rng: random.Random, now: datetime) -> Dict[str, str]:
+    fragments = rng.sample(FRAGMENTS, rng.randint(1, 3))
+    text = f"{rng.choice(OPENINGS)}, {', '.join(fragments)}. {rng.choice(CLOSINGS)}".strip()
+    date = now - timedelta(days=rng.randint(0, 120))
+    return {
+        'user': f"K***{rng.randint(1, 99999)}",
+        'date': f"{date.day} {TURKISH_MONTHS[date.month - 1]} {date.year}",
+        'comment': text,
+        'rating': str(rng.randint(1, 5)),
+        'seller': rng.choice(SELLERS),
+    }
+
+
+def generate_corpus(size: int, seed: int = 42) -> List[Dict[str, str]]:
+    """Belirli büyüklükte, tekrar üretilebilir yorum listesi oluştur"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    return [generate_comment(rng, now) for _ in range(size)]
+
+
+# Sözlük kelimelerinden cümle kalıpları (konu: kategori anahtar kelimesi, niteleme: olumlu/olumsuz kelime)
+CLAUSE_TEMPLATES = [
+    "{subject} {quality}", "{subject} gerçekten {quality}", "{subject} bence {quality}",
+    "{subject} konusunda {quality} diyebilirim", "{subject} açısından {quality}",
+]
+
+
+def load_vocabulary(rules_file: str = RULES_FILE) -> Dict[str, List]:
+    """Kural dosyasından korpus sözlüğü: (konu kelimeleri, olumlu, olumsuz) üçlüleri ve ek ifadeler"""
+    with open(rules_file, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    categories = []
+    for data in rules['categories'].values():
+        # Konu olarak niteleme listelerinde geçmeyen kelimeler kullanılır ("kargo", "fiyat", "beden"...)
+        subjects = [kw for kw in data['keywords'] if kw not in data['positive'] and kw not in data['negative']]
+        if subjects and data['positive'] and data['negative']:
+            categories.append((subjects, data['positive'], data['negative']))
+    return {
+        'categories': categories,
+        'negativity': [keyword for data in rules['negativity_indicators'].values() for keyword in data['keywords']],
+        'textile': rules['textile_keywords'],
+    }
+
+
+def generate_vocabulary_comment(rng: random.Random, now: datetime, vocabulary: Dict[str, List],
+                                products: int) -> Dict[str, str]:
+    # Yorumun genel tonu: kategori nitelemeleri ve puan buna göre seçilir (gerçek yorumlardaki gibi karışık olabilir)
+    negative = rng.random() < 0.4
+    clauses = []
+    for _ in range(rng.randint(1, 3)):
+        roll = rng.random()
+        if roll < 0.25:
+            clauses.append(rng.choice(FRAGMENTS))
+        elif roll < 0.35:
+            clauses.append(f"{rng.choice(vocabulary['textile'])} {rng.choice(['tam oldu', 'küçük geldi', 'büyük geldi'])}")
+        else:
+            keywords, positive, negative_words = rng.choice(vocabulary['categories'])
+            quality = rng.choice(negative_words if negative != (rng.random() < 0.2) else positive)
+            clauses.append(rng.choice(CLAUSE_TEMPLATES).format(subject=rng.choice(keywords), quality=quality))
+    if negative and rng.random() < 0.5:
+        clauses.append(rng.choice(vocabulary['negativity']))
+
+    text = f"{rng.choice(OPENINGS)}, {', '.join(clauses)}. {rng.choice(CLOSINGS)}".strip()
+    date = now - timedelta(days=rng.randint(0, 120))
+    return {
+        'user': f"K***{rng.randint(1, 99999)}",
+        'date': f"{date.day} {TURKISH_MONTHS[date.month - 1]} {date.year}",
+        'comment': text,
+        'rating': str(rng.randint(1, 2) if negative else rng.randint(3, 5)),
+        'seller': rng.choice(SELLERS),
+        'product': f"urun-p-{1000 + rng.randrange(products)}",
+    }
+
+
+def iter_vocabulary_corpus(size: int, seed: int = 42, products: int = 1000,
+                           rules_file: str = RULES_FILE) -> Iterator[Dict[str, str]]:
+    """Kural sözlüklerinden tekrar üretilebilir yorum akışı (büyük korpuslar için)"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    vocabulary = load_vocabulary(rules_file)
+    for _ in range(size):
+        yield generate_vocabulary_comment(rng, now, vocabulary, products)
+
+
+def generate_vocabulary_corpus(size: int, seed: int = 42, products: int = 1000,
+                               rules_file: str = RULES_FILE) -> List[Dict[str, str]]:
+    """Kural sözlüklerinden belirli büyüklükte, tekrar üretilebilir yorum listesi"""
+    return list(iter_vocabulary_corpus(size, seed, products, rules_file))
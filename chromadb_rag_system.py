@@ -13,20 +13,43 @@ import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import sqlite3
+import sys
+import time
 
 # FAISS ve embedding imports
 import faiss
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
+# Analiz modülleri src/analyzers altında
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'analyzers'))
+
+# Ortak duygu sözlüğü (bir kez derlenir, yorum grupları tek işlemde puanlanır)
+from lexicon_sentiment import get_rag_lexicon
+
 # Mevcut analiz modülleri
 try:
     from advanced_comment_analyzer import AdvancedCommentAnalyzer
     from priority_analyzer import PriorityAnalyzer
+    from fused_comment_analyzer import FusedCommentAnalyzer
     ANALYZERS_AVAILABLE = True
 except ImportError:
     ANALYZERS_AVAILABLE = False
 
+# Ortak yorum yükleyicisi (yoksa pandas ile okunur)
+try:
+    from comment_loader import load_comment_table
+    LOADER_AVAILABLE = True
+except ImportError:
+    LOADER_AVAILABLE = False
+
+# Kaynaklar arası yakın kopya temizliği
+try:
+    from near_duplicate_detector import NearDuplicateDetector, print_dedup_report
+    DEDUP_AVAILABLE = True
+except ImportError:
+    DEDUP_AVAILABLE = False
+
 class FaissRAGSystem:
     def __init__(
         self,
@@ -68,6 +91,8 @@ class FaissRAGSystem:
         if ANALYZERS_AVAILABLE:
             self.comment_analyzer = AdvancedCommentAnalyzer()
             self.priority_analyzer = PriorityAnalyzer()
+            # Kategori + olumsuzluk analizini tek geçişte yapan birleşik analizci
+            self.fused_analyzer = FusedCommentAnalyzer(self.comment_analyzer, self.priority_analyzer)
             print("✅ Gelişmiş analiz modülleri aktif")
         else:
             print("⚠️ Temel mod - gelişmiş analiz modülleri yok")
@@ -110,6 +135,15 @@ class FaissRAGSystem:
             )
         ''')
         
+        # Yakın kopya olduğu için indekse alınmayan yorumlar (sonraki yüklemelerde tekrar karşılaştırılmaz)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS skipped_duplicates (
+                comment_hash TEXT PRIMARY KEY,
+                duplicate_of TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
         # Vector indeks metadatası
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS vector_metadata (
@@ -148,8 +182,16 @@ class FaissRAGSystem:
             return 0
         
         try:
-            df = pd.read_csv(csv_file, encoding='utf-8')
-            print(f"📊 {len(df)} yorum bulundu")
+            columns = ('comment', 'user', 'date')
+            if LOADER_AVAILABLE:
+                table = load_comment_table(csv_file, columns=columns)
+            else:
+                table = pd.read_csv(csv_file, encoding='utf-8', dtype=str, keep_default_na=False,
+                                    usecols=lambda name: name in columns)
+            # Satır sözlüğü kurmadan sadece gereken sütunlar dolaşılır
+            rows = zip(*(table[column].tolist() if column in table.columns else [''] * len(table)
+                         for column in columns))
+            print(f"📊 {len(table)} yorum bulundu")
         except Exception as e:
             print(f"❌ CSV okuma hatası: {e}")
             return 0
@@ -157,42 +199,59 @@ class FaissRAGSystem:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Yeni yorumları hazırla
-        new_comments = []
-        comment_texts = []
+        # Veritabanında olmayan yorumları topla
+        candidates = []
         
-        for _, row in df.iterrows():
-            comment = str(row.get('comment', ''))
-            user = str(row.get('user', ''))
-            date = str(row.get('date', ''))
+        for comment, user, date in rows:
+            comment = str(comment)
+            user = str(user)
+            date = str(date)
             
             if not comment.strip():
                 continue
             
             comment_hash = self.get_comment_hash(comment, user, date)
             
-            # Zaten var mı kontrol et
-            cursor.execute('SELECT id FROM comments WHERE comment_hash = ?', (comment_hash,))
+            # Zaten var mı (ya da önceki bir yüklemede yakın kopya diye atlandı mı) kontrol et
+            cursor.execute('''
+                SELECT 1 FROM comments WHERE comment_hash = ?
+                UNION ALL SELECT 1 FROM skipped_duplicates WHERE comment_hash = ?
+            ''', (comment_hash, comment_hash))
             if cursor.fetchone():
                 continue
             
+            candidates.append({'comment': comment, 'user': user, 'date': date, 'comment_hash': comment_hash})
+        
+        # Yakın kopyaları analiz ve embedding'den önce ayıkla
+        dedup_report = None
+        skipped = []
+        if DEDUP_AVAILABLE and candidates:
+            unique, dedup_report = NearDuplicateDetector().deduplicate(candidates, return_clusters=True)
+            # Atılan kopyalar kümelerinin temsilcisiyle birlikte kaydedilir
+            for representative, members in zip(unique, dedup_report.pop('clusters')):
+                skipped.extend((candidates[i]['comment_hash'], representative['comment_hash']) for i in members[1:])
+            candidates = unique
+        
+        # Yeni yorumları hazırla
+        new_comments = []
+        comment_texts = []
+        
+        for candidate in candidates:
+            comment = candidate['comment']
+            user = candidate['user']
+            date = candidate['date']
+            comment_hash = candidate['comment_hash']
+            
             # Analiz yap
             category = 'unknown'
             priority_score = 0
             
             if ANALYZERS_AVAILABLE:
                 try:
-                    analysis = self.comment_analyzer.analyze_comment_categories(comment)
-                    # En yüksek confidence'lı kategoriyi bul
-                    highest_category = 'unknown'
-                    highest_confidence = 0
-                    for cat, result in analysis.items():
-                        if result.get('relevant') and result.get('confidence', 0) > highest_confidence:
-                            highest_category = cat
-                            highest_confidence = result['confidence']
-                    
-                    category = highest_category
-                    priority_score = self.priority_analyzer.calculate_negativity_score(comment).get('negativity_score', 0)
+                    analysis = self.fused_analyzer.analyze(comment)
+                    # En yüksek confidence'lı kategori ve olumsuzluk skoru aynı geçişten gelir
+                    category = analysis['primary_category']
+                    priority_score = analysis['negativity']['negativity_score']
                 except Exception as e:
                     print(f"⚠️ Analiz hatası: {e}")
             
@@ -205,7 +264,15 @@ class FaissRAGSystem:
             return 0
         
         # Embeddings oluştur
+        embedding_start = time.time()
         embeddings = self.create_embeddings(comment_texts)
+        embedding_seconds = time.time() - embedding_start
+        
+        if dedup_report:
+            # Atlanan her kopya, ölçülen ortalama yorum başı embedding süresi kadar tasarruf sağlar
+            per_comment = embedding_seconds / len(comment_texts)
+            dedup_report['embedding_seconds_saved'] = round(dedup_report['duplicates_removed'] * per_comment, 3)
+            print_dedup_report(dedup_report)
         
         # FAISS indekse ekle
         if self.comment_index is None:
@@ -245,6 +312,7 @@ class FaissRAGSystem:
                 VALUES (?, ?, ?)
             ''', ('comment', comment_id, embedding_blob))
         
+        cursor.executemany('INSERT OR IGNORE INTO skipped_duplicates (comment_hash, duplicate_of) VALUES (?, ?)', skipped)
         conn.commit()
         conn.close()
         
@@ -342,46 +410,29 @@ class FaissRAGSystem:
             self.reset_vectors()
             return []
         
-        results = []
-        negative_keywords = ['sorun', 'problem', 'kötü', 'berbat', 'bozuk', 'defolu', 'şikayet', 'memnun değil', 
-                           'kalitesiz', 'geç', 'yavaş', 'hasarlı', 'kırık', 'iade', 'beğenmedim', 'beğenmedik',
-                           'tavsiye etmem', 'pişman', 'hayal kırıklığı', 'rezalet', 'çöp', 'para israfı', 
-                           'aldatmaca', 'sahte', 'taklit']
+        candidates = [
+            (score, self.comment_metadata[idx]) for score, idx in zip(scores[0], indices[0])
+            if idx != -1 and score >= similarity_threshold and idx < len(self.comment_metadata)
+        ]
         
-        positive_keywords = ['beğendik', 'beğendim', 'mükemmel', 'harika', 'süper', 'tavsiye ederim', 
-                           'memnun', 'kaliteli', 'güzel', 'başarılı', 'teşekkür', 'stok', 'vazgeçilmez',
-                           'favorim', 'severek', 'mutlu', 'çok iyi']
+        # Adayların duygusu tek seferde: sadece tek yönde kelime geçen yorum olumlu/olumsuz sayılır
+        sentiments = get_rag_lexicon().label([metadata['comment'] for _, metadata in candidates], mode='exclusive')
         
-        for score, idx in zip(scores[0], indices[0]):
-            if idx == -1 or score < similarity_threshold:
+        results = []
+        for (score, metadata), sentiment in zip(candidates, sentiments):
+            if sentiment_filter and sentiment != sentiment_filter:
                 continue
-                
-            if idx < len(self.comment_metadata):
-                metadata = self.comment_metadata[idx]
-                comment_text = metadata['comment'].lower()
-                
-                # Sentiment filtering - hem pozitif hem negatif kelimeleri kontrol et
-                has_negative = any(keyword in comment_text for keyword in negative_keywords)
-                has_positive = any(keyword in comment_text for keyword in positive_keywords)
-                
-                if sentiment_filter == 'negative':
-                    # Sadece negatif kelimeler varsa VE pozitif kelimeler yoksa
-                    if not has_negative or has_positive:
-                        continue
-                elif sentiment_filter == 'positive':
-                    # Sadece pozitif kelimeler varsa VE negatif kelimeler yoksa
-                    if not has_positive or has_negative:
-                        continue
-                
-                results.append({
-                    'id': metadata['id'],
-                    'user': metadata['user'],
-                    'date': metadata['date'],
-                    'comment': metadata['comment'],
-                    'category': metadata['category'],
-                    'priority_score': metadata['priority_score'],
-                    'similarity': float(score)
-                })
+            
+            results.append({
+                'id': metadata['id'],
+                'user': metadata['user'],
+                'date': metadata['date'],
+                'comment': metadata['comment'],
+                'category': metadata['category'],
+                'priority_score': metadata['priority_score'],
+                'sentiment': sentiment,
+                'similarity': float(score)
+            })
         
         # Similarity'ye göre sırala ve limit uygula
         results.sort(key=lambda x: x['similarity'], reverse=True)
@@ -457,24 +508,7 @@ class FaissRAGSystem:
                 category = comment['category']
                 similarity = comment['similarity']
                 
-                # Sentiment tespiti
-                comment_text = comment['comment'].lower()
-                negative_keywords = ['sorun', 'problem', 'kötü', 'berbat', 'bozuk', 'defolu', 'şikayet', 'memnun değil', 
-                                   'kalitesiz', 'geç', 'yavaş', 'hasarlı', 'kırık', 'iade', 'beğenmedim', 'beğenmedik',
-                                   'tavsiye etmem', 'pişman', 'hayal kırıklığı', 'rezalet', 'çöp', 'para israfı']
-                positive_keywords = ['beğendik', 'beğendim', 'mükemmel', 'harika', 'süper', 'tavsiye ederim', 
-                                   'memnun', 'kaliteli', 'güzel', 'başarılı', 'teşekkür', 'stok', 'vazgeçilmez',
-                                   'favorim', 'severek', 'mutlu', 'çok iyi']
-                
-                has_negative = any(kw in comment_text for kw in negative_keywords)
-                has_positive = any(kw in comment_text for kw in positive_keywords)
-                
-                if has_negative and not has_positive:
-                    sentiment_emoji = "🔴"
-                elif has_positive and not has_negative:
-                    sentiment_emoji = "🟢"
-                else:
-                    sentiment_emoji = "⚪"
+                sentiment_emoji = {'negative': "🔴", 'positive': "🟢"}.get(comment['sentiment'], "⚪")
                 
                 answer_parts.append(
                     f"{i}. {sentiment_emoji} {comment['comment'][:120]}... "
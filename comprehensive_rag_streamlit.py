@@ -88,6 +88,9 @@ else:
     if os.path.exists(analyzers_path):
         sys.path.insert(0, analyzers_path)
 
+# Ortak duygu sözlüğü (RAG aramasıyla aynı kurallar)
+from lexicon_sentiment import get_rag_lexicon
+
 # Topic Modeling Analyzer
 TOPIC_ANALYZER_AVAILABLE = False
 TopicModelingAnalyzer = None
@@ -742,8 +745,11 @@ if st.session_state.system_ready:
                         
                         st.write(f"**Found {len(filtered_comments)} matching comments**")
                         
+                        # Sayfadaki yorumların duygusu tek seferde
+                        sentiments = get_rag_lexicon().label([c[2] for c in filtered_comments], mode='exclusive')
+                        
                         # Display comments
-                        for i, (user, date, comment_text, category, priority) in enumerate(filtered_comments, 1):
+                        for i, ((user, date, comment_text, category, priority), detected) in enumerate(zip(filtered_comments, sentiments), 1):
                             with st.expander(f"Comment {i}: {comment_text[:50]}...", expanded=False):
                                 col_c1, col_c2, col_c3 = st.columns([2, 1, 1])
                                 
@@ -758,20 +764,7 @@ if st.session_state.system_ready:
                                     st.write(f"**Category:** {category or 'unknown'}")
                                     st.write(f"**Priority:** {priority:.0f}/100")
                                 
-                                # Sentiment detection
-                                comment_lower = comment_text.lower()
-                                negative_keywords = ['sorun', 'problem', 'kötü', 'berbat', 'bozuk', 'defolu', 'şikayet']
-                                positive_keywords = ['beğendim', 'mükemmel', 'harika', 'süper', 'kaliteli', 'güzel']
-                                
-                                has_negative = any(kw in comment_lower for kw in negative_keywords)
-                                has_positive = any(kw in comment_lower for kw in positive_keywords)
-                                
-                                if has_negative and not has_positive:
-                                    sentiment = "🔴 Negative"
-                                elif has_positive and not has_negative:
-                                    sentiment = "🟢 Positive"
-                                else:
-                                    sentiment = "⚪ Mixed/Neutral"
+                                sentiment = {'negative': "🔴 Negative", 'positive': "🟢 Positive"}.get(detected, "⚪ Mixed/Neutral")
                                 
                                 st.write(f"**Sentiment:** {sentiment}")
                         
@@ -1191,20 +1184,7 @@ if st.session_state.system_ready:
                                     st.metric("Priority", f"{comment['priority_score']:.0f}/100")
                                     st.write(f"**Category:** {comment['category']}")
                                     
-                                    # Sentiment detection
-                                    comment_text = comment['comment'].lower()
-                                    negative_keywords = ['sorun', 'problem', 'kötü', 'berbat', 'bozuk']
-                                    positive_keywords = ['beğendim', 'mükemmel', 'harika', 'süper', 'kaliteli']
-                                    
-                                    has_negative = any(kw in comment_text for kw in negative_keywords)
-                                    has_positive = any(kw in comment_text for kw in positive_keywords)
-                                    
-                                    if has_negative and not has_positive:
-                                        sentiment = "🔴 Negative"
-                                    elif has_positive and not has_negative:
-                                        sentiment = "🟢 Positive"
-                                    else:
-                                        sentiment = "⚪ Mixed/Neutral"
+                                    sentiment = {'negative': "🔴 Negative", 'positive': "🟢 Positive"}.get(comment['sentiment'], "⚪ Mixed/Neutral")
                                     
                                     st.write(f"**Sentiment:** {sentiment}")
                     
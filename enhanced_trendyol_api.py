@@ -11,6 +11,20 @@ import csv
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
+# API, web API ve HTML'den gelen tekrar eden yorumları ayıklamak için
+try:
+    from near_duplicate_detector import NearDuplicateDetector, print_dedup_report
+    DEDUP_AVAILABLE = True
+except ImportError:
+    DEDUP_AVAILABLE = False
+
+# Parquet yorum deposu (opsiyonel): her çekim ürün/gün bölümüne eklenir
+try:
+    from comment_store import CommentStore, DEFAULT_STORE_DIR
+    STORE_AVAILABLE = True
+except ImportError:
+    STORE_AVAILABLE = False
+
 class EnhancedTrendyolAPI:
     def __init__(self):
         self.session = requests.Session()
@@ -271,6 +285,12 @@ class EnhancedTrendyolAPI:
                 break
         
         print(f"\n🎉 Toplam {len(all_reviews)} yorum çekildi!")
+        
+        # Farklı kaynaklardan gelen yakın kopyaları hedef sayıya kırpmadan önce ayıkla
+        if DEDUP_AVAILABLE and all_reviews:
+            all_reviews, dedup_report = NearDuplicateDetector().deduplicate(all_reviews)
+            print_dedup_report(dedup_report)
+        
         return all_reviews[:target_count]  # Hedef sayıda yorum döndür
     
     def save_reviews_to_csv(self, reviews, filename=None):
@@ -306,6 +326,18 @@ class EnhancedTrendyolAPI:
         except Exception as e:
             print(f"❌ CSV kaydetme hatası: {e}")
     
+    def save_reviews_to_store(self, reviews, product_url, store_dir=None):
+        """Yorumları Parquet yorum deposuna ekle (ürün ve bugünün bölümüne yeni dosya)"""
+        if not STORE_AVAILABLE or not reviews:
+            return 0
+        try:
+            count = CommentStore(store_dir or DEFAULT_STORE_DIR).append(reviews, product_url)
+            print(f"✅ {count} yorum yorum deposuna eklendi")
+            return count
+        except Exception as e:
+            print(f"❌ Yorum deposu kaydetme hatası: {e}")
+            return 0
+    
     def analyze_reviews(self, reviews):
         """Yorumları analiz et"""
         if not reviews:
@@ -358,6 +390,7 @@ def main():
             
             # CSV'ye kaydet
             api.save_reviews_to_csv(reviews)
+            api.save_reviews_to_store(reviews, url)
             
             print(f"\n🎯 Başarılı! {len(reviews)} yorum çekildi ve kaydedildi.")
         else:
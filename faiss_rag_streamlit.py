@@ -329,23 +329,7 @@ if st.session_state.system_ready:
                         for i, comment in enumerate(similar_comments, 1):
                             similarity = comment['similarity']
                             
-                            # Sentiment detection for display
-                            comment_text = comment['comment'].lower()
-                            negative_keywords = ['sorun', 'problem', 'kötü', 'berbat', 'bozuk', 'defolu', 
-                                               'şikayet', 'memnun değil', 'kalitesiz', 'geç', 'yavaş', 'hasarlı', 'kırık',
-                                               'iade', 'beğenmedim', 'tavsiye etmem', 'pişman', 'hayal kırıklığı']
-                            positive_keywords = ['beğendik', 'beğendim', 'mükemmel', 'harika', 'süper', 'tavsiye ederim', 
-                                               'memnun', 'kaliteli', 'güzel', 'vazgeçilmez', 'favorim', 'stok']
-                            
-                            has_negative = any(kw in comment_text for kw in negative_keywords)
-                            has_positive = any(kw in comment_text for kw in positive_keywords)
-                            
-                            if has_negative and not has_positive:
-                                detected_sentiment = "🔴 Negative"
-                            elif has_positive and not has_negative:
-                                detected_sentiment = "🟢 Positive"
-                            else:
-                                detected_sentiment = "⚪ Mixed/Neutral"
+                            detected_sentiment = {'negative': "🔴 Negative", 'positive': "🟢 Positive"}.get(comment['sentiment'], "⚪ Mixed/Neutral")
                             
                             with st.expander(f"Vector {i} - {detected_sentiment} - Similarity: {similarity:.4f}"):
                                 col1, col2 = st.columns([3, 1])
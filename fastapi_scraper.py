@@ -4,6 +4,8 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
+from api_responses import FastJSONResponse, install_fast_responses
+
 # Try to import the Selenium scraper from multiple paths
 TrendyolSeleniumScraper = None
 try:
@@ -16,7 +18,8 @@ except Exception:
 	except Exception:
 		TrendyolSeleniumScraper = None
 
-app = FastAPI(title="Trendyol Selenium Scraper API", version="1.0.0")
+app = FastAPI(title="Trendyol Selenium Scraper API", version="1.0.0", default_response_class=FastJSONResponse)
+install_fast_responses(app)
 
 class ScrapeRequest(BaseModel):
 	url: str
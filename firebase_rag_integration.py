@@ -1,6 +1,5 @@
 import firebase_admin
 from firebase_admin import credentials, firestore
-import pandas as pd
 import json
 import hashlib
 from datetime import datetime, timedelta
@@ -10,6 +9,7 @@ import os
 
 # Local imports
 from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from comment_loader import column_values, load_comment_table
 from priority_analyzer import PriorityAnalyzer
 
 class FirebaseRAGSystem:
@@ -85,16 +85,19 @@ class FirebaseRAGSystem:
         
         try:
             # CSV'yi oku
-            df = pd.read_csv(csv_file_path, encoding='utf-8')
+            table = load_comment_table(csv_file_path, columns=['user', 'date', 'comment'])
+            users = column_values(table, 'user')
+            dates = column_values(table, 'date')
+            texts = column_values(table, 'comment')
             
             # Başarı sayacı
             uploaded_count = 0
             skipped_count = 0
             
-            for index, row in df.iterrows():
+            for index, (user, date, comment) in enumerate(zip(users, dates, texts)):
                 try:
                     # Yorum hash'i oluştur (tekrar kontrolü için)
-                    comment_hash = self.create_comment_hash(row)
+                    comment_hash = self.create_comment_hash({'user': user, 'date': date, 'comment': comment})
                     
                     # Bu yorum zaten var mı kontrol et
                     existing = self.db.collection(self.collections['comments']).where('comment_hash', '==', comment_hash).limit(1).get()
@@ -106,9 +109,9 @@ class FirebaseRAGSystem:
                     # Yorum verisini hazırla
                     comment_data = {
                         'comment_hash': comment_hash,
-                        'user': str(row.get('user', 'Anonymous')),
-                        'date': str(row.get('date', '')),
-                        'comment': str(row.get('comment', '')),
+                        'user': str(user) if 'user' in table.columns else 'Anonymous',
+                        'date': str(date),
+                        'comment': str(comment),
                         'uploaded_at': firestore.SERVER_TIMESTAMP,
                         'processed': False,
                         'analysis_completed': False
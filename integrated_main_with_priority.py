@@ -1,7 +1,21 @@
+import os
 from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from analysis_cache import AnalysisCache
 from comment_summarizer import CommentSummarizer
 from topic_modeling_analyzer import TopicModelingAnalyzer
 from priority_analyzer import PriorityAnalyzer
+from near_duplicate_detector import NearDuplicateDetector, print_dedup_report
+from parallel_analyzer import ParallelCommentAnalyzer
+from pipeline_profiler import profiler
+
+# 1'den büyükse kategori ve öncelik analizi bu kadar süreçte paralel çalışır
+ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', 1))
+# Yorum başı analiz sonuçlarının kalıcı önbelleği (tekrar çalıştırmada sadece yeni yorumlar analiz edilir)
+ANALYSIS_CACHE_DB = os.getenv('ANALYSIS_CACHE_DB', 'analysis_cache.db')
+# Yorum kaynağı: CSV dosyası veya Parquet yorum deposu klasörü (ör. 'comment_store')
+COMMENT_SOURCE = os.getenv('COMMENT_SOURCE', 'trendyol_comments.csv')
+# ANALYSIS_PROFILE=1 ise aşama süreleri ölçülür, çalıştırma sonunda özetlenip bu dosyaya yazılır
+ANALYSIS_PROFILE_FILE = os.getenv('ANALYSIS_PROFILE_FILE', 'pipeline_profile.json')
 
 def main():
     print("🚀 GELİŞMİŞ YORUM ANALİZ SİSTEMİ v3.0")
@@ -9,18 +23,28 @@ def main():
     print("="*70)
     
     # Analizcileri başlat
-    advanced_analyzer = AdvancedCommentAnalyzer()
+    advanced_analyzer = AdvancedCommentAnalyzer(cache=AnalysisCache(ANALYSIS_CACHE_DB))
     basic_summarizer = CommentSummarizer()
     topic_analyzer = TopicModelingAnalyzer()
     priority_analyzer = PriorityAnalyzer()
     
+    # Çok çekirdekli mod: aynı API ile süreç havuzunda çalışan analizci
+    parallel_runner = ParallelCommentAnalyzer(workers=ANALYSIS_WORKERS, cache_path=ANALYSIS_CACHE_DB) if ANALYSIS_WORKERS > 1 else None
+    category_runner = parallel_runner or advanced_analyzer
+    priority_runner = parallel_runner or priority_analyzer
+    summary_runner = parallel_runner or basic_summarizer
+    
     # Yorumları yükle
-    comments = advanced_analyzer.load_comments_from_csv("trendyol_comments.csv")
+    comments = advanced_analyzer.load_comments_from_csv(COMMENT_SOURCE)
     
     if not comments:
         print("❌ Yorum yüklenemedi!")
         return
     
+    # Farklı kaynaklardan birleşen yakın kopyaları analizden önce ayıkla
+    comments, dedup_report = NearDuplicateDetector().deduplicate(comments)
+    print_dedup_report(dedup_report)
+    
     print(f"📊 {len(comments)} yorum yüklendi")
     
     # Kullanıcı seçimi
@@ -36,7 +60,8 @@ def main():
     if choice in ['1', '4']:
         # 1. SENTIMENT + KATEGORİ ANALİZİ
         print("\n🎭 1. Sentiment + Kategori analizi başlıyor...")
-        analysis_results = advanced_analyzer.analyze_all_comments(comments)
+        # Sütunlu sonuç: her yorum metni bir kez saklanır (bellek ve JSON boyutu küçülür)
+        analysis_results = category_runner.analyze_all_comments(comments, compact=True)
         
         category_report = advanced_analyzer.generate_category_report(analysis_results)
         print(category_report)
@@ -70,10 +95,10 @@ def main():
         # Önce sentiment analizi gerekli
         if 'analysis_results' not in locals():
             print("📊 Sentiment analizi yapılıyor (önceliklendirme için gerekli)...")
-            analysis_results = advanced_analyzer.analyze_all_comments(comments)
+            analysis_results = category_runner.analyze_all_comments(comments, compact=True)
         
         # Öncelik analizi
-        priority_results = priority_analyzer.analyze_critical_issues(comments, analysis_results)
+        priority_results = priority_runner.analyze_critical_issues(comments, analysis_results)
         
         if priority_results:
             priority_report = priority_analyzer.generate_priority_report(priority_results)
@@ -92,9 +117,17 @@ def main():
         all_comment_text = " ".join([comment.get('comment', '').lower() for comment in comments])
         include_beden_renk = any(keyword in all_comment_text for keyword in textile_keywords)
         
-        ai_summary = basic_summarizer.generate_ai_summary(comments, include_beden_renk=include_beden_renk)
+        ai_summary = summary_runner.generate_ai_summary(comments, include_beden_renk=include_beden_renk)
         basic_summarizer.save_ai_summary_to_txt(ai_summary, 'ai_summary.txt')
     
+    if parallel_runner:
+        parallel_runner.close()
+    
+    if profiler.enabled:
+        # Paralel modda süreç havuzundaki aşamalar ölçülmez, sadece ana süreçteki çağrılar görünür
+        print("\n" + profiler.format_report())
+        profiler.save(ANALYSIS_PROFILE_FILE)
+    
     # 5. İNTERAKTİF MENÜ
     if choice in ['1', '3', '4']:
         print("\n" + "="*70)
@@ -276,10 +309,10 @@ def quick_priority_demo():
     print("="*50)
     
     # Analizcileri başlat
-    comment_analyzer = AdvancedCommentAnalyzer()
+    comment_analyzer = AdvancedCommentAnalyzer(cache=AnalysisCache(ANALYSIS_CACHE_DB))
     priority_analyzer = PriorityAnalyzer()
     
-    comments = comment_analyzer.load_comments_from_csv("trendyol_comments.csv")
+    comments = comment_analyzer.load_comments_from_csv(COMMENT_SOURCE)
     
     if len(comments) < 5:
         print("❌ Demo için en az 5 yorum gerekli!")
@@ -4,7 +4,6 @@ import hashlib
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import pandas as pd
 
 # LangChain imports
 from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -23,6 +22,7 @@ from chromadb.config import Settings
 
 # Local imports
 from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from comment_loader import column_values, load_comment_table
 from priority_analyzer import PriorityAnalyzer
 
 class LangChainChromaRAG:
@@ -105,8 +105,8 @@ class LangChainChromaRAG:
         
         # CSV dosyasını oku
         try:
-            df = pd.read_csv(csv_file, encoding='utf-8')
-            print(f"📁 {len(df)} yorum bulundu")
+            table = load_comment_table(csv_file, columns=['user', 'date', 'comment'])
+            print(f"📁 {len(table)} yorum bulundu")
         except Exception as e:
             print(f"❌ CSV okuma hatası: {e}")
             return 0
@@ -114,16 +114,19 @@ class LangChainChromaRAG:
         # Documents listesi oluştur
         documents = []
         
-        for idx, row in df.iterrows():
+        # Sütunu olmayan alanlar None kalır, aşağıda varsayılan metinle doldurulur
+        rows = zip(column_values(table, 'user', None), column_values(table, 'date', None),
+                   column_values(table, 'comment'))
+        for idx, (user, date, comment) in enumerate(rows):
             # Yorum analizi yap
-            analysis = self.comment_analyzer.analyze_comment(str(row.get('comment', '')))
-            priority = self.priority_analyzer.analyze_comment_priority(str(row.get('comment', '')))
+            analysis = self.comment_analyzer.analyze_comment(str(comment))
+            priority = self.priority_analyzer.analyze_comment_priority(str(comment))
             
             # Metadata oluştur
             metadata = {
                 'source': 'trendyol_csv',
-                'user': str(row.get('user', 'Unknown')),
-                'date': str(row.get('date', '')),
+                'user': str(user if user is not None else 'Unknown'),
+                'date': str(date if date is not None else ''),
                 'comment_id': str(idx),
                 'sentiment_category': analysis.get('category_analysis', {}).get('highest_category', 'unknown'),
                 'sentiment_confidence': analysis.get('category_analysis', {}).get('highest_confidence', 0.0),
@@ -134,9 +137,9 @@ class LangChainChromaRAG:
             
             # Document oluştur
             doc_content = f"""
-Kullanıcı: {row.get('user', 'Anonim')}
-Tarih: {row.get('date', 'Bilinmiyor')}
-Yorum: {row.get('comment', '')}
+Kullanıcı: {user if user is not None else 'Anonim'}
+Tarih: {date if date is not None else 'Bilinmiyor'}
+Yorum: {comment}
 
 Analiz Özeti:
 - Kategori: {analysis.get('category_analysis', {}).get('highest_category', 'unknown')}
@@ -2,6 +2,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 import json
+import os
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict
@@ -9,9 +10,19 @@ import sqlite3
 from pathlib import Path
 
 # Local imports
+from api_responses import FastJSONResponse, install_fast_responses
 from realtime_rag_system import RealTimeCommentMonitor, RAGKnowledgeBase
+from rule_set import get_rule_set
 
-app = FastAPI(title="Gerçek Zamanlı Yorum Analiz Dashboard")
+# Parquet yorum deposu (opsiyonel): filtreli yorum sorguları sadece gereken bölümleri okur
+try:
+    from comment_store import CommentStore
+    STORE_AVAILABLE = True
+except ImportError:
+    STORE_AVAILABLE = False
+
+app = FastAPI(title="Gerçek Zamanlı Yorum Analiz Dashboard", default_response_class=FastJSONResponse)
+install_fast_responses(app)
 
 # Global state
 monitor = RealTimeCommentMonitor(check_interval=30)
@@ -421,6 +432,66 @@ async def get_stats():
     """Mevcut istatistikleri al"""
     return get_current_stats()
 
+@app.get("/api/comments")
+def get_comments(product: str = None, days: int = None, max_rating: int = None, limit: int = 100):
+    """Yorum deposundan filtreli yorumlar (ör. bir ürünün son 7 gündeki olumsuz yorumları)"""
+    if not STORE_AVAILABLE or not os.path.isdir(monitor.comment_source):
+        return {"error": "Yorum deposu bulunamadı (COMMENT_SOURCE bir depo klasörü olmalı)"}
+    
+    try:
+        table = CommentStore(monitor.comment_source).read_table(
+            columns=['user', 'date', 'comment', 'rating', 'seller'],
+            product=product, days=days, max_rating=max_rating
+        )
+        return {
+            "total": table.num_rows,
+            "comments": table.slice(0, limit).to_pylist(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+@app.get("/api/priorities")
+def get_priorities(days: int = None, limit: int = 100):
+    """
+    Depodaki tüm ürünlerin (ürün, kategori) öncelik tablosu; tek toplu analiz ve önceliklendirme.
+    Okuma ve analiz CPU/IO yoğun olduğundan düz def: FastAPI thread havuzunda çalıştırır, event loop bloklanmaz.
+    """
+    if not STORE_AVAILABLE or not os.path.isdir(monitor.comment_source):
+        return {"error": "Yorum deposu bulunamadı (COMMENT_SOURCE bir depo klasörü olmalı)"}
+
+    try:
+        frame = CommentStore(monitor.comment_source).read_frame(
+            columns=['comment', 'product', 'date_epoch'], days=days
+        )
+        issues = monitor.priority_analyzer.negative_issue_table(
+            frame, monitor.comment_analyzer.analyze_batch(frame['comment'])
+        )
+        table = monitor.priority_analyzer.prioritize_products(issues)
+        return {
+            "total": len(table),
+            "priorities": table.head(limit).to_dict('records'),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+@app.get("/api/rules")
+async def get_rules():
+    """Kullanılan analiz kuralı dosyası ve sürümü"""
+    rule_set = get_rule_set()
+    return {"version": rule_set.version, "path": rule_set.path}
+
+@app.post("/api/rules/reload")
+async def reload_analysis_rules():
+    """Kural dosyasını servisi yeniden başlatmadan tekrar yükle"""
+    reloaded = monitor.reload_rules_if_changed()
+    return {
+        "reloaded": reloaded,
+        "version": get_rule_set().version,
+        "timestamp": datetime.now().isoformat()
+    }
+
 def get_current_stats():
     """Mevcut sistem istatistiklerini hesapla"""
     try:
@@ -445,6 +516,8 @@ def get_current_stats():
         return {
             "total_comments": len(comments),
             "urgent_count": urgent_count,
+            # Monitörün artımlı tuttuğu kategori/duygu özeti (yeniden hesaplama gerektirmez)
+            "category_summary": monitor.aggregates.summary()["categories"],
             "last_updated": datetime.now().isoformat()
         }
     except Exception as e:
@@ -457,6 +530,9 @@ async def run_monitoring():
     
     while True:
         try:
+            # Kural dosyası değiştiyse yeni kurallara geç
+            monitor.reload_rules_if_changed()
+            
             # Yeni yorumları kontrol et
             new_comments = monitor.check_for_new_comments()
             
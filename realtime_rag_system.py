@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 import time
 import hashlib
 import requests
@@ -22,7 +23,10 @@ except ImportError:
     print("⚠️ Bazı RAG kütüphaneleri eksik. 'pip install sentence-transformers openai' çalıştırın")
 
 from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from analysis_cache import AnalysisCache
+from incremental_aggregates import CategoryAggregates
 from priority_analyzer import PriorityAnalyzer
+from rule_set import reload_rules
 from topic_modeling_analyzer import TopicModelingAnalyzer
 
 @dataclass
@@ -161,11 +165,23 @@ class RAGKnowledgeBase:
 class RealTimeCommentMonitor:
     def __init__(self, check_interval: int = 300):  # 5 dakika
         self.check_interval = check_interval
-        self.comment_analyzer = AdvancedCommentAnalyzer()
+        # Saatlik kontrol ve dashboard istatistikleri aynı yorumları tekrar tekrar analiz eder;
+        # önbellek sayesinde her seferinde sadece yeni gelen yorumlar hesaplanır
+        self.comment_analyzer = AdvancedCommentAnalyzer(cache=AnalysisCache())
         self.priority_analyzer = PriorityAnalyzer()
         self.topic_analyzer = TopicModelingAnalyzer()
         self.rag_kb = RAGKnowledgeBase()
         
+        # CSV dosyası veya Parquet yorum deposu klasörü
+        self.comment_source = os.getenv('COMMENT_SOURCE', 'trendyol_comments.csv')
+        
+        # İşlenen yorumların kategori/duygu özeti; yeni yorum geldikçe sadece onlar eklenir
+        self.aggregates_file = "realtime_aggregates.json"
+        self.aggregates = CategoryAggregates.load(self.aggregates_file, list(self.comment_analyzer.categories))
+        if self.aggregates.rule_version != self.comment_analyzer.rule_version:
+            # Kayıtlı özet başka bir kural sürümüyle hesaplanmış (ya da sürümsüz eski dosya)
+            self.rebuild_aggregates()
+        
         self.comment_queue = Queue()
         self.is_running = False
         self.last_check = datetime.now()
@@ -179,7 +195,7 @@ class RealTimeCommentMonitor:
     
     def load_current_comments(self) -> List[Dict]:
         """Mevcut yorumları yükle"""
-        return self.comment_analyzer.load_comments_from_csv("trendyol_comments.csv")
+        return self.comment_analyzer.load_comments_from_csv(self.comment_source)
     
     def get_comment_hash(self, comment: Dict) -> str:
         """Yorum için hash oluştur (tekrar kontrolü için)"""
@@ -224,6 +240,10 @@ class RealTimeCommentMonitor:
         analysis_results = self.comment_analyzer.analyze_all_comments(comments)
         priority_results = self.priority_analyzer.analyze_critical_issues(comments, analysis_results)
         
+        # Artımlı özeti güncelle (analizler önbellekten gelir)
+        self.comment_analyzer.aggregate_comments(comments, self.aggregates)
+        self.aggregates.save(self.aggregates_file)
+        
         # 2. RAG ile harici bağlam bulma
         enhanced_results = analysis_results.copy()
         enhanced_results['rag_context'] = {}
@@ -296,6 +316,30 @@ class RealTimeCommentMonitor:
         
         return recommendations
     
+    def rebuild_aggregates(self):
+        """Artımlı özeti mevcut kurallarla (yeni kategoriler dahil) işlenmiş yorumlardan yeniden kur"""
+        conn = sqlite3.connect(self.rag_kb.db_path)
+        processed = {row[0] for row in conn.execute('SELECT comment_hash FROM comment_history')}
+        conn.close()
+        comments = [comment for comment in self.load_current_comments() if self.get_comment_hash(comment) in processed]
+        
+        self.aggregates = self.comment_analyzer.aggregate_comments(comments)
+        self.aggregates.save(self.aggregates_file)
+        print(f"📊 Kategori özeti {len(comments)} yorumla yeni kural sürümüne göre yeniden kuruldu")
+    
+    def reload_rules_if_changed(self) -> bool:
+        """
+        Kural dosyası değiştiyse yeni kuralları devreye al: eski sürümün önbellek kayıtlarını sil,
+        analiz sürümü değiştiyse eski kurallarla sayılmış kategori özetini yeniden kur
+        """
+        if not reload_rules():
+            return False
+        deleted = self.comment_analyzer.analysis_cache.prune(self.comment_analyzer.rule_version)
+        print(f"🧹 Eski kural sürümüne ait {deleted} önbellek kaydı silindi")
+        if self.aggregates.rule_version != self.comment_analyzer.rule_version:
+            self.rebuild_aggregates()
+        return True
+    
     def start_monitoring(self):
         """Gerçek zamanlı izlemeyi başlat"""
         self.is_running = True
@@ -309,6 +353,9 @@ class RealTimeCommentMonitor:
         
         while self.is_running:
             try:
+                # 0. Kural dosyası değiştiyse servisi durdurmadan yeni kurallara geç
+                self.reload_rules_if_changed()
+                
                 # 1. Yeni yorumları kontrol et
                 new_comments = self.check_for_new_comments()
                 
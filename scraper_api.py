@@ -2,14 +2,18 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 import traceback
 
+from api_responses import FastJSONResponse, install_fast_responses
+
 # Mevcut kazıyıcı sınıfımızı import edelim
 from trendyol_selenium_scraper import TrendyolSeleniumScraper
 
 app = FastAPI(
     title="Trendyol Scraper API",
     description="Trendyol ürün sayfalarından yorum kazımak için bir API.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
+install_fast_responses(app)
 
 # API'ye gönderilecek istek gövdesinin modelini tanımlayalım
 class ScrapeRequest(BaseModel):
@@ -1,12 +1,92 @@
 import http.server
-import socketserver
-import json
-import subprocess
+import os
+import sys
+import threading
 import traceback
+from queue import Queue, Empty
 from urllib.parse import urlparse, parse_qs
 
 PORT = 8000
 
+# Aynı anda çalışabilecek analiz sayısı (her biri kendi Chrome sürücüsünü kullanır)
+MAX_CONCURRENT_ANALYSES = int(os.getenv('MAX_CONCURRENT_ANALYSES', 2))
+DEFAULT_MIN_COMMENTS = 100
+
+# Scraper ve özetleyici modüllerini sunucu açılışında bir kez yükle
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'analyzers'))
+sys.path.insert(0, os.path.join(BASE_DIR, 'src', 'scrapers'))
+
+from trendyol_selenium_scraper import TrendyolSeleniumScraper
+from comment_summarizer import CommentSummarizer
+from api_responses import dumps_json, negotiate_encoding, compress_body, MINIMUM_COMPRESS_SIZE
+
+
+class AnalysisPipeline:
+    """Scrape → özet akışını süreç içinde, hazır bekleyen bileşenlerle çalıştırır"""
+
+    def __init__(self, max_workers: int = MAX_CONCURRENT_ANALYSES):
+        self.max_workers = max_workers
+        # Özetleyici durum tutmaz, tüm istekler aynı nesneyi paylaşabilir
+        self.summarizer = CommentSummarizer()
+        # Selenium sürücüleri thread-safe değil: her istek havuzdan kendine ait bir scraper alır
+        self.scraper_pool = Queue()
+        self.slots = threading.BoundedSemaphore(max_workers)
+
+    def warm_up(self, count: int = 1):
+        """Havuza önceden açılmış scraper ekle (ilk isteğin Chrome açılışını beklememesi için)"""
+        for _ in range(min(count, self.max_workers)):
+            try:
+                self.scraper_pool.put(TrendyolSeleniumScraper())
+            except Exception as e:
+                print(f"Scraper ön yüklemesi başarısız: {e}")
+
+    def _acquire_scraper(self):
+        try:
+            return self.scraper_pool.get_nowait()
+        except Empty:
+            return TrendyolSeleniumScraper()
+
+    def _release_scraper(self, scraper, healthy: bool):
+        if healthy:
+            self.scraper_pool.put(scraper)
+            return
+        # Hata veren sürücüyü havuza geri koyma
+        try:
+            scraper.close()
+        except Exception:
+            pass
+
+    def analyze(self, product_url: str, min_comments: int = DEFAULT_MIN_COMMENTS) -> str:
+        """Ürün yorumlarını çekip AI özet metnini döndürür (diske dosya yazmadan)"""
+        with self.slots:
+            scraper = self._acquire_scraper()
+            healthy = False
+            try:
+                print("1. Yorumlar çekiliyor...")
+                comments = scraper.scrape_comments(product_url, min_comments=min_comments)
+                healthy = True
+            finally:
+                self._release_scraper(scraper, healthy)
+
+        print(f"2. {len(comments)} yorum özetleniyor...")
+        include_beden_renk = self.summarizer.is_textile_product(comments)
+        ai_summary = self.summarizer.generate_ai_summary(comments, include_beden_renk=include_beden_renk)
+        return self.summarizer.format_ai_summary_text(ai_summary)
+
+    def close(self):
+        while True:
+            try:
+                self.scraper_pool.get_nowait().close()
+            except Empty:
+                break
+            except Exception:
+                continue
+
+
+pipeline = AnalysisPipeline()
+
+
 class MyHttpRequestHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         if self.path.startswith('/analyze'):
@@ -19,50 +99,19 @@ class MyHttpRequestHandler(http.server.SimpleHTTPRequestHandler):
                 self.send_error_response(400, 'URL is required')
                 return
 
+            try:
+                min_comments = int(query_components.get('min_comments', [DEFAULT_MIN_COMMENTS])[0])
+            except ValueError:
+                self.send_error_response(400, 'min_comments must be an integer')
+                return
+
             print(f"Analiz edilecek URL: {product_url}")
 
             try:
-                # 1. Scraper betiğini URL ile güncelle
-                print("1. src/scrapers/trendyol_selenium_scraper.py güncelleniyor...")
-                with open('src/scrapers/trendyol_selenium_scraper.py', 'r', encoding='utf-8') as f:
-                    scraper_code = f.read()
-                
-                # URL'yi bul ve değiştir (daha esnek hale getirildi)
-                import re
-                new_scraper_code = re.sub(r'url = ".*"', f'url = "{product_url}"', scraper_code)
-
-                with open('src/scrapers/trendyol_selenium_scraper.py', 'w', encoding='utf-8') as f:
-                    f.write(new_scraper_code)
-                print("Scraper güncellendi.")
-
-                # 2. Scraper'ı çalıştır
-                print("2. Yorumlar çekiliyor (scraper çalıştırılıyor)...")
-                scraper_process = subprocess.run(['python', 'src/scrapers/trendyol_selenium_scraper.py'], capture_output=True, text=True, check=True, encoding='utf-8')
-                print("Scraper stdout:", scraper_process.stdout)
-                print("Scraper stderr:", scraper_process.stderr)
-                print("Yorumlar çekildi.")
-
-                # 3. Özetleyiciyi çalıştır
-                print("3. Yorumlar özetleniyor (summarizer çalıştırılıyor)...")
-                summarizer_process = subprocess.run(['python', 'src/analyzers/comment_summarizer.py'], capture_output=True, text=True, check=True, encoding='utf-8')
-                print("Summarizer stdout:", summarizer_process.stdout)
-                print("Summarizer stderr:", summarizer_process.stderr)
-                print("Yorumlar özetlendi.")
-
-                # 4. Özeti oku ve gönder
-                print("4. Özet okunuyor ve gönderiliyor...")
-                with open('comment_summary.txt', 'r', encoding='utf-8') as f:
-                    summary = f.read()
-
+                summary = pipeline.analyze(product_url, min_comments=min_comments)
                 self.send_success_response({'summary': summary})
                 print("--- Analiz Başarıyla Tamamlandı ---")
 
-            except subprocess.CalledProcessError as e:
-                print("HATA: Alt süreçlerden biri hata verdi.")
-                print(f"Return code: {e.returncode}")
-                print(f"Stdout: {e.stdout}")
-                print(f"Stderr: {e.stderr}")
-                self.send_error_response(500, f'Bir betik çalıştırılırken hata oluştu: {e.stderr}')
             except Exception as e:
                 print(f"BEKLENMEDİK HATA: {e}")
                 traceback.print_exc() # Print full traceback to the console
@@ -73,19 +122,35 @@ class MyHttpRequestHandler(http.server.SimpleHTTPRequestHandler):
             return http.server.SimpleHTTPRequestHandler.do_GET(self)
 
     def send_error_response(self, code, message):
-        self.send_response(code)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps({'error': message}).encode())
+        self.send_json_response(code, {'error': message})
 
     def send_success_response(self, data):
-        self.send_response(200)
+        self.send_json_response(200, data)
+
+    def send_json_response(self, code, data):
+        body = dumps_json(data)
+        encoding = None
+        if len(body) >= MINIMUM_COMPRESS_SIZE:
+            encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+            body = compress_body(body, encoding)
+
+        self.send_response(code)
         self.send_header('Content-type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
 Handler = MyHttpRequestHandler
 
-with socketserver.TCPServer(('', PORT), Handler) as httpd:
-    print(f"Sunucu http://localhost:{PORT} adresinde başlatıldı")
-    httpd.serve_forever()
\ No newline at end of file
+if __name__ == "__main__":
+    pipeline.warm_up()
+    # Her istek kendi thread'inde çalışır; uzun süren analizler birbirini bloklamaz
+    with http.server.ThreadingHTTPServer(('', PORT), Handler) as httpd:
+        print(f"Sunucu http://localhost:{PORT} adresinde başlatıldı")
+        try:
+            httpd.serve_forever()
+        finally:
+            pipeline.close()
@@ -1,70 +1,101 @@
-import csv
 import json
+import warnings
 from collections import Counter, defaultdict
-from typing import Dict, List
-from contextual_keyword_analyzer import ContextualKeywordAnalyzer
+from typing import Dict, List, Optional
+from analysis_cache import AnalysisCache
+from compact_results import build_compact_results, category_comments
+from incremental_aggregates import CategoryAggregates
+from pipeline_profiler import RESULT, profiled
+from comment_loader import load_comment_records
+from rule_set import get_rule_set
+
+# Toplu (vektörel) analiz modu için opsiyonel bağımlılıklar
+try:
+    import numpy as np
+    import pandas as pd
+    from scipy import sparse
+    BATCH_AVAILABLE = True
+except ImportError:
+    BATCH_AVAILABLE = False
+
+SENTIMENT_CODES = {'negative': -1, 'neutral': 0, 'positive': 1}
 
 class AdvancedCommentAnalyzer:
-    def __init__(self):
-        # Bağlamsal analizcıyı ekle
-        self.contextual_analyzer = ContextualKeywordAnalyzer()
-        
-        self.categories = {
-            'kargo': {
-                'keywords': ['kargo', 'gönderi', 'teslimat', 'paket', 'hızlı', 'yavaş', 'geç'],
-                'positive': ['hızlı', 'zamanında', 'sağlam'],
-                'negative': ['yavaş', 'geç', 'hasarlı', 'problem', 'çok yavaş', 'çok geç', 'kırık','bozuk']
-            },
-            'kalite': {
-                'keywords': ['kalite', 'sağlam', 'dayanıklı', 'bozuk'],
-                'positive': ['kaliteli', 'sağlam', 'dayanıklı'],
-                'negative': ['kalitesiz', 'zayıf', 'bozuk']
-            },
-            'fiyat': {
-                'keywords': ['fiyat', 'ucuz', 'pahalı', 'uygun'],
-                'positive': ['ucuz', 'uygun', 'değer'],
-                'negative': ['pahalı', 'değmez']
-            },
-            'musteri_hizmeti': {
-                'keywords': ['müşteri', 'hizmet', 'destek'],
-                'positive': ['memnun', 'yardımcı'],
-                'negative': ['memnuniyetsiz', 'kaba']
-            },
-            'urun_ozellikleri': {
-                'keywords': ['özellik', 'çalışıyor', 'performans'],
-                'positive': ['mükemmel', 'çalışıyor'],
-                'negative': ['çalışmıyor', 'bozuk']
-            },
-            'beden_uyum': {
-                'keywords': ['beden', 'uyum', 'büyük', 'küçük'],
-                'positive': ['uydu', 'tam oldu'],
-                'negative': ['uymadı', 'büyük geldi', 'küçük geldi']
-            }
-        }
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        # Kategori ve bağlamsal kurallar analysis_rules.json'dan bir kez derlenir ve analizciler arasında
+        # paylaşılır (bkz. rule_set); kurallar yeniden yüklenince analizci yeni seti otomatik kullanır
+        get_rule_set()
+
+        # Yorum başı sonuçların kalıcı önbelleği (opsiyonel)
+        self.analysis_cache = cache
+
+    @property
+    def rules(self):
+        """Güncel derlenmiş kural seti; çağrı başında bir kez alınıp çağrı boyunca kullanılır"""
+        return get_rule_set()
+
+    @property
+    def categories(self) -> Dict:
+        return self.rules.categories
 
+    @property
+    def contextual_analyzer(self):
+        return self.rules.contextual_analyzer
+
+    @property
+    def keyword_matcher(self):
+        return self.rules.keyword_matcher
+
+    @property
+    def rule_version(self) -> str:
+        return self.get_rule_version()
+
+    @profiled('advanced.load_comments', items=RESULT)
     def load_comments_from_csv(self, filename: str) -> List[Dict]:
-        comments = []
         try:
-            with open(filename, 'r', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    comments.append(row)
-            return comments
+            # Kayıtlar yoğun tipli tablodan kurulur; tarih yüklemede bir kez epoch'a çevrilmiş olur
+            return load_comment_records(filename)
         except Exception as e:
             print(f"CSV okuma hatası: {e}")
             return []
 
-    def analyze_comment_categories(self, comment_text: str) -> Dict:
+    @profiled('advanced.analyze_comment')
+    def analyze_comment_categories(self, comment_text: str, rules=None) -> Dict:
+        rules = rules or self.rules
         text_lower = comment_text.lower()
-        results = {}
+        
+        # Tüm kategori kelimeleri tek geçişte bulunur
+        found = rules.keyword_matcher.find(text_lower)
         
         # 1. BAĞLAMSAL ANALİZ İLE BAŞLA
-        contextual_result = self.contextual_analyzer.analyze_all_categories(comment_text)
+        contextual_result = rules.contextual_analyzer.analyze_lowered(text_lower)
+        
+        return self.categorize(found, contextual_result, rules)
+
+    def get_rule_version(self, rules=None) -> str:
+        """Kategori ve bağlamsal kurallardan türetilen sürüm (önbellek anahtarının parçası)"""
+        return (rules or self.rules).section_version('categories', 'contextual_keywords', 'positive_indicators')
+
+    @profiled('advanced.analyze_texts', items='comment_texts')
+    def analyze_texts(self, comment_texts: List[str], rules=None) -> List[Dict]:
+        """Metinlerin kategori analizleri; önbellek varsa sadece yeni/değişen metinler hesaplanır"""
+        # Kurallar çağrı ortasında yeniden yüklenirse sonuçlar eski sürümle hesaplanıp eski sürümle saklanır
+        rules = rules or self.rules
+        if self.analysis_cache is None:
+            return [self.analyze_comment_categories(text, rules) for text in comment_texts]
+        return self.analysis_cache.get_or_compute(
+            comment_texts, self.get_rule_version(rules), lambda text: self.analyze_comment_categories(text, rules)
+        )
+
+    @profiled('advanced.categorize')
+    def categorize(self, found, contextual_result: Dict, rules=None) -> Dict:
+        """Bulunan anahtar kelimeler ve bağlamsal analiz sonucundan kategori sonuçlarını üret"""
+        results = {}
         
         # Hariç tutulan kategorileri işaretle
         excluded_categories = contextual_result.get('summary', {}).get('excluded_categories', [])
         
-        for category, data in self.categories.items():
+        for category, data in (rules or self.rules).categories.items():
             # Eğer bu kategori bağlamsal analiz tarafından hariç tutulmuşsa
             if category in excluded_categories:
                 results[category] = {
@@ -78,7 +109,7 @@ class AdvancedCommentAnalyzer:
                 continue
             
             # Normal kelime analizi
-            keywords_found = [kw for kw in data['keywords'] if kw in text_lower]
+            keywords_found = [kw for kw in data['keywords'] if kw in found]
             
             # Bağlamsal analiz sonucunu kontrol et
             if category in contextual_result.get('all_results', {}):
@@ -90,8 +121,8 @@ class AdvancedCommentAnalyzer:
                     keywords_found = list(set(keywords_found))  # Duplicates'ları kaldır
             
             if keywords_found:
-                positive = [kw for kw in data['positive'] if kw in text_lower]
-                negative = [kw for kw in data['negative'] if kw in text_lower]
+                positive = [kw for kw in data['positive'] if kw in found]
+                negative = [kw for kw in data['negative'] if kw in found]
                 sentiment = 'positive' if len(positive) > len(negative) else 'negative' if negative else 'neutral'
                 
                 # Bağlamsal güven skorunu da ekle
@@ -124,19 +155,183 @@ class AdvancedCommentAnalyzer:
         
         return results
 
-    def analyze_all_comments(self, comments: List[Dict]) -> Dict:
+    @profiled('advanced.analyze_batch', items='texts')
+    def analyze_batch(self, texts) -> Dict:
+        """
+        Yorum metni kolonunu (pandas Series, pyarrow Array veya liste) toplu analiz et.
+        analyze_comment_categories ile aynı kuralları vektörel olarak uygular:
+        tekil metinler için anahtar kelime varlığı seyrek bir (metin x kelime) matrisinde
+        tutulur, kategori sayımları matris çarpımıyla, bağlamsal desenler sadece aday
+        satırlarda pandas string işlemleriyle hesaplanır.
+        
+        Dönen diziler (yorum x kategori) boyutundadır; kategori sırası 'categories' listesindedir.
+        sentiment kodları: 1 pozitif, 0 nötr, -1 negatif.
+        """
+        if not BATCH_AVAILABLE:
+            raise RuntimeError("Toplu analiz için numpy, pandas ve scipy gerekli")
+        
+        rules = self.rules
+        contextual_analyzer = rules.contextual_analyzer
+        if hasattr(texts, 'to_pandas'):
+            texts = texts.to_pandas()
+        # Arrow string'lerindeki regex motoru Türkçe \b/\w desteklemediği için object dtype kullan
+        lowered = pd.Series(texts).astype(object).fillna('').astype(str).str.lower()
+        # Tekrarlayan metinler bir kez analiz edilir, sonuçlar kodlarla tüm satırlara yayılır
+        codes, uniques = pd.factorize(lowered)
+        lowered = pd.Series(uniques, dtype=object)
+        n = len(lowered)
+        categories = list(rules.categories.keys())
+        
+        # 1. Seyrek anahtar kelime varlık matrisi (yorum başına tek otomat taraması)
+        vocabulary = sorted({
+            kw for data in rules.categories.values() for name in ('keywords', 'positive', 'negative') for kw in data[name]
+        } | {
+            kw for category in contextual_analyzer.contextual_keywords
+            for kw in contextual_analyzer.get_primary_keywords(category)
+        })
+        vocab_index = {kw: i for i, kw in enumerate(vocabulary)}
+        
+        rows, cols = [], []
+        for row, text in enumerate(lowered):
+            for kw in rules.keyword_matcher.find(text):
+                col = vocab_index.get(kw)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        presence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n, len(vocabulary))
+        )
+        
+        def count_of(keyword_lists):
+            """Her kelime listesi için yorum başına bulunan (tekil) kelime sayısı: (n x liste) matris"""
+            membership = np.zeros((len(vocabulary), len(keyword_lists)), dtype=np.int32)
+            for j, keywords in enumerate(keyword_lists):
+                for kw in set(keywords):
+                    membership[vocab_index[kw], j] = 1
+            return np.asarray(presence @ membership)
+        
+        keyword_counts = count_of([rules.categories[c]['keywords'] for c in categories])
+        positive_counts = count_of([rules.categories[c]['positive'] for c in categories])
+        negative_counts = count_of([rules.categories[c]['negative'] for c in categories])
+        
+        excluded = np.zeros((n, len(categories)), dtype=bool)
+        contextual_valid = np.zeros((n, len(categories)), dtype=bool)
+        contextual_confidence = np.zeros((n, len(categories)), dtype=np.int64)
+        union_counts = keyword_counts.copy()
+        
+        # 2. Bağlamsal analiz: sadece ilgili kategori kelimesi geçen satırlarda regex çalıştırılır
+        positive_score = None
+        with warnings.catch_warnings():
+            # Desenlerdeki yakalama grupları str.contains uyarısı üretir; sonuç etkilenmez
+            warnings.simplefilter('ignore', UserWarning)
+            
+            for j, category in enumerate(categories):
+                if category not in contextual_analyzer.contextual_keywords:
+                    continue
+                config = contextual_analyzer.contextual_keywords[category]
+                primary = contextual_analyzer.get_primary_keywords(category)
+                # Birincil kelime listesindeki her bulunan giriş sayılır (bağlamsal analizdeki primary_found)
+                primary_counts = np.asarray(presence[:, [vocab_index[kw] for kw in primary]].sum(axis=1)).ravel()
+                
+                candidates = np.flatnonzero((keyword_counts[:, j] > 0) | (primary_counts > 0))
+                if len(candidates) == 0:
+                    continue
+                subset = lowered.iloc[candidates]
+                
+                excluded_patterns = config.get('excluded_contexts', {}).get('false_positive_patterns', [])
+                if excluded_patterns:
+                    merged = '|'.join(f'(?:{pattern})' for pattern in excluded_patterns)
+                    excluded[candidates, j] = subset.str.contains(merged, regex=True).to_numpy(dtype=bool)
+                
+                active = candidates[(primary_counts[candidates] > 0) & ~excluded[candidates, j]]
+                if len(active) == 0:
+                    continue
+                active_subset = lowered.iloc[active]
+                
+                negative_score = np.zeros(len(active), dtype=np.int64)
+                for patterns in config.get('negative_contexts', {}).values():
+                    for pattern in patterns:
+                        negative_score += 2 * active_subset.str.count(pattern).to_numpy(dtype=np.int64)
+                
+                # Pozitif göstergeler kategoriden bağımsız: gerektiğinde tüm satırlar için bir kez
+                if positive_score is None:
+                    positive_score = np.zeros(n, dtype=np.int64)
+                    positive_rows = np.zeros(n, dtype=bool)
+                if not positive_rows[active].all():
+                    pending = active[~positive_rows[active]]
+                    pending_subset = lowered.iloc[pending]
+                    for pattern in contextual_analyzer.positive_indicators:
+                        positive_score[pending] += pending_subset.str.contains(pattern, regex=True).to_numpy(dtype=np.int64)
+                    positive_rows[pending] = True
+                active_positive = positive_score[active]
+                active_primary = primary_counts[active]
+                
+                contextual_valid[active, j] = True
+                contextual_confidence[active, j] = np.where(
+                    negative_score > 0, np.minimum(negative_score * 20, 100),
+                    np.where(active_positive > 0, np.minimum(active_positive * 15, 80),
+                             np.minimum(active_primary * 10, 50))
+                )
+                # Bağlamsal analiz onayladıysa kategori kelimeleri bağlamsal kelimelerle birleşir
+                union_counts[:, j] = count_of([list(rules.categories[category]['keywords']) + primary])[:, 0]
+        
+        # 3. Kategori sonuçları
+        found_counts = np.where(contextual_valid, union_counts, keyword_counts)
+        relevant = (found_counts > 0) & ~excluded
+        sentiment = np.where(positive_counts > negative_counts, 1, np.where(negative_counts > 0, -1, 0))
+        sentiment = np.where(relevant, sentiment, 0).astype(np.int8)
+        base_confidence = np.minimum(found_counts / 2, 1.0)
+        contextual_boost = np.where(contextual_valid, contextual_confidence / 100, 0.0)
+        confidence = np.where(relevant, np.minimum(base_confidence + contextual_boost, 1.0), 0.0)
+        
+        return {
+            'categories': categories,
+            'relevant': relevant[codes],
+            'sentiment': sentiment[codes],
+            'confidence': confidence[codes],
+            'contextual_boost': np.where(relevant, contextual_boost, 0.0)[codes],
+        }
+
+    def summarize_batch(self, batch_result: Dict) -> Dict:
+        """analyze_batch sonucundan kategori başına bahsetme ve duygu sayıları"""
+        summary = {}
+        for j, category in enumerate(batch_result['categories']):
+            relevant = batch_result['relevant'][:, j]
+            sentiment = batch_result['sentiment'][:, j]
+            summary[category] = {
+                'total_mentions': int(relevant.sum()),
+                **{name: int((relevant & (sentiment == code)).sum()) for name, code in SENTIMENT_CODES.items()}
+            }
+        return summary
+
+    @profiled('advanced.analyze_all_comments', items='comments')
+    def analyze_all_comments(self, comments: List[Dict], compact: bool = False) -> Dict:
+        """
+        Yorumları kategori/duygu bazında grupla.
+        compact=True ise yorum metinlerini bir kez saklayan sütunlu sonuç döner (bkz. compact_results).
+        """
+        # Analiz ve sonuç iskeleti aynı kural sürümüyle kurulur (arada yeniden yükleme olsa bile)
+        rules = self.rules
+        commented = [comment for comment in comments if comment.get('comment', '')]
+        # Önbellek sayaçları süreç boyunca birikir; bu çağrının payı önce/sonra farkıdır
+        before = self.analysis_cache.stats() if self.analysis_cache is not None else None
+        analyses = self.analyze_texts([comment['comment'] for comment in commented], rules)
+        if before is not None:
+            after = self.analysis_cache.stats()
+            print(f"💾 Analiz önbelleği: {after['hits'] - before['hits']} isabet, "
+                  f"{after['misses'] - before['misses']} yeni analiz")
+        
+        if compact:
+            return build_compact_results(len(comments), commented, analyses, list(rules.categories))
+        
         results = {'total_comments': len(comments), 'category_analysis': {}, 'filtered_comments': {}}
         
-        for category in self.categories.keys():
+        for category in rules.categories.keys():
             results['category_analysis'][category] = {'total_mentions': 0, 'positive': [], 'negative': [], 'neutral': []}
             results['filtered_comments'][category] = {'positive': [], 'negative': [], 'neutral': []}
         
-        for i, comment in enumerate(comments):
-            comment_text = comment.get('comment', '')
-            if not comment_text:
-                continue
-            
-            category_results = self.analyze_comment_categories(comment_text)
+        for comment, category_results in zip(commented, analyses):
+            comment_text = comment['comment']
             
             for category, analysis in category_results.items():
                 if analysis['relevant']:
@@ -152,6 +347,23 @@ class AdvancedCommentAnalyzer:
         
         return results
 
+    def aggregate_comments(self, comments: List[Dict], aggregates: Optional[CategoryAggregates] = None,
+                           remove: bool = False) -> CategoryAggregates:
+        """Yorumları artımlı özete ekle (remove=True ise çıkar); sadece verilen yorumlar analiz edilir"""
+        rules = self.rules
+        if aggregates is None:
+            aggregates = CategoryAggregates(list(rules.categories), rule_version=self.get_rule_version(rules))
+        
+        texts = [comment.get('comment', '') for comment in comments]
+        analyzed = iter(self.analyze_texts([text for text in texts if text], rules))
+        analyses = [next(analyzed) if text else {} for text in texts]
+        
+        if remove:
+            aggregates.remove(comments, analyses)
+        else:
+            aggregates.add(comments, analyses)
+        return aggregates
+
     def generate_category_report(self, analysis_results: Dict) -> str:
         report = ["🔍 KONU BAZLI SENTIMENT ANALİZİ", "="*50]
         
@@ -165,16 +377,8 @@ class AdvancedCommentAnalyzer:
         return "\n".join(report)
 
     def filter_comments_by_category_sentiment(self, analysis_results: Dict, category: str, sentiment: str = None) -> List[Dict]:
-        if category not in analysis_results['filtered_comments']:
-            return []
-        
-        if sentiment:
-            return analysis_results['filtered_comments'][category].get(sentiment, [])
-        else:
-            all_comments = []
-            for sent in ['positive', 'negative', 'neutral']:
-                all_comments.extend(analysis_results['filtered_comments'][category][sent])
-            return all_comments
+        # Hem klasik hem sütunlu (compact) sonuçlarla çalışır
+        return category_comments(analysis_results, category, sentiment)
 
     def save_detailed_analysis(self, analysis_results: Dict, filename: str):
         try:
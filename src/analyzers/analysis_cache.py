@@ -0,0 +1,164 @@
+import hashlib
+import json
+import marshal
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+DEFAULT_MEMORY_SIZE = 20000
+# SQLite'ın tek sorguda izin verdiği parametre sayısının altında kal
+_SQLITE_BATCH = 500
+# Paralel analiz süreçleri aynı dosyaya yazar: kilitli veritabanında hata yerine bu kadar saniye bekle
+SQLITE_TIMEOUT = 30
+
+
+def content_hash(text: str) -> str:
+    """Yorum metninin içerik hash'i"""
+    return hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+
+
+def compute_rule_version(*rule_sets: Any) -> str:
+    """Kural yapılandırmalarından kısa sürüm kimliği üret (kurallar değişince sürüm de değişir)"""
+    payload = json.dumps(rule_sets, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class AnalysisCache:
+    """
+    Yorum başı analiz sonuçlarını (içerik hash'i, kural sürümü) anahtarıyla SQLite'ta saklar.
+    Önünde bellek içi bir LRU durur; kural sürümü değişince eski kayıtlar otomatik olarak
+    kullanılmaz hale gelir.
+
+    Bellekte sonuçların değiştirilemez marshal kopyası tutulur (JSON çözmekten ~8x hızlı açılır) ve
+    her dönen sonuç ayrı bir kopyadır: çağıranın sonucu değiştirmesi önbellekteki kaydı ya da aynı
+    metnin diğer sonuçlarını etkilemez.
+    """
+
+    def __init__(self, db_path: str = 'analysis_cache.db', memory_size: int = DEFAULT_MEMORY_SIZE):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT)
+
+    def init_database(self):
+        conn = self._connect()
+        # WAL: okuyucular yazanı beklemez, paralel işçilerin yazmaları sırayla işlenir (dosyada kalıcıdır)
+        conn.execute('PRAGMA journal_mode=WAL')
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                content_hash TEXT,
+                rule_version TEXT,
+                result TEXT,
+                created_at TIMESTAMP,
+                PRIMARY KEY (content_hash, rule_version)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _remember(self, key, payload: bytes):
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get_many(self, hashes: Iterable[str], rule_version: str) -> Dict[str, Dict]:
+        """Verilen hash'ler için önbellekteki sonuçlar (bulunamayanlar dönmez; her sonuç yeni bir kopya)"""
+        return {digest: marshal.loads(payload) for digest, payload in self._get_payloads(hashes, rule_version).items()}
+
+    def _get_payloads(self, hashes: Iterable[str], rule_version: str) -> Dict[str, bytes]:
+        """hash -> bellekte saklanan marshal kopyası"""
+        found = {}
+        missing = []
+        with self._lock:
+            for digest in set(hashes):
+                key = (digest, rule_version)
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[digest] = self._memory[key]
+                else:
+                    missing.append(digest)
+
+        if missing:
+            conn = self._connect()
+            cursor = conn.cursor()
+            for i in range(0, len(missing), _SQLITE_BATCH):
+                batch = missing[i:i + _SQLITE_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                cursor.execute(
+                    f'SELECT content_hash, result FROM analysis_cache '
+                    f'WHERE rule_version = ? AND content_hash IN ({placeholders})',
+                    [rule_version] + batch
+                )
+                for digest, result in cursor.fetchall():
+                    found[digest] = marshal.dumps(json.loads(result))
+                    self._remember((digest, rule_version), found[digest])
+            conn.close()
+
+        return found
+
+    def put_many(self, results: Dict[str, Dict], rule_version: str) -> Dict[str, bytes]:
+        """hash -> sonuç eşlemesini bellek ve SQLite'a yaz; bellekteki marshal kopyaları döner"""
+        if not results:
+            return {}
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        conn.executemany(
+            'INSERT OR REPLACE INTO analysis_cache (content_hash, rule_version, result, created_at) VALUES (?, ?, ?, ?)',
+            [(digest, rule_version, json.dumps(result, ensure_ascii=False), now) for digest, result in results.items()]
+        )
+        conn.commit()
+        conn.close()
+        payloads = {digest: marshal.dumps(result) for digest, result in results.items()}
+        for digest, payload in payloads.items():
+            self._remember((digest, rule_version), payload)
+        return payloads
+
+    def get_or_compute(self, texts: List[str], rule_version: str, compute) -> List[Dict]:
+        """
+        Metinlerin sonuçlarını önbellekten al; olmayanları compute(text) ile hesaplayıp kaydet.
+        Sonuçlar giriş sırasıyla döner; aynı metin birden çok kez geçse de her konumda ayrı nesnedir.
+        """
+        hashes = [content_hash(text) for text in texts]
+        payloads = self._get_payloads(hashes, rule_version)
+
+        computed = {}
+        for text, digest in zip(texts, hashes):
+            if digest not in payloads and digest not in computed:
+                computed[digest] = compute(text)
+        payloads.update(self.put_many(computed, rule_version))
+
+        self.hits += len(texts) - len(computed)
+        self.misses += len(computed)
+        # Yeni hesaplanan sonuç ilk geçtiği yerde olduğu gibi döner, diğer her konum yeni bir kopyadır
+        results = []
+        for digest in hashes:
+            result = computed.pop(digest, None)
+            results.append(result if result is not None else marshal.loads(payloads[digest]))
+        return results
+
+    def prune(self, keep_version: str) -> int:
+        """Güncel kural sürümü dışındaki kayıtları sil"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM analysis_cache WHERE rule_version != ?', (keep_version,))
+        deleted = cursor.rowcount
+        conn.commit()
+        conn.close()
+        with self._lock:
+            for key in [key for key in self._memory if key[1] != keep_version]:
+                del self._memory[key]
+        return deleted
+
+    def stats(self) -> Dict:
+        return {'hits': self.hits, 'misses': self.misses, 'memory_entries': len(self._memory)}
@@ -0,0 +1,173 @@
+import csv
+import os
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from turkish_dates import parse_date, parse_date_column
+
+# Sütunlu tablo için pandas (opsiyonel); yoksa sözlük kayıtları csv modülüyle okunur
+try:
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Arrow: akışlı C++ CSV okuyucu ve Arrow destekli string sütunları (opsiyonel)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+COMMENT_COLUMNS = ('user', 'date', 'comment', 'rating', 'seller')
+# Az sayıda farklı değeri olan sütunlar kategorik tutulur
+CATEGORICAL_COLUMNS = ('user', 'seller', 'product')
+DEFAULT_CHUNK_SIZE = 100000
+# Arrow okuyucusunda parça boyutu satır değil bayt cinsindendir
+ARROW_BLOCK_SIZE = 16 << 20
+STRING_DTYPE = 'string[pyarrow]' if ARROW_AVAILABLE else 'string'
+
+
+def _header(filename: str) -> List[str]:
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as csvfile:
+        return next(csv.reader(csvfile), [])
+
+
+def _raw_chunks(filename: str, chunksize: int, columns: Optional[Sequence[str]] = None):
+    """
+    CSV'yi metin sütunları olarak parça parça oku (boş hücreler '' kalır, 'nan' olmaz).
+    pyarrow varsa akışlı Arrow okuyucusu, yoksa pandas C ayrıştırıcısı kullanılır.
+    """
+    if ARROW_AVAILABLE:
+        names = [name for name in _header(filename) if not columns or name in columns]
+        reader = pa_csv.open_csv(
+            filename,
+            read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+            # Yorum metinleri tırnak içinde satır sonu içerebilir
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=names,
+                column_types={name: pa.string() for name in names},
+                strings_can_be_null=False
+            )
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+        return
+
+    usecols = (lambda name: name in columns) if columns else None
+    yield from pd.read_csv(filename, encoding='utf-8-sig', dtype=str, keep_default_na=False,
+                           chunksize=chunksize, usecols=usecols)
+
+
+def compact_frame(frame: 'pd.DataFrame') -> 'pd.DataFrame':
+    """
+    Metin sütunlarını yoğun tiplere çevir: yorum/tarih Arrow string, kullanıcı/satıcı kategorik;
+    tarih bir kez çözülüp 'date_epoch' (epoch saniye) olarak eklenir.
+    CSV'deki puan kazınmış serbest metindir ("4.5", "300", "x" olabilir): sayıya zorlanmaz, az sayıda
+    farklı değeri olduğundan kategorik tutulur. Depodan gelen (zaten doğrulanmış) sayısal puan Int8 kalır.
+    """
+    frame = frame.copy()
+    for column in frame.columns:
+        if column in CATEGORICAL_COLUMNS:
+            frame[column] = frame[column].astype('category')
+        elif column == 'rating':
+            is_numeric = pd.api.types.is_numeric_dtype(frame[column])
+            frame[column] = frame[column].astype('Int8' if is_numeric else 'category')
+        elif column == 'date_epoch':
+            frame[column] = frame[column].astype('Int64')
+        else:
+            frame[column] = frame[column].astype(STRING_DTYPE)
+    if 'date' in frame.columns:
+        frame['date_epoch'] = pd.array(parse_date_column(frame['date'].tolist()), dtype='Int64')
+    return frame
+
+
+def iter_comment_chunks(filename: str, chunksize: int = DEFAULT_CHUNK_SIZE,
+                        columns: Optional[Sequence[str]] = None) -> Iterator['pd.DataFrame']:
+    """Yorum dosyasını (veya Parquet yorum deposunu) yoğun tipli DataFrame parçaları olarak üret"""
+    if not PANDAS_AVAILABLE:
+        raise ImportError("Sütunlu yükleme için pandas gerekli")
+    if os.path.isdir(filename):
+        from comment_store import CommentStore
+        yield from CommentStore(filename).iter_frames(columns)
+        return
+    for chunk in _raw_chunks(filename, chunksize, columns):
+        yield compact_frame(chunk)
+
+
+def load_comment_table(filename: str, chunksize: int = DEFAULT_CHUNK_SIZE,
+                       columns: Optional[Sequence[str]] = None) -> 'pd.DataFrame':
+    """
+    Yorum dosyasının tamamını tek yoğun tipli tabloya yükle.
+    Parçalar ayrı kategori sözlükleriyle okunduğu için kategorik sütunlar birleşimde yeniden kurulur.
+    """
+    chunks = list(iter_comment_chunks(filename, chunksize, columns))
+    if not chunks:
+        return compact_frame(pd.DataFrame({column: pd.Series(dtype=str) for column in (columns or COMMENT_COLUMNS)}))
+    if len(chunks) == 1:
+        return chunks[0]
+
+    categorical = [column for column in chunks[0].columns if column in CATEGORICAL_COLUMNS]
+    table = pd.concat([chunk.drop(columns=categorical) for chunk in chunks], ignore_index=True)
+    for column in categorical:
+        table[column] = union_categoricals([chunk[column] for chunk in chunks], ignore_order=True)
+    return table[list(chunks[0].columns)]
+
+
+def column_values(table: 'pd.DataFrame', column: str, default=''):
+    """Tablo sütununun Python değerleri; sütun dosyada yoksa her satır için default"""
+    if column not in table.columns:
+        return [default] * len(table)
+    return table[column].tolist()
+
+
+def frame_records(frame: 'pd.DataFrame', skip_empty: bool = False) -> List[Dict]:
+    """
+    Yoğun tipli tablodan sözlük kayıtları (sözlük bekleyen analizciler için).
+    Sözlükler sütun listelerinden kurulur; metin ve kategorik sütunlar str, puan csv'deki gibi
+    metin ('' = boş), date_epoch epoch saniye ya da None olur.
+    """
+    if skip_empty and 'comment' in frame.columns:
+        frame = frame[frame['comment'].str.strip() != '']
+    columns = {}
+    for column in frame.columns:
+        if column == 'rating':
+            columns[column] = frame[column].astype('string').fillna('').tolist()
+        elif column == 'date_epoch':
+            columns[column] = frame[column].to_numpy(dtype=object, na_value=None).tolist()
+        else:
+            columns[column] = frame[column].tolist()
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def _iter_csv_records(filename: str, skip_empty: bool = False) -> Iterator[Dict[str, str]]:
+    """pandas yokken yedek yol: csv.DictReader satırları (tarih yine bir kez epoch'a çevrilir)"""
+    with open(filename, 'r', encoding='utf-8-sig') as csvfile:
+        for record in csv.DictReader(csvfile):
+            if skip_empty and not (record.get('comment') or '').strip():
+                continue
+            if 'date' in record:
+                record['date_epoch'] = parse_date(record['date'] or '')
+            yield record
+
+
+def iter_comment_records(filename: str, skip_empty: bool = False,
+                         chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Yorumları sözlük olarak üret; sözlükler yoğun tipli tablo parçalarının sütunlarından kurulur
+    (bkz. iter_comment_chunks), bellekte sadece o anki parça tutulur.
+    filename bir klasörse Parquet yorum deposu okunur.
+    """
+    if not PANDAS_AVAILABLE:
+        yield from _iter_csv_records(filename, skip_empty)
+        return
+    for chunk in iter_comment_chunks(filename, chunksize):
+        yield from frame_records(chunk, skip_empty)
+
+
+def load_comment_records(filename: str, skip_empty: bool = False) -> List[Dict]:
+    """Tüm yorumları sözlük listesi olarak yükle (sözlük bekleyen analizciler için)"""
+    return list(iter_comment_records(filename, skip_empty=skip_empty))
@@ -0,0 +1,199 @@
+import os
+import re
+import uuid
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from turkish_dates import parse_date_column, recency_cutoff
+
+# Parquet/Arrow (opsiyonel); yoksa CSV yükleyicisi kullanılmaya devam eder
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+DEFAULT_STORE_DIR = 'comment_store'
+# Dosyalar yorum tarihine göre sıralı yazılır; satır grubu istatistikleri tarih filtresinde
+# okunmayacak grupları eler
+DEFAULT_ROW_GROUP_SIZE = 20000
+DEFAULT_COMPRESSION = 'zstd'
+
+_PRODUCT_ID = re.compile(r'-p-(\d+)')
+_UNSAFE = re.compile(r'[^\w-]+')
+
+if ARROW_AVAILABLE:
+    STORE_SCHEMA = pa.schema([
+        ('user', pa.string()),
+        ('date', pa.string()),
+        ('comment', pa.string()),
+        ('rating', pa.int8()),
+        ('seller', pa.string()),
+        ('source', pa.string()),
+        ('date_epoch', pa.int64()),
+    ])
+    PARTITION_SCHEMA = pa.schema([('product', pa.string()), ('scrape_date', pa.date32())])
+    DATASET_SCHEMA = pa.unify_schemas([STORE_SCHEMA, PARTITION_SCHEMA])
+
+
+def product_key(product: str) -> str:
+    """
+    Ürün URL'sini veya adını klasör adı olarak güvenli bir anahtara çevir.
+    Trendyol URL'lerinde '-p-<id>' varsa ürün ID'si kullanılır.
+    """
+    match = _PRODUCT_ID.search(product or '')
+    if match:
+        return match.group(1)
+    key = _UNSAFE.sub('-', (product or '').strip()).strip('-').lower()
+    return key or 'bilinmiyor'
+
+
+def _as_date(value: Union[str, date, datetime, None]) -> Optional[date]:
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(value)
+
+
+def _rating(value) -> Optional[int]:
+    text = str(value if value is not None else '').strip()
+    return int(text) if text.isdigit() and int(text) <= 127 else None
+
+
+def _record(row: Dict) -> Dict:
+    """Depodan okunan satırı CSV sözlük biçimine getir (puan metin, boşlar '')"""
+    if 'rating' in row:
+        row['rating'] = '' if row['rating'] is None else str(row['rating'])
+    if isinstance(row.get('scrape_date'), date):
+        row['scrape_date'] = row['scrape_date'].isoformat()
+    return row
+
+
+class CommentStore:
+    """
+    Ürün ve çekim gününe göre bölümlenmiş Parquet yorum deposu:
+    <root>/product=<ürün>/scrape_date=<YYYY-MM-DD>/part-*.parquet (zstd).
+    Kazıyıcılar her çekimi yeni bir dosya olarak ekler; okuyucular sütun ve filtreleri
+    Arrow'a iletir, böylece sadece gereken bölümler ve satır grupları okunur.
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE_DIR, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 compression: str = DEFAULT_COMPRESSION):
+        if not ARROW_AVAILABLE:
+            raise ImportError("Yorum deposu için pyarrow gerekli")
+        self.root = root
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+    def append(self, comments: Iterable[Dict], product: str,
+               scrape_date: Union[str, date, datetime, None] = None) -> int:
+        """Yorumları ürünün o günkü bölümüne yeni bir dosya olarak ekle; yazılan satır sayısı döner"""
+        comments = list(comments)
+        if not comments:
+            return 0
+
+        epochs = parse_date_column(str(comment.get('date', '') or '') for comment in comments)
+        order = sorted(range(len(comments)), key=lambda i: (epochs[i] is None, epochs[i] or 0))
+        columns = {
+            column: [str(comments[i].get(column, '') or '') for i in order]
+            for column in ('user', 'date', 'comment', 'seller', 'source')
+        }
+        columns['rating'] = [_rating(comments[i].get('rating')) for i in order]
+        columns['date_epoch'] = [epochs[i] for i in order]
+        table = pa.Table.from_pydict(columns, schema=STORE_SCHEMA)
+
+        scrape_date = _as_date(scrape_date) or date.today()
+        partition = os.path.join(self.root, f"product={product_key(product)}", f"scrape_date={scrape_date.isoformat()}")
+        os.makedirs(partition, exist_ok=True)
+        pq.write_table(
+            table, os.path.join(partition, f"part-{uuid.uuid4().hex}.parquet"),
+            row_group_size=self.row_group_size, compression=self.compression
+        )
+        return len(comments)
+
+    def import_csv(self, filename: str, product: str,
+                   scrape_date: Union[str, date, datetime, None] = None) -> int:
+        """Eski CSV dosyasını depoya aktar (çekim tarihi verilmezse dosyanın değişme günü)"""
+        from comment_loader import iter_comment_records
+
+        if scrape_date is None:
+            scrape_date = datetime.fromtimestamp(os.path.getmtime(filename)).date()
+        return self.append(iter_comment_records(filename), product, scrape_date)
+
+    def dataset(self) -> 'ds.Dataset':
+        return ds.dataset(self.root, schema=DATASET_SCHEMA, format='parquet',
+                          partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'))
+
+    def products(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root) if name.startswith('product='))
+
+    def build_filter(self, product: Optional[str] = None, since: Union[str, date, datetime, None] = None,
+                     until: Union[str, date, datetime, None] = None, days: Optional[int] = None,
+                     min_rating: Optional[int] = None, max_rating: Optional[int] = None):
+        """
+        Arrow filtre ifadesi. since/until çekim gününe (bölüm), days yorum tarihine göre süzer.
+        Son `days` günün yorumları daha eski bir çekimde olamayacağı için çekim günü bölümleri de elenir.
+        """
+        conditions = []
+        if product:
+            conditions.append(pc.field('product') == product_key(product))
+        if since is not None:
+            conditions.append(pc.field('scrape_date') >= _as_date(since))
+        if until is not None:
+            conditions.append(pc.field('scrape_date') <= _as_date(until))
+        if days is not None:
+            cutoff = recency_cutoff(days)
+            conditions.append(pc.field('scrape_date') >= datetime.fromtimestamp(cutoff).date())
+            conditions.append(pc.field('date_epoch') >= cutoff)
+        if min_rating is not None:
+            conditions.append(pc.field('rating') >= min_rating)
+        if max_rating is not None:
+            conditions.append(pc.field('rating') <= max_rating)
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def read_table(self, columns: Optional[Sequence[str]] = None, **filters) -> 'pa.Table':
+        """Filtrelenmiş yorumları Arrow tablosu olarak oku (sütun ve filtreler dosyalara iletilir)"""
+        if not os.path.isdir(self.root):
+            table = DATASET_SCHEMA.empty_table()
+            return table.select(list(columns)) if columns else table
+        return self.dataset().to_table(columns=list(columns) if columns else None, filter=self.build_filter(**filters))
+
+    def read_frame(self, columns: Optional[Sequence[str]] = None, **filters):
+        """Filtrelenmiş yorumları yoğun tipli DataFrame olarak oku (comment_loader tablosuyla aynı tipler)"""
+        from comment_loader import compact_frame
+
+        return compact_frame(self.read_table(columns, **filters).to_pandas())
+
+    def iter_frames(self, columns: Optional[Sequence[str]] = None, **filters):
+        """Filtrelenmiş yorumları yoğun tipli DataFrame parçaları olarak üret (depo belleğe alınmaz)"""
+        from comment_loader import compact_frame
+
+        if not os.path.isdir(self.root):
+            return
+        scanner = self.dataset().scanner(columns=list(columns) if columns else None, filter=self.build_filter(**filters))
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield compact_frame(batch.to_pandas())
+
+    def iter_records(self, columns: Optional[Sequence[str]] = None, **filters) -> Iterator[Dict]:
+        """Filtrelenmiş yorumları CSV sözlükleriyle aynı biçimde, parça parça üret"""
+        if not os.path.isdir(self.root):
+            return
+        scanner = self.dataset().scanner(columns=list(columns) if columns else None, filter=self.build_filter(**filters))
+        for batch in scanner.to_batches():
+            for row in batch.to_pylist():
+                yield _record(row)
+
+    def read_records(self, columns: Optional[Sequence[str]] = None, **filters) -> List[Dict]:
+        return list(self.iter_records(columns, **filters))
+
@@ -1,8 +1,16 @@
-import csv
+import io
 import json
 from collections import Counter
 import re
 from datetime import datetime
+from comment_loader import iter_comment_records
+from keyword_extractor import get_document_term_matrix
+from lexicon_sentiment import SentimentLexicon
+from pipeline_profiler import profiled
+from rule_set import get_rule_set
+from summary_accumulator import SummaryAccumulator
+from turkish_dates import comment_epoch
+from turkish_text import normalize_text, word_tokens
 
 class CommentSummarizer:
     def __init__(self):
@@ -14,62 +22,94 @@ class CommentSummarizer:
             'hediye', 'olarak', 'tavsiye', 'ediyorum', 'ediyoruz', 'güvenilir',
             'sorunsuz', 'memnun', 'kaldık', 'kaldım', 'çok', 'çok', 'çok'
         }
+        
+        # Duygu analizi kelimeleri
+        self.sentiment_words = {
+            'positive': {
+                'güzel', 'iyi', 'mükemmel', 'harika', 'süper', 'kaliteli', 'hızlı', 'sağlam',
+                'beğendik', 'beğendi', 'memnun', 'tavsiye', 'teşekkür', 'orijinal', 'sorunsuz'
+            },
+            'negative': {
+                'kötü', 'berbat', 'kırık', 'bozuk', 'yavaş', 'sorun', 'problem', 'memnun değil',
+                'beğenmedim', 'tavsiye etmem', 'para israfı', 'kandırıldım'
+            }
+        }
+        
+        # Özet paragrafındaki öne çıkan ifadeler
+        self.summary_phrases = {
+            'positive': [
+                'fiyat performans', 'kalite', 'hızlı kargo', 'mükemmel', 'harika', 'sağlam', 'memnun', 'tavsiye', 'güzel', 'iyi', 'orijinal', 'teşekkür', 'uygun fiyat', 'paketleme güzel', 'beklentiyi karşıladı', 'beğendim', 'beğendik', 'süper', 'kaliteli', 'sorunsuz'
+            ],
+            'negative': [
+                'kargo yavaş', 'kırık', 'bozuk', 'geç geldi', 'sorun', 'problem', 'memnun değilim', 'beğenmedim', 'tavsiye etmem', 'para israfı', 'kandırıldım', 'kalitesiz', 'eksik', 'hasarlı', 'paketleme kötü', 'iade', 'uygun değil', 'berbat', 'kötü', 'yavaş'
+            ]
+        }
+        
+        # Artı/eksi özellik ifadeleri
+        self.pros_cons_phrases = {
+            'positive': [
+                'fiyat performans', 'kalite', 'hızlı kargo', 'mükemmel', 'harika', 'sağlam', 'memnun', 'tavsiye',
+                'güzel', 'iyi', 'orijinal', 'teşekkür', 'uygun fiyat', 'paketleme güzel', 'beklentiyi karşıladı',
+                'beğendim', 'beğendik', 'süper', 'kaliteli', 'sorunsuz', 'kullanışlı', 'bayıldı', 'hemen geldi',
+                'indirimli', 'uygun fiyatlı', 'hızlı teslimat', 'hediye', 'beğendi', 'çok güzel', 'çok iyi'
+            ],
+            'negative': [
+                'kargo yavaş', 'kırık', 'bozuk', 'geç geldi', 'sorun', 'problem', 'memnun değilim', 'beğenmedim',
+                'tavsiye etmem', 'para israfı', 'kandırıldım', 'kalitesiz', 'eksik', 'hasarlı', 'paketleme kötü',
+                'iade', 'uygun değil', 'berbat', 'kötü', 'yavaş', 'küçük geldi', 'büyük geldi', 'renk farklı',
+                'model farklı', 'uyumsuz', 'beden olmadı', 'beden küçük', 'beden büyük', 'renk soluk', 'eksik parça'
+            ]
+        }
+        
+        # Kategori kümeleri (beden/uyum ve renk/model opsiyonel) ve tekstil kelimeleri analysis_rules.json'dan
+        # gelir (bkz. rule_set); ifade listeleri kural setinin ortak otomatına kaydedilir
+        get_rule_set().keyword_matcher.register('summarizer', {
+            'sentiment': self.sentiment_words,
+            'summary_phrases': self.summary_phrases,
+            'pros_cons': self.pros_cons_phrases,
+        })
+        # Toplu duygu puanlaması için derlenmiş sözlük (aynı kelime listeleri)
+        self.sentiment_lexicon = SentimentLexicon.from_word_lists(self.sentiment_words, name='summarizer')
+        # generate_insights kendi kısa listeleriyle puanlar (içgörü yüzdeleri bu listelere göre)
+        self.insight_lexicon = SentimentLexicon.from_word_lists({
+            'positive': ['güzel', 'iyi', 'mükemmel', 'harika', 'süper', 'kaliteli', 'hızlı', 'sağlam'],
+            'negative': ['kötü', 'berbat', 'kırık', 'bozuk', 'yavaş', 'sorun', 'problem']
+        }, name='summarizer_insights')
+    
+    @property
+    def keyword_matcher(self):
+        return get_rule_set().keyword_matcher
+    
+    @property
+    def summary_categories(self):
+        return get_rule_set().summary_categories
+    
+    @property
+    def beden_renk_categories(self):
+        return get_rule_set().beden_renk_categories
+    
+    @property
+    def textile_keywords(self):
+        return get_rule_set().textile_keywords
     
     def load_comments_from_csv(self, filename):
         """CSV dosyasından yorumları yükler"""
-        comments = []
         try:
-            with open(filename, 'r', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    comments.append(row)
+            comments = list(self.iter_comments_from_csv(filename))
             print(f"{len(comments)} yorum yüklendi: {filename}")
             return comments
         except Exception as e:
             print(f"CSV dosyası okuma hatası: {e}")
             return []
     
+    def iter_comments_from_csv(self, filename):
+        """CSV dosyasındaki yorumları satır satır üretir (dosya belleğe alınmaz)"""
+        yield from iter_comment_records(filename)
+    
     def load_comments_from_txt(self, filename):
         """TXT dosyasından yorumları yükler"""
-        comments = []
         try:
-            with open(filename, 'r', encoding='utf-8') as txtfile:
-                content = txtfile.read()
-                
-            # Yorumları parse et
-            comment_blocks = content.split('=== YORUM')
-            
-            for block in comment_blocks[1:]:  # İlk boş bloğu atla
-                comment_data = {}
-                
-                # Kullanıcı
-                user_match = re.search(r'Kullanıcı:\s*(.+)', block)
-                if user_match:
-                    comment_data['user'] = user_match.group(1).strip()
-                
-                # Tarih
-                date_match = re.search(r'Tarih:\s*(.+)', block)
-                if date_match:
-                    comment_data['date'] = date_match.group(1).strip()
-                
-                # Puan
-                rating_match = re.search(r'Puan:\s*(.+)', block)
-                if rating_match:
-                    comment_data['rating'] = rating_match.group(1).strip()
-                
-                # Satıcı
-                seller_match = re.search(r'Satıcı:\s*(.+)', block)
-                if seller_match:
-                    comment_data['seller'] = seller_match.group(1).strip()
-                
-                # Yorum
-                comment_match = re.search(r'Yorum:\s*(.+)', block, re.DOTALL)
-                if comment_match:
-                    comment_data['comment'] = comment_match.group(1).strip()
-                
-                if comment_data.get('comment'):
-                    comments.append(comment_data)
-            
+            comments = list(self.iter_comments_from_txt(filename))
             print(f"{len(comments)} yorum yüklendi: {filename}")
             return comments
             
@@ -77,93 +117,115 @@ class CommentSummarizer:
             print(f"TXT dosyası okuma hatası: {e}")
             return []
     
-    def clean_text(self, text):
-        """Metni temizler ve normalize eder"""
-        if not text:
-            return ""
-        
-        # Küçük harfe çevir
-        text = text.lower()
+    def iter_comments_from_txt(self, filename):
+        """
+        TXT dosyasındaki yorumları '=== YORUM' bloklarına ayırarak tek tek üretir.
+        Dosya satır satır okunur; bellekte sadece o anki blok tutulur.
+        """
+        block = []
+        started = False
+        with open(filename, 'r', encoding='utf-8') as txtfile:
+            for line in txtfile:
+                if '=== YORUM' not in line:
+                    block.append(line)
+                    continue
+                
+                parts = line.split('=== YORUM')
+                block.append(parts[0])
+                # İlk ayraçtan önceki kısım yorum bloğu değildir
+                for text in [''.join(block)] + parts[1:-1]:
+                    if started:
+                        comment_data = self._parse_txt_block(text)
+                        if comment_data.get('comment'):
+                            yield comment_data
+                    started = True
+                block = [parts[-1]]
         
-        # Türkçe karakterleri normalize et
-        text = text.replace('ı', 'i').replace('ğ', 'g').replace('ü', 'u').replace('ş', 's').replace('ö', 'o').replace('ç', 'c')
+        if started:
+            comment_data = self._parse_txt_block(''.join(block))
+            if comment_data.get('comment'):
+                yield comment_data
+    
+    def _parse_txt_block(self, block):
+        """Tek '=== YORUM' bloğunu yorum sözlüğüne çevirir"""
+        comment_data = {}
         
-        # Özel karakterleri kaldır
-        text = re.sub(r'[^\w\s]', ' ', text)
+        # Kullanıcı
+        user_match = re.search(r'Kullanıcı:\s*(.+)', block)
+        if user_match:
+            comment_data['user'] = user_match.group(1).strip()
         
-        # Fazla boşlukları temizle
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Tarih
+        date_match = re.search(r'Tarih:\s*(.+)', block)
+        if date_match:
+            comment_data['date'] = date_match.group(1).strip()
         
-        return text
-    
-    def extract_keywords(self, comments, min_frequency=2):
-        """Yorumlardan anahtar kelimeleri çıkarır"""
-        all_words = []
+        # Puan
+        rating_match = re.search(r'Puan:\s*(.+)', block)
+        if rating_match:
+            comment_data['rating'] = rating_match.group(1).strip()
         
-        for comment in comments:
-            if isinstance(comment, str):
-                text = comment
-            else:
-                text = comment.get('comment', '')
-            
-            if text:
-                # Metni temizle
-                clean_text = self.clean_text(text)
-                
-                # Kelimelere ayır
-                words = clean_text.split()
-                
-                # Stop words'leri filtrele
-                filtered_words = [word for word in words if word not in self.stop_words and len(word) > 2]
-                
-                all_words.extend(filtered_words)
+        # Satıcı
+        seller_match = re.search(r'Satıcı:\s*(.+)', block)
+        if seller_match:
+            comment_data['seller'] = seller_match.group(1).strip()
         
-        # Kelime frekanslarını hesapla
-        word_freq = Counter(all_words)
+        # Yorum
+        comment_match = re.search(r'Yorum:\s*(.+)', block, re.DOTALL)
+        if comment_match:
+            comment_data['comment'] = comment_match.group(1).strip()
         
-        # Minimum frekans filtresi uygula
-        keywords = {word: freq for word, freq in word_freq.items() if freq >= min_frequency}
+        return comment_data
+    
+    def clean_text(self, text):
+        """Metni temizler ve normalize eder (ortak turkish_text katmanı; aynı metin tekrar işlenmez)"""
+        return normalize_text(text)
+    
+    def is_keyword(self, word):
+        """Anahtar kelime adayı mı: stop word değil ve 2 harften uzun"""
+        return word not in self.stop_words and len(word) > 2
+    
+    def keyword_tokens(self, text):
+        """Anahtar kelime adayları: temizlenmiş metnin stop word olmayan, 2 harften uzun kelimeleri"""
+        return [word for word in word_tokens(text) if self.is_keyword(word)]
+    
+    def _keyword_matrix(self, comments):
+        texts = [(comment if isinstance(comment, str) else comment.get('comment', '')) or '' for comment in comments]
+        # Stop word / uzunluk filtresi token başına değil, sözlükteki her kelime için bir kez uygulanır
+        return get_document_term_matrix(
+            texts, lambda texts: [word_tokens(text) for text in texts], 'summarizer_keywords', keep=self.is_keyword
+        )
+    
+    @profiled('summarizer.extract_keywords', items='comments')
+    def extract_keywords(self, comments, min_frequency=2, top_k=None):
+        """Yorumlardan anahtar kelimeleri çıkarır (top_k verilirse sadece en sık k kelime)"""
+        keywords = self._keyword_matrix(comments).top_terms(top_k, min_frequency)
         
         # UI için format
-        formatted_keywords = []
-        for word, freq in sorted(keywords.items(), key=lambda x: x[1], reverse=True):
-            formatted_keywords.append({
-                'word': word,
-                'frequency': freq
-            })
-        
-        return formatted_keywords
+        return [{'word': word, 'frequency': freq} for word, freq in keywords]
     
-    def analyze_sentiment(self, comments):
-        """Basit duygu analizi yapar"""
-        positive_words = {
-            'güzel', 'iyi', 'mükemmel', 'harika', 'süper', 'kaliteli', 'hızlı', 'sağlam',
-            'beğendik', 'beğendi', 'memnun', 'tavsiye', 'teşekkür', 'orijinal', 'sorunsuz'
-        }
-        
-        negative_words = {
-            'kötü', 'berbat', 'kırık', 'bozuk', 'yavaş', 'sorun', 'problem', 'memnun değil',
-            'beğenmedim', 'tavsiye etmem', 'para israfı', 'kandırıldım'
+    @profiled('summarizer.keywords_by_group', items='comments')
+    def keywords_by_group(self, comments, group_key='seller', top_k=10, min_frequency=1):
+        """Her grup (satıcı, ürün, kategori...) için en sık anahtar kelimeler; tek matris çarpımıyla"""
+        groups = [comment.get(group_key, 'Bilinmiyor') for comment in comments]
+        tables = self._keyword_matrix(comments).group_top_terms(groups, top_k, min_frequency)
+        return {
+            group: [{'word': word, 'frequency': freq} for word, freq in keywords]
+            for group, keywords in tables.items()
         }
+    
+    @profiled('summarizer.analyze_sentiment', items='comments')
+    def analyze_sentiment(self, comments):
+        """Basit duygu analizi yapar (tüm yorumlar tek seferde puanlanır)"""
+        texts = [comment.get('comment', '') for comment in comments]
+        counts = self.sentiment_lexicon.label_counts([text for text in texts if text])
+        positive_count, negative_count, neutral_count = counts['positive'], counts['negative'], counts['neutral']
         
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        
-        for comment in comments:
-            text = comment.get('comment', '').lower()
-            if text:
-                pos_score = sum(1 for word in positive_words if word in text)
-                neg_score = sum(1 for word in negative_words if word in text)
-                
-                if pos_score > neg_score:
-                    positive_count += 1
-                elif neg_score > pos_score:
-                    negative_count += 1
-                else:
-                    neutral_count += 1
-        
-        total = len(comments)
+        return self.sentiment_stats(positive_count, negative_count, neutral_count, len(comments))
+    
+    @staticmethod
+    def sentiment_stats(positive_count, negative_count, neutral_count, total):
+        """Duygu sayılarından yüzdeli özet"""
         if total > 0:
             return {
                 'positive_percentage': round((positive_count / total) * 100, 2),
@@ -178,17 +240,22 @@ class CommentSummarizer:
     
     def analyze_ratings(self, comments):
         """Puan analizi yapar"""
-        ratings = []
+        ratings = Counter()
         for comment in comments:
             rating = comment.get('rating', '')
             if rating and rating.isdigit():
-                ratings.append(int(rating))
-        
-        if ratings:
+                ratings[int(rating)] += 1
+        return self.rating_stats(ratings)
+    
+    @staticmethod
+    def rating_stats(rating_counts):
+        """Puan -> adet sayacından ortalama ve dağılım"""
+        total = sum(rating_counts.values())
+        if total:
             return {
-                'average_rating': round(sum(ratings) / len(ratings), 2),
-                'total_ratings': len(ratings),
-                'rating_distribution': dict(Counter(ratings))
+                'average_rating': round(sum(rating * count for rating, count in rating_counts.items()) / total, 2),
+                'total_ratings': total,
+                'rating_distribution': dict(rating_counts)
             }
         return {}
     
@@ -305,33 +372,34 @@ class CommentSummarizer:
         if not comments:
             return "No comments found."
 
-        positive_phrases = [
-            'fiyat performans', 'kalite', 'hızlı kargo', 'mükemmel', 'harika', 'sağlam', 'memnun', 'tavsiye', 'güzel', 'iyi', 'orijinal', 'teşekkür', 'uygun fiyat', 'paketleme güzel', 'beklentiyi karşıladı', 'beğendim', 'beğendik', 'süper', 'kaliteli', 'sorunsuz'
-        ]
-        negative_phrases = [
-            'kargo yavaş', 'kırık', 'bozuk', 'geç geldi', 'sorun', 'problem', 'memnun değilim', 'beğenmedim', 'tavsiye etmem', 'para israfı', 'kandırıldım', 'kalitesiz', 'eksik', 'hasarlı', 'paketleme kötü', 'iade', 'uygun değil', 'berbat', 'kötü', 'yavaş'
-        ]
+        positive_phrases = self.summary_phrases['positive']
+        negative_phrases = self.summary_phrases['negative']
 
         pos_counter = {}
         neg_counter = {}
 
         for comment in comments:
-            text = self.clean_text(comment.get('comment', ''))
+            found = self.keyword_matcher.find(self.clean_text(comment.get('comment', '')))
             for phrase in positive_phrases:
-                if phrase in text:
+                if phrase in found:
                     pos_counter[phrase] = pos_counter.get(phrase, 0) + 1
             for phrase in negative_phrases:
-                if phrase in text:
+                if phrase in found:
                     neg_counter[phrase] = neg_counter.get(phrase, 0) + 1
 
+        return self.format_summary_paragraph(
+            pos_counter, neg_counter, self.analyze_sentiment(comments), self.analyze_ratings(comments)
+        )
+
+    @staticmethod
+    def format_summary_paragraph(pos_counter, neg_counter, sentiment, ratings):
+        """İfade sayaçları, duygu ve puan özetinden genel değerlendirme paragrafını üret"""
         top_pos = sorted(pos_counter.items(), key=lambda x: x[1], reverse=True)[:3]
         top_neg = sorted(neg_counter.items(), key=lambda x: x[1], reverse=True)[:3]
 
         pos_examples = [f'"{phrase}"' for phrase, count in top_pos if count > 0]
         neg_examples = [f'"{phrase}"' for phrase, count in top_neg if count > 0]
 
-        sentiment = self.analyze_sentiment(comments)
-        ratings = self.analyze_ratings(comments)
         pos = sentiment.get('positive_percentage', 0)
         neg = sentiment.get('negative_percentage', 0)
         neu = sentiment.get('neutral_percentage', 0)
@@ -364,36 +432,32 @@ class CommentSummarizer:
 
         return paragraph
 
+    @profiled('summarizer.extract_pros_cons', items='comments')
     def extract_pros_cons(self, comments, top_n=5):
         """
         Yorumlardan en sık geçen artı (pros) ve eksi (cons) özellikleri madde madde çıkarır.
         """
         # Pozitif ve negatif anahtar ifadeler
-        positive_phrases = [
-            'fiyat performans', 'kalite', 'hızlı kargo', 'mükemmel', 'harika', 'sağlam', 'memnun', 'tavsiye',
-            'güzel', 'iyi', 'orijinal', 'teşekkür', 'uygun fiyat', 'paketleme güzel', 'beklentiyi karşıladı',
-            'beğendim', 'beğendik', 'süper', 'kaliteli', 'sorunsuz', 'kullanışlı', 'bayıldı', 'hemen geldi',
-            'indirimli', 'uygun fiyatlı', 'hızlı teslimat', 'hediye', 'beğendi', 'çok güzel', 'çok iyi'
-        ]
-        negative_phrases = [
-            'kargo yavaş', 'kırık', 'bozuk', 'geç geldi', 'sorun', 'problem', 'memnun değilim', 'beğenmedim',
-            'tavsiye etmem', 'para israfı', 'kandırıldım', 'kalitesiz', 'eksik', 'hasarlı', 'paketleme kötü',
-            'iade', 'uygun değil', 'berbat', 'kötü', 'yavaş', 'küçük geldi', 'büyük geldi', 'renk farklı',
-            'model farklı', 'uyumsuz', 'beden olmadı', 'beden küçük', 'beden büyük', 'renk soluk', 'eksik parça'
-        ]
+        positive_phrases = self.pros_cons_phrases['positive']
+        negative_phrases = self.pros_cons_phrases['negative']
 
         pros_counter = {}
         cons_counter = {}
 
         for comment in comments:
-            text = self.clean_text(comment.get('comment', ''))
+            found = self.keyword_matcher.find(self.clean_text(comment.get('comment', '')))
             for phrase in positive_phrases:
-                if phrase in text:
+                if phrase in found:
                     pros_counter[phrase] = pros_counter.get(phrase, 0) + 1
             for phrase in negative_phrases:
-                if phrase in text:
+                if phrase in found:
                     cons_counter[phrase] = cons_counter.get(phrase, 0) + 1
 
+        return self.format_pros_cons(pros_counter, cons_counter, top_n)
+
+    @staticmethod
+    def format_pros_cons(pros_counter, cons_counter, top_n=5):
+        """Artı/eksi ifade sayaçlarından en sık geçenlerin listesi"""
         top_pros = sorted(pros_counter.items(), key=lambda x: x[1], reverse=True)[:top_n]
         top_cons = sorted(cons_counter.items(), key=lambda x: x[1], reverse=True)[:top_n]
 
@@ -405,136 +469,201 @@ class CommentSummarizer:
             'cons': cons_list
         }
 
+    @profiled('summarizer.category_analysis', items='comments')
     def category_analysis(self, comments, include_beden_renk=False, top_n=3):
         """
         Kalite, kargo, fiyat, beden/uyum, renk/model gibi kategoriler için anahtar kelime kümeleriyle analiz yapar.
         Beden/uyum ve renk/model analizleri opsiyoneldir.
         """
-        categories = {
-            'kalite': ['kalite', 'kaliteli', 'kalitesiz', 'sağlam', 'dayanıklı', 'bozuk', 'kırık', 'hasarlı', 'orijinal'],
-            'kargo': ['kargo', 'hızlı kargo', 'geç geldi', 'hızlı teslimat', 'yavaş', 'paketleme', 'paketleme güzel', 'paketleme kötü', 'teslimat'],
-            'fiyat': ['fiyat', 'uygun fiyat', 'pahalı', 'indirim', 'fiyat performans', 'indirimli', 'ucuz', 'değer', 'para israfı'],
-        }
+        categories = dict(self.summary_categories)
         if include_beden_renk:
-            categories['beden_uyum'] = ['beden', 'uyum', 'uydu', 'olmadı', 'küçük geldi', 'büyük geldi', 'tam oldu', 'uyumsuz', 'beden küçük', 'beden büyük']
-            categories['renk_model'] = ['renk', 'model', 'renk farklı', 'model farklı', 'renk soluk', 'renk canlı', 'desen', 'görseldeki gibi', 'görselden farklı']
+            categories.update(self.beden_renk_categories)
+
+        # Her yorum bir kez temizlenip taranır, kategoriler bulunan kelime kümesini paylaşır
+        scanned = []
+        for comment in comments:
+            text = comment.get('comment', '')
+            scanned.append((text, self.keyword_matcher.find(self.clean_text(text))))
 
         results = {}
         for cat, keywords in categories.items():
             count = 0
             example_sentences = []
-            for comment in comments:
-                text = comment.get('comment', '')
-                clean = self.clean_text(text)
-                for kw in keywords:
-                    if kw in clean:
-                        count += 1
-                        if len(example_sentences) < top_n:
-                            # Orijinal cümleyi ekle
-                            example_sentences.append(text.strip()[:120] + ("..." if len(text.strip()) > 120 else ""))
-                        break
+            for text, found in scanned:
+                if any(kw in found for kw in keywords):
+                    count += 1
+                    if len(example_sentences) < top_n:
+                        # Orijinal cümleyi ekle
+                        example_sentences.append(text.strip()[:120] + ("..." if len(text.strip()) > 120 else ""))
             results[cat] = {
                 'count': count,
                 'examples': example_sentences
             }
         return results
 
+    def is_textile_product(self, comments):
+        """Yorumlarda tekstil ürünlerine özgü kelimeler geçiyor mu kontrol eder"""
+        # Yorum metinlerini birleştir
+        all_comment_text = " ".join([comment.get('comment', '').lower() for comment in comments])
+        
+        # Tekstil anahtar kelimelerinden herhangi biri geçiyor mu?
+        found = self.keyword_matcher.find(all_comment_text, use_cache=False)
+        return any(keyword in found for keyword in self.textile_keywords)
+
+    @profiled('summarizer.generate_ai_summary', items='comments')
     def generate_ai_summary(self, comments, include_beden_renk=False):
         """
         AI Destekli Özet: Genel değerlendirme, artı/eksi özellikler, kategorik analiz, opsiyonel beden/uyum ve renk/model, satıcı değerlendirmesi.
         """
-        summary = {}
-        # Genel ürün değerlendirmesi (tek paragraf)
-        summary['genel_degerlendirme'] = self.generate_summary_paragraph(comments)
-        # Artı/Eksi özellikler
-        summary['arti_eksi_ozellikler'] = self.extract_pros_cons(comments)
-        # Kategorik analiz
-        summary['kategorik_analiz'] = self.category_analysis(comments, include_beden_renk=include_beden_renk)
-        # Satıcı değerlendirmesi
-        summary['satici_degerlendirmesi'] = self.analyze_sellers(comments)
-        # Toplam yorum sayısı
-        summary['toplam_yorum'] = len(comments)
-        return summary
+        # Tüm bölümler (değerlendirme, artı/eksi, kategoriler, satıcılar) tek geçişte hesaplanır
+        accumulator = SummaryAccumulator(self, include_beden_renk=include_beden_renk)
+        accumulator.add_many(comments)
+        return accumulator.ai_summary()
 
-    def save_ai_summary_to_txt(self, summary, filename='comment_summary.txt'):
-        """AI özetini TXT dosyasına kaydeder"""
+    def partial_summary(self, comments, include_beden_renk=False, sample_examples=False):
+        """Bir parça yorum için birleştirilebilir kısmi özet (SummaryAccumulator)"""
+        return SummaryAccumulator(
+            self, include_beden_renk=include_beden_renk, sample_examples=sample_examples
+        ).add_many(comments)
+
+    def merge_partial_summaries(self, partials):
+        """
+        Kısmi özetleri (SummaryAccumulator veya to_dict durumu) sırasıyla birleştirir.
+        Örn. farklı süreçlerde özetlenen parçalar veya günlük özetlerden haftalık özet.
+        """
+        partials = [
+            partial if isinstance(partial, SummaryAccumulator) else SummaryAccumulator.from_dict(self, partial)
+            for partial in partials
+        ]
+        if not partials:
+            return SummaryAccumulator(self)
+        # Girdileri değiştirmemek için ilk parçanın kopyası üzerine birleştir
+        merged = SummaryAccumulator.from_dict(self, partials[0].to_dict())
+        for partial in partials[1:]:
+            merged.merge(partial)
+        return merged
+
+    def partial_summaries_by_day(self, comments, include_beden_renk=False):
+        """Yorumları gün bazında kısmi özetlere ayırır: {'YYYY-MM-DD': to_dict durumu}"""
+        by_day = {}
+        for comment in comments:
+            epoch = comment_epoch(comment)
+            day = datetime.fromtimestamp(epoch).strftime('%Y-%m-%d') if epoch is not None else 'bilinmiyor'
+            if day not in by_day:
+                by_day[day] = SummaryAccumulator(self, include_beden_renk=include_beden_renk)
+            by_day[day].add(comment)
+        return {day: accumulator.to_dict() for day, accumulator in sorted(by_day.items())}
+
+    @profiled('summarizer.summarize_stream')
+    def summarize_stream(self, comments, include_beden_renk=None, sample_examples=True):
+        """
+        Yorum üreticisinden (generator) sabit bellekle AI özeti üretir: sadece sayaçlar, puan
+        dağılımı ve rezervuar örneklemli kategori örnekleri tutulur.
+        include_beden_renk=None ise tekstil kelimeleri akış sırasında tespit edilir.
+        """
+        accumulator = SummaryAccumulator(self, include_beden_renk=include_beden_renk, sample_examples=sample_examples)
+        accumulator.add_many(comments)
+        return accumulator.ai_summary()
+
+    def summarize_file(self, filename, include_beden_renk=None, sample_examples=True):
+        """Büyük CSV/TXT yorum dosyasını belleğe almadan özetler"""
         try:
-            with open(filename, 'w', encoding='utf-8') as txtfile:
-                txtfile.write("AI Destekli Özet\n")
-                txtfile.write("="*20 + "\n\n")
+            if filename.lower().endswith('.txt'):
+                rows = self.iter_comments_from_txt(filename)
+            else:
+                rows = self.iter_comments_from_csv(filename)
+            summary = self.summarize_stream(rows, include_beden_renk=include_beden_renk, sample_examples=sample_examples)
+            print(f"{summary['toplam_yorum']} yorum özetlendi: {filename}")
+            return summary
+        except Exception as e:
+            print(f"Dosya özetleme hatası: {e}")
+            return {}
 
-                # Genel ürün değerlendirmesi
-                txtfile.write("Genel ürün değerlendirmesi\n")
-                txtfile.write("-" * 20 + "\n")
-                txtfile.write(summary.get('genel_degerlendirme', 'Değerlendirme bulunamadı.') + "\n\n")
+    def format_ai_summary_text(self, summary):
+        """AI özetini TXT formatında metin olarak döndürür"""
+        txtfile = io.StringIO()
+        txtfile.write("AI Destekli Özet\n")
+        txtfile.write("="*20 + "\n\n")
 
-                # Artı/eksi özellikler ayrımı
-                pros_cons = summary.get('arti_eksi_ozellikler', {})
-                txtfile.write("Artı/eksi özellikler ayrımı\n")
-                txtfile.write("-" * 20 + "\n")
-                txtfile.write("Artılar:\n")
-                if pros_cons.get('pros'):
-                    for pro in pros_cons['pros']:
-                        txtfile.write(f"- {pro}\n")
-                else:
-                    txtfile.write("- Belirgin bir artı özellik bulunamadı.\n")
-                txtfile.write("\nEksiler:\n")
-                if pros_cons.get('cons'):
-                    for con in pros_cons['cons']:
-                        txtfile.write(f"- {con}\n")
-                else:
-                    txtfile.write("- Belirgin bir eksi özellik bulunamadı.\n")
-                txtfile.write("\n")
+        # Genel ürün değerlendirmesi
+        txtfile.write("Genel ürün değerlendirmesi\n")
+        txtfile.write("-" * 20 + "\n")
+        txtfile.write(summary.get('genel_degerlendirme', 'Değerlendirme bulunamadı.') + "\n\n")
 
-                # Kalite, kargo, fiyat gibi kategorik analiz
-                kategorik = summary.get('kategorik_analiz', {})
-                txtfile.write("Kalite, kargo, fiyat gibi kategorik analiz\n")
-                txtfile.write("-" * 20 + "\n")
-                for kategori, data in kategorik.items():
-                    txtfile.write(f"{kategori.replace('_', ' ').title()}:\n")
-                    txtfile.write(f"  - {data.get('count', 0)} yorumda bahsedildi.\n")
-                    if data.get('examples'):
-                        txtfile.write("  - Örnek yorumlar:\n")
-                        for ex in data['examples']:
-                            txtfile.write(f'    -"{ex}"\n')
-                txtfile.write("\n")
-                
-                # Beden/uyum bilgileri (tekstil ürünleri için)
-                if 'beden_uyum' in kategorik:
-                    beden_uyum = kategorik['beden_uyum']
-                    txtfile.write("Beden/uyum bilgileri\n")
-                    txtfile.write("-" * 20 + "\n")
-                    txtfile.write(f"  - {beden_uyum.get('count', 0)} yorumda bahsedildi.\n")
-                    if beden_uyum.get('examples'):
-                        txtfile.write("  - Örnek yorumlar:\n")
-                        for ex in beden_uyum['examples']:
-                            txtfile.write(f'    -"{ex}"\n')
-                    txtfile.write("\n")
+        # Artı/eksi özellikler ayrımı
+        pros_cons = summary.get('arti_eksi_ozellikler', {})
+        txtfile.write("Artı/eksi özellikler ayrımı\n")
+        txtfile.write("-" * 20 + "\n")
+        txtfile.write("Artılar:\n")
+        if pros_cons.get('pros'):
+            for pro in pros_cons['pros']:
+                txtfile.write(f"- {pro}\n")
+        else:
+            txtfile.write("- Belirgin bir artı özellik bulunamadı.\n")
+        txtfile.write("\nEksiler:\n")
+        if pros_cons.get('cons'):
+            for con in pros_cons['cons']:
+                txtfile.write(f"- {con}\n")
+        else:
+            txtfile.write("- Belirgin bir eksi özellik bulunamadı.\n")
+        txtfile.write("\n")
 
-                # Renk/model varyasyonu yorumları
-                if 'renk_model' in kategorik:
-                    renk_model = kategorik['renk_model']
-                    txtfile.write("Renk/model varyasyonu yorumları\n")
-                    txtfile.write("-" * 20 + "\n")
-                    txtfile.write(f"  - {renk_model.get('count', 0)} yorumda bahsedildi.\n")
-                    if renk_model.get('examples'):
-                        txtfile.write("  - Örnek yorumlar:\n")
-                        for ex in renk_model['examples']:
-                            txtfile.write(f'    -"{ex}"\n')
-                    txtfile.write("\n")
+        # Kalite, kargo, fiyat gibi kategorik analiz
+        kategorik = summary.get('kategorik_analiz', {})
+        txtfile.write("Kalite, kargo, fiyat gibi kategorik analiz\n")
+        txtfile.write("-" * 20 + "\n")
+        for kategori, data in kategorik.items():
+            txtfile.write(f"{kategori.replace('_', ' ').title()}:\n")
+            txtfile.write(f"  - {data.get('count', 0)} yorumda bahsedildi.\n")
+            if data.get('examples'):
+                txtfile.write("  - Örnek yorumlar:\n")
+                for ex in data['examples']:
+                    txtfile.write(f'    -"{ex}"\n')
+        txtfile.write("\n")
+        
+        # Beden/uyum bilgileri (tekstil ürünleri için)
+        if 'beden_uyum' in kategorik:
+            beden_uyum = kategorik['beden_uyum']
+            txtfile.write("Beden/uyum bilgileri\n")
+            txtfile.write("-" * 20 + "\n")
+            txtfile.write(f"  - {beden_uyum.get('count', 0)} yorumda bahsedildi.\n")
+            if beden_uyum.get('examples'):
+                txtfile.write("  - Örnek yorumlar:\n")
+                for ex in beden_uyum['examples']:
+                    txtfile.write(f'    -"{ex}"\n')
+            txtfile.write("\n")
 
+        # Renk/model varyasyonu yorumları
+        if 'renk_model' in kategorik:
+            renk_model = kategorik['renk_model']
+            txtfile.write("Renk/model varyasyonu yorumları\n")
+            txtfile.write("-" * 20 + "\n")
+            txtfile.write(f"  - {renk_model.get('count', 0)} yorumda bahsedildi.\n")
+            if renk_model.get('examples'):
+                txtfile.write("  - Örnek yorumlar:\n")
+                for ex in renk_model['examples']:
+                    txtfile.write(f'    -"{ex}"\n')
+            txtfile.write("\n")
 
-                # Satıcı değerlendirmesi
-                satici = summary.get('satici_degerlendirmesi', {})
-                txtfile.write("Satıcı değerlendirmesi\n")
-                txtfile.write("-" * 20 + "\n")
-                if satici:
-                    for seller, count in satici.items():
-                        txtfile.write(f"- {seller}: {count} yorum\n")
-                else:
-                    txtfile.write("- Satıcı bilgisi bulunamadı.\n")
-                txtfile.write("\n")
 
+        # Satıcı değerlendirmesi
+        satici = summary.get('satici_degerlendirmesi', {})
+        txtfile.write("Satıcı değerlendirmesi\n")
+        txtfile.write("-" * 20 + "\n")
+        if satici:
+            for seller, count in satici.items():
+                txtfile.write(f"- {seller}: {count} yorum\n")
+        else:
+            txtfile.write("- Satıcı bilgisi bulunamadı.\n")
+        txtfile.write("\n")
+
+        return txtfile.getvalue()
+
+    def save_ai_summary_to_txt(self, summary, filename='comment_summary.txt'):
+        """AI özetini TXT dosyasına kaydeder"""
+        try:
+            with open(filename, 'w', encoding='utf-8') as txtfile:
+                txtfile.write(self.format_ai_summary_text(summary))
 
             print(f"AI özeti başarıyla kaydedildi: {filename}")
         except Exception as e:
@@ -607,22 +736,10 @@ class CommentSummarizer:
                     category_texts.append(text)
             
             if category_texts:
-                # Sentiment analizi
-                positive_count = 0
-                negative_count = 0
-                
-                positive_words = ['güzel', 'iyi', 'mükemmel', 'harika', 'süper', 'kaliteli', 'hızlı', 'sağlam']
-                negative_words = ['kötü', 'berbat', 'kırık', 'bozuk', 'yavaş', 'sorun', 'problem']
-                
-                for text in category_texts:
-                    text_lower = text.lower()
-                    pos_score = sum(1 for word in positive_words if word in text_lower)
-                    neg_score = sum(1 for word in negative_words if word in text_lower)
-                    
-                    if pos_score > neg_score:
-                        positive_count += 1
-                    elif neg_score > pos_score:
-                        negative_count += 1
+                # Sentiment analizi (kategori yorumları tek seferde)
+                counts = self.insight_lexicon.label_counts(category_texts)
+                positive_count = counts['positive']
+                negative_count = counts['negative']
                 
                 total = len(category_texts)
                 if total > 0:
@@ -743,13 +860,7 @@ def main():
     
     # AI Destekli Özet oluştur
     # Tekstil ürünü olup olmadığını anlamak için anahtar kelimeler
-    textile_keywords = ['beden', 'kalıp', 'giyim', 'elbise', 'pantolon', 'gömlek', 'etek', 'ceket', 'küçük geldi', 'büyük geldi']
-    
-    # Yorum metinlerini birleştir
-    all_comment_text = " ".join([comment.get('comment', '').lower() for comment in comments])
-    
-    # Tekstil anahtar kelimelerinden herhangi biri geçiyor mu?
-    include_beden_renk = any(keyword in all_comment_text for keyword in textile_keywords)
+    include_beden_renk = summarizer.is_textile_product(comments)
     
     print("\nAI Destekli Özet oluşturuluyor...")
     ai_summary = summarizer.generate_ai_summary(comments, include_beden_renk=include_beden_renk)
@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+# Her kategori flags içinde 2 bit kaplar: 0 = ilgisiz, 1/2/3 = pozitif/negatif/nötr
+SENTIMENT_FLAGS = {'positive': 1, 'negative': 2, 'neutral': 3}
+FLAG_SENTIMENTS = {code: sentiment for sentiment, code in SENTIMENT_FLAGS.items()}
+DETAIL_COLUMNS = ('keywords_found', 'confidence', 'contextual_boost')
+
+
+def is_compact(results: Dict) -> bool:
+    return results.get('format') == 'compact'
+
+
+def _empty_compact(categories: List[str], total_comments: int = 0) -> Dict:
+    return {
+        'format': 'compact',
+        'total_comments': total_comments,
+        'categories': list(categories),
+        'comments': {'comment': [], 'user': [], 'date': []},
+        'flags': [],
+        'category_analysis': {
+            category: {'total_mentions': 0, **{sentiment: [] for sentiment in SENTIMENTS}}
+            for category in categories
+        },
+        'details': {
+            category: {'rows': [], **{column: [] for column in DETAIL_COLUMNS}}
+            for category in categories
+        },
+    }
+
+
+def build_compact_results(total_comments: int, comments: List[Dict], analyses: List[Dict],
+                          categories: List[str]) -> Dict:
+    """
+    analyze_all_comments sonucunun sütunlu hali.
+    Her yorum metni bir kez saklanır; kategori listeleri yorum satır numaralarını, flags ise
+    satır başına paketlenmiş kategori/duygu bitlerini tutar. Kategoriye özel analiz alanları
+    details altında sütunlar halindedir.
+    """
+    results = _empty_compact(categories, total_comments)
+    table = results['comments']
+
+    for comment, category_results in zip(comments, analyses):
+        row = len(results['flags'])
+        flags = 0
+        for bit, category in enumerate(categories):
+            analysis = category_results.get(category)
+            if not analysis or not analysis['relevant']:
+                continue
+            flags |= SENTIMENT_FLAGS[analysis['sentiment']] << (2 * bit)
+
+            data = results['category_analysis'][category]
+            data['total_mentions'] += 1
+            data[analysis['sentiment']].append(row)
+
+            details = results['details'][category]
+            details['rows'].append(row)
+            for column in DETAIL_COLUMNS:
+                details[column].append(analysis.get(column, 0))
+
+        # Hiçbir kategoriyle ilgisi olmayan yorumlar saklanmaz
+        if flags:
+            results['flags'].append(flags)
+            for key in ('comment', 'user', 'date'):
+                table[key].append(comment.get(key, ''))
+
+    return results
+
+
+def merge_compact_results(partials: List[Dict]) -> Dict:
+    """Parça sonuçlarını (parça sırasıyla) satır numaralarını kaydırarak birleştir"""
+    categories = partials[0]['categories'] if partials else []
+    merged = _empty_compact(categories)
+    for partial in partials:
+        offset = len(merged['flags'])
+        merged['total_comments'] += partial['total_comments']
+        merged['flags'].extend(partial['flags'])
+        for key, values in partial['comments'].items():
+            merged['comments'][key].extend(values)
+        for category in categories:
+            data = merged['category_analysis'][category]
+            data['total_mentions'] += partial['category_analysis'][category]['total_mentions']
+            for sentiment in SENTIMENTS:
+                data[sentiment].extend(row + offset for row in partial['category_analysis'][category][sentiment])
+            details = merged['details'][category]
+            details['rows'].extend(row + offset for row in partial['details'][category]['rows'])
+            for column in DETAIL_COLUMNS:
+                details[column].extend(partial['details'][category][column])
+    return merged
+
+
+def row_categories(results: Dict, row: int) -> Dict[str, str]:
+    """Bir yorumun ilgili olduğu kategoriler ve duyguları (flags'ten çözülür)"""
+    flags = results['flags'][row]
+    decoded = {}
+    for bit, category in enumerate(results['categories']):
+        code = (flags >> (2 * bit)) & 3
+        if code:
+            decoded[category] = FLAG_SENTIMENTS[code]
+    return decoded
+
+
+def category_comments(results: Dict, category: str, sentiment: Optional[str] = None) -> List[Dict]:
+    """
+    Kategori/duygu için analyze_all_comments'teki comment_data sözlükleri
+    ({'comment', 'user', 'date', 'analysis'}); iki sonuç biçimiyle de çalışır.
+    """
+    sentiments = [sentiment] if sentiment else list(SENTIMENTS)
+
+    if not is_compact(results):
+        data = results.get('filtered_comments', {}).get(category)
+        if not data:
+            return []
+        return [comment for sent in sentiments for comment in data.get(sent, [])]
+
+    if category not in results['category_analysis']:
+        return []
+    details = results['details'][category]
+    position = {row: pos for pos, row in enumerate(details['rows'])}
+    table = results['comments']
+
+    comments = []
+    for sent in sentiments:
+        for row in results['category_analysis'][category].get(sent, []):
+            pos = position[row]
+            comments.append({
+                'comment': table['comment'][row],
+                'user': table['user'][row],
+                'date': table['date'][row],
+                'analysis': {
+                    'relevant': True,
+                    'sentiment': sent,
+                    'keywords_found': details['keywords_found'][pos],
+                    'confidence': details['confidence'][pos],
+                    'excluded_by_context': False,
+                    'contextual_boost': details['contextual_boost'][pos],
+                },
+            })
+    return comments
+
+
+def expand_compact_results(results: Dict) -> Dict:
+    """Sütunlu sonucu eski (comment_data listeli) biçime çevir"""
+    if not is_compact(results):
+        return results
+    expanded = {'total_comments': results['total_comments'], 'category_analysis': {}, 'filtered_comments': {}}
+    for category in results['categories']:
+        by_sentiment = {sentiment: category_comments(results, category, sentiment) for sentiment in SENTIMENTS}
+        expanded['category_analysis'][category] = {
+            'total_mentions': results['category_analysis'][category]['total_mentions'],
+            **by_sentiment
+        }
+        expanded['filtered_comments'][category] = {sentiment: list(items) for sentiment, items in by_sentiment.items()}
+    return expanded
@@ -2,105 +2,124 @@ import re
 import json
 from typing import Dict, List, Tuple, Any
 
+from pipeline_profiler import profiled
+
 class ContextualKeywordAnalyzer:
-    def __init__(self):
-        # Bağlamsal kargo kelimeleri - sadece gerçek kargo sorunları
-        self.contextual_keywords = {
-            'kargo': {
-                'primary_keywords': {
-                    # Doğrudan kargo sorunları
-                    'kargo_direct': ['kargo', 'kargoya', 'kargoda', 'kargoyla', 'kargom', 'kargonuz'],
-                    'teslimat_direct': ['teslimat', 'teslim', 'gönderi', 'gönderim', 'sevkiyat'],
-                    'paket_direct': ['paket', 'pakette', 'paketi', 'paketim', 'paketiniz'],
-                },
-                'negative_contexts': {
-                    # Kargo gecikmesi - bağlamsal kontrol
-                    'gecikme_patterns': [
-                        r'\b(kargo|teslimat|gönderi|paket)\s*\w*\s*(geç|gecik|ertelenm|bekl)',
-                        r'\b(geç|gecik)\w*\s*\w*\s*(gel\w+|ulaş\w+|teslim)',
-                        r'\bgelmedi\b',
-                        r'\bulaşmadı\b', 
-                        r'\bteslim\s*\w*\s*olmadı\b'
-                    ],
-                    'hasar_patterns': [
-                        r'\b(kargo|paket)\s*\w*\s*(hasar|kır|boz|ezil)',
-                        r'\b(kırık|hasarlı|bozuk|ezik)\s*\w*\s*(gel|ulaş|teslim)',
-                        r'\bpaket\s*\w*\s*içi\s*\w*\s*(dağın|karış)'
-                    ],
-                    'kayip_patterns': [
-                        r'\b(kargo|paket|gönderi)\s*\w*\s*(kay|bulunamad|yok olmuş)',
-                        r'\bulaşmadı\b.*\b(hiç|hala|henüz)\b'
-                    ]
-                },
-                'excluded_contexts': {
-                    # Bu bağlamlarda "geç" kelimesi kargo problemi DEĞİL
-                    'false_positive_patterns': [
-                        r'\bvazgeç\w*',  # vazgeçilmez, vazgeçmem
-                        r'\bgeç\w*ğ\w*\s*(beri|den|da)',  # geçtiğimden beri
-                        r'\bgeç\w*ş\w*',  # geçmiş, geçiş
-                        r'\bek\s+gıda\w*\s+geç',  # ek gıdaya geçtik
-                        r'\bbesin\w*\s+geç',  # besine geçtik
-                        r'\bmama\w*\s+geç',  # mamaya geçtik
-                        r'\büründen\s+geç',  # üründen geçtik
-                        r'\bmarka\w*\s+geç',  # markaya geçtik
-                        r'\bkullanmaya\s+geç',  # kullanmaya geçtik
-                        r'\bsevmeye\s+geç',  # sevmeye geçtik
-                        r'\btercih\s+geç',  # tercih etmeye geçtik
-                    ]
-                }
-            },
-            'kalite': {
-                'primary_keywords': ['kalite', 'bozuk', 'defolu', 'kırık', 'çalışmıyor'],
-                'negative_contexts': {
-                    'malzeme_patterns': [
-                        r'\b(malzeme|yapım|üretim)\s*\w*\s*(kötü|berbat|kalitesiz)',
-                        r'\bkırık\s*(gel|çık|ulaş)',
-                        r'\bdefolu\s*(ürün|mal|paket)'
-                    ]
-                },
-                'excluded_contexts': {
-                    'false_positive_patterns': [
-                        r'\bkırınt\w*',  # kırıntı, kırıntısı
-                        r'\bkırım\w*',   # kırım, kırımlı
-                    ]
-                }
-            },
-            'beden_uyum': {
-                'primary_keywords': ['beden', 'kalıp', 'uyum', 'büyük', 'küçük'],
-                'negative_contexts': {
-                    'uyumsuzluk_patterns': [
-                        r'\bbeden\s*\w*\s*(uyma|büyük|küçük|dar|bol)',
-                        r'\b(çok|hiç)\s*\w*\s*(büyük|küçük)\s*(gel|çık)',
-                        r'\bkalıp\s*\w*\s*(kötü|yanlış|hatalı)'
-                    ]
-                },
-                'excluded_contexts': {
-                    'false_positive_patterns': [
-                        r'\bbüyük\s*(memnun|beğen|sev)',  # büyük memnuniyet
-                        r'\bküçük\s*(beğen|sev|güzel)',   # küçük ama güzel
-                        r'\bbeden\s*tablosu\s*(doğru|uygun)'  # beden tablosu doğru
-                    ]
-                }
-            }
-        }
+    def __init__(self, contextual_keywords: Dict = None, positive_indicators: List[str] = None):
+        """
+        Bağlamsal kelimeler ve pozitif bağlam desenleri analysis_rules.json'dan gelir (bkz. rule_set).
+        Parametre verilmezse güncel kural setindeki değerler kullanılır.
+        """
+        if contextual_keywords is None or positive_indicators is None:
+            from rule_set import get_rule_set
+
+            rule_set = get_rule_set()
+            contextual_keywords = rule_set.contextual_keywords if contextual_keywords is None else contextual_keywords
+            positive_indicators = rule_set.positive_indicators if positive_indicators is None else positive_indicators
+        
+        # Kategori -> birincil kelimeler (alt gruplu olabilir), olumsuz bağlam desenleri, hariç tutulan bağlamlar
+        self.contextual_keywords = contextual_keywords
         
         # Pozitif bağlam kontrolleri
-        self.positive_indicators = [
-            r'\bmemnun\w*',
-            r'\bbeğen\w*', 
-            r'\bsev\w*',
-            r'\biyi\b',
-            r'\bgüzel\b',
-            r'\btavsiye\s*(eder|ediyorum)',
-            r'\böneririm\b',
-            r'\bkaliteli\b',
-            r'\bmükemmel\b'
-        ]
+        self.positive_indicators = positive_indicators
+        
+        # Desenleri bir kez derle (her yorumda ham desen stringleriyle tarama yapılmasın)
+        self._compile_patterns()
+
+    @staticmethod
+    def _build_probe(patterns: List[str]):
+        """
+        Desen ailesini tek regex'e birleştir.
+        Kapı (gate) alternasyonu sadece en az bir desenin başladığı konumlarda eşleşir;
+        her desen isimli gruplu bir lookahead içinde denendiği için tek taramada
+        hangi desenlerin metnin herhangi bir yerinde eşleştiği bulunur.
+        """
+        gate = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        probes = ''.join(f'(?:(?=(?P<p{i}>{pattern}))|)' for i, pattern in enumerate(patterns))
+        return re.compile(f'(?=(?:{gate})){probes}')
+
+    @staticmethod
+    def _matched_indices(probe, pattern_count: int, text: str) -> set:
+        """Birleşik regex ile metinde eşleşen desenlerin indekslerini döndür"""
+        hits = set()
+        for match in probe.finditer(text):
+            for name, value in match.groupdict().items():
+                if value is not None:
+                    hits.add(int(name[1:]))
+            if len(hits) == pattern_count:
+                break
+        return hits
+
+    def _compile_patterns(self):
+        """contextual_keywords ve positive_indicators yapılandırmasını derlenmiş hale getir"""
+        self._compiled = {}
+        # Tüm kategorilerin desenleri tek listede: tüm kategoriler için tek tarama yapılabilsin
+        all_patterns = []
+        
+        def register(patterns):
+            start = len(all_patterns)
+            all_patterns.extend(patterns)
+            return list(range(start, len(all_patterns)))
+        
+        for category, category_config in self.contextual_keywords.items():
+            excluded_patterns = category_config.get('excluded_contexts', {}).get('false_positive_patterns', [])
+            
+            primary_keywords = category_config['primary_keywords']
+            if isinstance(primary_keywords, dict):
+                primary_keywords = [keyword for keywords in primary_keywords.values() for keyword in keywords]
+            
+            negative_families = []
+            for pattern_type, patterns in category_config.get('negative_contexts', {}).items():
+                if patterns:
+                    negative_families.append((
+                        pattern_type,
+                        self._build_probe(patterns),
+                        [(pattern, re.compile(pattern)) for pattern in patterns],
+                        register(patterns)
+                    ))
+            
+            self._compiled[category] = {
+                'excluded_patterns': excluded_patterns,
+                'excluded_probe': self._build_probe(excluded_patterns) if excluded_patterns else None,
+                'excluded_ids': register(excluded_patterns),
+                'primary_keywords': list(primary_keywords),
+                'negative_families': negative_families,
+            }
+        
+        self._positive_probe = self._build_probe(self.positive_indicators) if self.positive_indicators else None
+        self._positive_ids = set(register(self.positive_indicators))
+        self._all_pattern_count = len(all_patterns)
+        self._global_probe = self._build_probe(all_patterns) if all_patterns else None
+
+    def get_primary_keywords(self, category: str) -> List[str]:
+        """Kategorinin (alt kategorileri düzleştirilmiş) birincil anahtar kelimeleri"""
+        return self._compiled[category]['primary_keywords'] if category in self._compiled else []
+
+    @profiled('contextual.scan_patterns')
+    def scan_patterns(self, text_lower: str) -> set:
+        """Tüm kategorilerin desenlerini tek taramada dene, eşleşen global desen indekslerini döndür"""
+        if self._global_probe is None:
+            return set()
+        return self._matched_indices(self._global_probe, self._all_pattern_count, text_lower)
+
+    @profiled('contextual.positive_indicators')
+    def _count_positive_indicators(self, text_lower: str) -> int:
+        """Metinde eşleşen pozitif bağlam desenlerinin sayısı"""
+        if self._positive_probe is None:
+            return 0
+        return len(self._matched_indices(self._positive_probe, len(self.positive_indicators), text_lower))
 
     def analyze_contextual_keywords(self, text: str, category: str) -> Dict:
         """Bağlamsal kelime analizi"""
         
-        result = {
+        if category not in self.contextual_keywords:
+            return self._empty_result(category)
+        
+        text_lower = text.lower()
+        return self._analyze_category(text_lower, category, self._count_positive_indicators(text_lower))
+
+    def _empty_result(self, category: str) -> Dict:
+        return {
             'category': category,
             'found_keywords': [],
             'context_score': 0,
@@ -114,45 +133,45 @@ class ContextualKeywordAnalyzer:
                 'confidence': 0
             }
         }
+
+    def _analyze_category(self, text_lower: str, category: str, positive_score: int, hits: set = None) -> Dict:
+        """
+        Küçük harfe çevrilmiş metin için tek kategorinin bağlamsal analizi.
+        hits verilirse (scan_patterns sonucu) desenler yeniden taranmaz.
+        """
         
-        if category not in self.contextual_keywords:
-            return result
-        
-        text_lower = text.lower()
-        category_config = self.contextual_keywords[category]
+        result = self._empty_result(category)
+        compiled = self._compiled[category]
         
         # 1. EXCLUDED CONTEXT CHECK (False Positive kontrolü)
-        excluded_patterns = category_config.get('excluded_contexts', {}).get('false_positive_patterns', [])
-        for pattern in excluded_patterns:
-            if re.search(pattern, text_lower):
+        if compiled['excluded_probe'] is not None:
+            if hits is None:
+                excluded_hits = self._matched_indices(compiled['excluded_probe'], len(compiled['excluded_patterns']), text_lower)
+            else:
+                excluded_hits = {i for i, pattern_id in enumerate(compiled['excluded_ids']) if pattern_id in hits}
+            if excluded_hits:
                 result['analysis_details']['excluded_by_context'] = True
-                result['analysis_details']['excluded_patterns'].append(pattern)
+                result['analysis_details']['excluded_patterns'].append(compiled['excluded_patterns'][min(excluded_hits)])
                 result['analysis_details']['confidence'] = 0
                 return result  # Hemen çık, bu kategori değil
         
         # 2. PRIMARY KEYWORD CHECK
-        primary_found = []
-        if isinstance(category_config['primary_keywords'], dict):
-            # Alt kategoriler varsa
-            for sub_cat, keywords in category_config['primary_keywords'].items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        primary_found.append(keyword)
-        else:
-            # Basit liste
-            for keyword in category_config['primary_keywords']:
-                if keyword in text_lower:
-                    primary_found.append(keyword)
+        primary_found = [keyword for keyword in compiled['primary_keywords'] if keyword in text_lower]
         
         result['found_keywords'] = primary_found
         
         # 3. NEGATIVE CONTEXT PATTERNS (Gerçek problemler)
-        negative_patterns = category_config.get('negative_contexts', {})
         negative_score = 0
         
-        for pattern_type, patterns in negative_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower)
+        for pattern_type, probe, patterns, pattern_ids in compiled['negative_families']:
+            if hits is None:
+                family_hits = self._matched_indices(probe, len(patterns), text_lower)
+            else:
+                family_hits = {i for i, pattern_id in enumerate(pattern_ids) if pattern_id in hits}
+            # Sadece ailede eşleşen desenler için tek tek findall çalıştır
+            for index in sorted(family_hits):
+                pattern, compiled_pattern = patterns[index]
+                matches = compiled_pattern.findall(text_lower)
                 if matches:
                     negative_score += len(matches) * 2  # Negatif pattern daha ağırlıklı
                     result['analysis_details']['pattern_matches'].append({
@@ -164,12 +183,9 @@ class ContextualKeywordAnalyzer:
         if negative_score > 0:
             result['analysis_details']['negative_context'] = True
         
-        # 4. POSITIVE CONTEXT CHECK
-        positive_score = 0
-        for pos_pattern in self.positive_indicators:
-            if re.search(pos_pattern, text_lower):
-                positive_score += 1
-                result['analysis_details']['positive_context'] = True
+        # 4. POSITIVE CONTEXT CHECK (tüm kategoriler için bir kez hesaplanır)
+        if positive_score > 0:
+            result['analysis_details']['positive_context'] = True
         
         # 5. FINAL SCORING AND VALIDATION
         if result['analysis_details']['excluded_by_context']:
@@ -203,10 +219,21 @@ class ContextualKeywordAnalyzer:
     def analyze_all_categories(self, text: str) -> Dict:
         """Tüm kategoriler için bağlamsal analiz"""
         
+        return self.analyze_lowered(text.lower())
+
+    @profiled('contextual.analyze')
+    def analyze_lowered(self, text_lower: str, hits: set = None) -> Dict:
+        """Küçük harfe çevrilmiş metin için tüm kategoriler; desenler tek taramada denenir"""
+        
         results = {}
         
+        if hits is None:
+            hits = self.scan_patterns(text_lower)
+        # Pozitif göstergeler kategoriden bağımsız: tüm kategoriler aynı skoru paylaşır
+        positive_score = len(hits & self._positive_ids)
+        
         for category in self.contextual_keywords.keys():
-            results[category] = self.analyze_contextual_keywords(text, category)
+            results[category] = self._analyze_category(text_lower, category, positive_score, hits)
         
         # En yüksek skorlu ve geçerli kategoriyi belirle
         valid_categories = {cat: data for cat, data in results.items() 
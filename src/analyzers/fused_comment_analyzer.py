@@ -0,0 +1,87 @@
+from typing import Dict, List, Optional
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from priority_analyzer import PriorityAnalyzer
+from comment_summarizer import CommentSummarizer
+
+
+class FusedCommentAnalyzer:
+    """
+    Kategori, bağlamsal geçerlilik, olumsuzluk seviyesi, kritik kelimeler ve duygu
+    analizini tek geçişte yapar. Metin bir kez küçük harfe çevrilir; anahtar kelimeler
+    ortak otomatla, bağlamsal desenler tek birleşik regex ile bir kez taranır ve tüm
+    analizler bu sonuçları paylaşır.
+    """
+
+    def __init__(self, advanced_analyzer: Optional[AdvancedCommentAnalyzer] = None,
+                 priority_analyzer: Optional[PriorityAnalyzer] = None,
+                 summarizer: Optional[CommentSummarizer] = None):
+        self.advanced_analyzer = advanced_analyzer or AdvancedCommentAnalyzer()
+        self.priority_analyzer = priority_analyzer or PriorityAnalyzer()
+        # Duygu kelimelerinin ortak otomata kaydı için özetleyici de yüklenir
+        self.summarizer = summarizer or CommentSummarizer()
+
+    @property
+    def contextual_analyzer(self):
+        return self.advanced_analyzer.contextual_analyzer
+
+    @property
+    def keyword_matcher(self):
+        return self.advanced_analyzer.keyword_matcher
+
+    def analyze(self, comment_text: str) -> Dict:
+        """Tek yorum için tüm analizleri üret"""
+        text_lower = (comment_text or '').lower()
+        # Kurallar yeniden yüklenirse yorum yarıda yeni sete geçmesin
+        rules = self.advanced_analyzer.rules
+
+        # Tek anahtar kelime taraması + tek bağlamsal desen taraması
+        found = rules.keyword_matcher.find(text_lower)
+        contextual_result = rules.contextual_analyzer.analyze_lowered(text_lower)
+
+        categories = self.advanced_analyzer.categorize(found, contextual_result, rules)
+
+        return {
+            'categories': categories,
+            'primary_category': self._best_category(categories),
+            'contextual': {
+                'primary_category': contextual_result['primary_category'],
+                'confidence': contextual_result['confidence'],
+                'excluded_categories': contextual_result['summary']['excluded_categories'],
+            },
+            'negativity': self.priority_analyzer.negativity_from_keywords(found),
+            'critical_keywords': self._critical_keywords(found),
+            'sentiment': self._sentiment(found),
+        }
+
+    def analyze_batch(self, comment_texts: List[str]) -> List[Dict]:
+        return [self.analyze(text) for text in comment_texts]
+
+    @staticmethod
+    def _best_category(categories: Dict) -> str:
+        """En yüksek güvenli ilgili kategori (yoksa 'unknown')"""
+        best_category = 'unknown'
+        best_confidence = 0
+        for category, result in categories.items():
+            if result.get('relevant') and result.get('confidence', 0) > best_confidence:
+                best_category = category
+                best_confidence = result['confidence']
+        return best_category
+
+    def _critical_keywords(self, found) -> Dict[str, List[str]]:
+        critical = {}
+        for category in self.priority_analyzer.priority_categories:
+            keywords = self.priority_analyzer.find_critical_keywords(category, found)
+            if keywords:
+                critical[category] = keywords
+        return critical
+
+    def _sentiment(self, found) -> str:
+        """CommentSummarizer.analyze_sentiment ile aynı kural: pozitif/negatif kelime sayısı karşılaştırması"""
+        pos_score = len(found & self.summarizer.sentiment_words['positive'])
+        neg_score = len(found & self.summarizer.sentiment_words['negative'])
+        if pos_score > neg_score:
+            return 'positive'
+        if neg_score > pos_score:
+            return 'negative'
+        return 'neutral'
@@ -0,0 +1,166 @@
+import json
+from typing import Dict, List, Optional
+
+from analysis_cache import content_hash
+
+SENTIMENTS = ('positive', 'negative', 'neutral')
+DEFAULT_TOP_K = 5
+
+
+class CategoryAggregates:
+    """
+    analyze_all_comments özetinin (kategori başı bahsetme, duygu dağılımı, en güvenli örnek
+    yorumlar) artımlı tutulan hali. Yorum eklemek/çıkarmak sadece o yorumlar kadar iş yapar;
+    durum JSON'a yazılabilir ve farklı parçalardan (shard) gelen özetler birleştirilebilir.
+
+    Örnek listeleri güven skoruna göre en iyi top_k yorumu tutar. Çıkarılan bir örneğin yeri
+    tüm yorumlar yeniden taranmadan doldurulamayacağı için liste geçici olarak kısalabilir;
+    sayılar her zaman kesindir.
+
+    rule_version özetin hangi kural sürümüyle hesaplandığını kaydeder; kurallar değişince
+    eski sayılar yeni analizlerle karıştırılmamalı, özet yeniden kurulmalıdır.
+    """
+
+    def __init__(self, categories: List[str], top_k: int = DEFAULT_TOP_K, rule_version: Optional[str] = None):
+        self.top_k = top_k
+        self.rule_version = rule_version
+        self.total_comments = 0
+        self.categories = {category: self._empty_category() for category in categories}
+
+    @staticmethod
+    def _empty_category() -> Dict:
+        return {
+            'total_mentions': 0,
+            'confidence_sum': 0.0,
+            **{sentiment: 0 for sentiment in SENTIMENTS},
+            'examples': {sentiment: [] for sentiment in SENTIMENTS},
+        }
+
+    def _category(self, category: str) -> Dict:
+        if category not in self.categories:
+            self.categories[category] = self._empty_category()
+        return self.categories[category]
+
+    def _offer_example(self, examples: List[Dict], example: Dict):
+        """
+        Örneği güven sırasına göre ekle, top_k'yi aşma. Aynı metin tekrar eklenmez; örneğin 'count'u
+        o metni taşıyan yorum sayısıdır, örnek son yorumu da çıkarılınca silinir.
+        """
+        for item in examples:
+            if item['hash'] == example['hash']:
+                item['count'] = item.get('count', 1) + example.get('count', 1)
+                return
+        if len(examples) >= self.top_k and example['confidence'] <= examples[-1]['confidence']:
+            return
+        examples.append(example)
+        examples.sort(key=lambda item: item['confidence'], reverse=True)
+        del examples[self.top_k:]
+
+    def add(self, comments: List[Dict], analyses: List[Dict]):
+        """
+        Yorumları özete ekle.
+        analyses[i], comments[i]['comment'] için analyze_comment_categories sonucudur.
+        """
+        self._apply(comments, analyses, 1)
+
+    def remove(self, comments: List[Dict], analyses: List[Dict]):
+        """Daha önce eklenmiş yorumları özetten çıkar"""
+        self._apply(comments, analyses, -1)
+
+    def _apply(self, comments: List[Dict], analyses: List[Dict], sign: int):
+        self.total_comments += sign * len(comments)
+        for comment, category_results in zip(comments, analyses):
+            digest = None
+            for category, analysis in category_results.items():
+                if not analysis['relevant']:
+                    continue
+                data = self._category(category)
+                sentiment = analysis['sentiment']
+                data['total_mentions'] += sign
+                data[sentiment] += sign
+                data['confidence_sum'] += sign * analysis['confidence']
+
+                digest = digest or content_hash(comment.get('comment', ''))
+                examples = data['examples'][sentiment]
+                if sign > 0:
+                    self._offer_example(examples, {
+                        'hash': digest,
+                        'comment': comment.get('comment', ''),
+                        'user': comment.get('user', ''),
+                        'date': comment.get('date', ''),
+                        'confidence': analysis['confidence'],
+                        'count': 1,
+                    })
+                else:
+                    self._release_example(examples, digest)
+
+    @staticmethod
+    def _release_example(examples: List[Dict], digest: str):
+        """Çıkarılan yorumun örnekteki payını düş; aynı metinli başka yorum kalmadıysa örneği sil"""
+        for i, item in enumerate(examples):
+            if item['hash'] == digest:
+                item['count'] = item.get('count', 1) - 1
+                if item['count'] <= 0:
+                    del examples[i]
+                return
+
+    def merge(self, other: 'CategoryAggregates') -> 'CategoryAggregates':
+        """Başka bir parçanın özetini bu özete kat (self döner)"""
+        self.total_comments += other.total_comments
+        for category, other_data in other.categories.items():
+            data = self._category(category)
+            data['total_mentions'] += other_data['total_mentions']
+            data['confidence_sum'] += other_data['confidence_sum']
+            for sentiment in SENTIMENTS:
+                data[sentiment] += other_data[sentiment]
+                for example in other_data['examples'][sentiment]:
+                    self._offer_example(data['examples'][sentiment], dict(example))
+        return self
+
+    def summary(self) -> Dict:
+        """Dashboard/rapor için kategori başı sayılar, yüzdeler ve örnekler"""
+        summary = {'total_comments': self.total_comments, 'categories': {}}
+        for category, data in self.categories.items():
+            mentions = data['total_mentions']
+            summary['categories'][category] = {
+                'total_mentions': mentions,
+                **{sentiment: data[sentiment] for sentiment in SENTIMENTS},
+                **{f'{sentiment}_percentage': round(data[sentiment] / mentions * 100, 1) if mentions else 0.0
+                   for sentiment in SENTIMENTS},
+                'average_confidence': round(data['confidence_sum'] / mentions, 3) if mentions else 0.0,
+                'examples': {sentiment: [item['comment'] for item in data['examples'][sentiment]]
+                             for sentiment in SENTIMENTS},
+            }
+        return summary
+
+    def to_dict(self) -> Dict:
+        return {'top_k': self.top_k, 'rule_version': self.rule_version,
+                'total_comments': self.total_comments, 'categories': self.categories}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'CategoryAggregates':
+        aggregates = cls(list(state.get('categories', {})), top_k=state.get('top_k', DEFAULT_TOP_K),
+                         rule_version=state.get('rule_version'))
+        aggregates.total_comments = state.get('total_comments', 0)
+        for category, data in state.get('categories', {}).items():
+            aggregates.categories[category].update(data)
+        return aggregates
+
+    def save(self, filename: str):
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Özet kaydetme hatası: {e}")
+
+    @classmethod
+    def load(cls, filename: str, categories: Optional[List[str]] = None) -> 'CategoryAggregates':
+        """Kayıtlı özeti yükle; dosya yoksa/bozuksa boş özet döner"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return cls(categories or [])
+        except Exception as e:
+            print(f"Özet yükleme hatası: {e}")
+            return cls(categories or [])
@@ -0,0 +1,146 @@
+from collections import Counter, OrderedDict
+from itertools import chain
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from analysis_cache import content_hash
+
+# Seyrek doküman-terim matrisi (opsiyonel); yoksa Counter ile aynı sonuç üretilir
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Aynı korpus (aynı metinler + aynı ön işleme) tekrar tokenize edilmesin
+MATRIX_CACHE_SIZE = 8
+
+_matrix_cache = OrderedDict()
+
+
+def top_k_indices(values, k: Optional[int] = None, min_value: int = 1):
+    """
+    En büyük k değerin indeksleri (azalan sırada; eşitlikte küçük indeks önce).
+    Tam sıralama yerine k. değer np.partition ile bulunur, sadece o değerin üstündekiler sıralanır.
+    """
+    if k is not None and k <= 0:
+        # Counter.most_common(0) gibi boş sonuç (np.partition'a len(values) indeksi verilemez)
+        return np.zeros(0, dtype=np.intp)
+    candidates = np.flatnonzero(values >= min_value)
+    if k is not None and k < len(candidates):
+        candidate_values = values[candidates]
+        kth_value = np.partition(candidate_values, len(candidate_values) - k)[len(candidate_values) - k]
+        candidates = candidates[candidate_values >= kth_value]
+    order = np.lexsort((candidates, -values[candidates]))
+    return candidates[order][:k]
+
+
+class DocumentTermMatrix:
+    """
+    Tokenize edilmiş dokümanlardan (doküman x terim) seyrek sayım matrisi.
+    Terimler korpusta ilk geçtikleri sırayla numaralanır; eşit sayılarda sıralama
+    Counter.most_common ile aynıdır (önce görülen önce).
+    """
+
+    def __init__(self, documents: Sequence[Sequence[str]], keep: Optional[Callable[[str], bool]] = None):
+        """
+        keep verilirse terim filtresi (stop word, kısa kelime...) token başına değil,
+        sözlükteki her farklı terim için bir kez uygulanır.
+        """
+        self.documents = len(documents)
+        tokens = list(chain.from_iterable(documents))
+        # dict.fromkeys ilk görülme sırasını korur; numaralama ve eşleme C seviyesinde yapılır
+        self.vocabulary: List[str] = list(dict.fromkeys(tokens))
+        kept_ids = None
+        if keep is not None:
+            kept_ids = [i for i, term in enumerate(self.vocabulary) if keep(term)]
+            if len(kept_ids) == len(self.vocabulary):
+                kept_ids = None
+
+        if SCIPY_AVAILABLE:
+            index = {term: i for i, term in enumerate(self.vocabulary)}
+            # Aynı dokümanda tekrar eden terimler CSR kurulurken toplanır
+            indices = np.fromiter(map(index.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+            indptr = np.zeros(self.documents + 1, dtype=np.int64)
+            np.cumsum(np.fromiter(map(len, documents), dtype=np.int64, count=self.documents), out=indptr[1:])
+            self.matrix = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.int32), indices, indptr),
+                shape=(self.documents, len(self.vocabulary))
+            )
+            self.matrix.sum_duplicates()
+            if kept_ids is not None:
+                self.matrix = self.matrix[:, np.asarray(kept_ids, dtype=np.int64)]
+        else:
+            kept = None if kept_ids is None else {self.vocabulary[i] for i in kept_ids}
+            self._documents = [[token for token in doc if kept is None or token in kept] for doc in documents]
+
+        if kept_ids is not None:
+            self.vocabulary = [self.vocabulary[i] for i in kept_ids]
+        self.index: Dict[str, int] = {term: i for i, term in enumerate(self.vocabulary)}
+
+    def term_counts(self, rows: Optional[Sequence[int]] = None):
+        """Tüm korpus (veya verilen dokümanlar) için terim sayıları"""
+        matrix = self.matrix if rows is None else self.matrix[np.asarray(rows, dtype=np.int64)]
+        return np.asarray(matrix.sum(axis=0)).ravel()
+
+    def _format(self, values, ids) -> List[Tuple[str, int]]:
+        return [(self.vocabulary[i], int(values[i])) for i in ids]
+
+    def top_terms(self, k: Optional[int] = None, min_count: int = 1,
+                  rows: Optional[Sequence[int]] = None) -> List[Tuple[str, int]]:
+        """En sık k terim [(terim, sayı)]; k=None ise min_count üstündeki tüm terimler sıralı"""
+        if not SCIPY_AVAILABLE:
+            selected = self._documents if rows is None else [self._documents[i] for i in rows]
+            counts = Counter(token for tokens in selected for token in tokens)
+            return [(term, count) for term, count in counts.most_common() if count >= min_count][:k]
+
+        counts = self.term_counts(rows)
+        return self._format(counts, top_k_indices(counts, k, min_count))
+
+    def group_top_terms(self, groups: Sequence[Hashable], k: Optional[int] = 10,
+                        min_count: int = 1) -> Dict[Hashable, List[Tuple[str, int]]]:
+        """
+        Her grup (kategori/küme/ürün) için en sık k terim. groups her dokümanın grubudur.
+        Grup sayımları tek seyrek çarpımla hesaplanır: (grup x doküman) göstergesi @ (doküman x terim).
+        """
+        labels = list(dict.fromkeys(groups))
+        if not SCIPY_AVAILABLE:
+            return {
+                label: self.top_terms(k, min_count, rows=[i for i, group in enumerate(groups) if group == label])
+                for label in labels
+            }
+
+        label_ids = {label: i for i, label in enumerate(labels)}
+        group_ids = np.fromiter((label_ids[group] for group in groups), dtype=np.int64, count=len(groups))
+        indicator = sparse.csr_matrix(
+            (np.ones(len(group_ids), dtype=np.int32), (group_ids, np.arange(len(group_ids)))),
+            shape=(len(labels), self.documents)
+        )
+        group_counts = (indicator @ self.matrix).tocsr()
+        group_counts.sort_indices()
+
+        tables = {}
+        for row, label in enumerate(labels):
+            start, end = group_counts.indptr[row], group_counts.indptr[row + 1]
+            term_ids, values = group_counts.indices[start:end], group_counts.data[start:end]
+            tables[label] = [(self.vocabulary[term_ids[i]], int(values[i])) for i in top_k_indices(values, k, min_count)]
+        return tables
+
+
+def get_document_term_matrix(texts: Sequence[str], tokenize: Callable[[Sequence[str]], List[List[str]]],
+                             namespace: str, keep: Optional[Callable[[str], bool]] = None) -> DocumentTermMatrix:
+    """
+    Metinlerin doküman-terim matrisi; aynı namespace (ön işleme) ve aynı metinler için
+    önbellekten döner, böylece aynı korpusta tekrarlanan anahtar kelime sorguları tokenize etmez.
+    tokenize tüm metin listesini alıp doküman başına token listesi döner (toplu temizleme için).
+    """
+    key = (namespace, len(texts), content_hash('\x00'.join(texts)))
+    if key in _matrix_cache:
+        _matrix_cache.move_to_end(key)
+        return _matrix_cache[key]
+
+    matrix = DocumentTermMatrix(tokenize(texts), keep)
+    _matrix_cache[key] = matrix
+    if len(_matrix_cache) > MATRIX_CACHE_SIZE:
+        _matrix_cache.popitem(last=False)
+    return matrix
@@ -0,0 +1,194 @@
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from pipeline_profiler import profiled
+
+# C tabanlı Aho-Corasick otomatı (opsiyonel)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Aynı metin birden fazla analizci tarafından taranınca tekrar hesaplanmasın
+MATCH_CACHE_SIZE = 4096
+
+
+class KeywordMatcher:
+    """
+    Tüm analizcilerin anahtar kelime sözlüklerinden tek bir çoklu-desen otomatı kurar.
+    Her anahtar kelime (namespace, grup, liste) etiketleriyle saklanır; bir metin
+    tek doğrusal geçişte taranır ve bulunan her kelime etiketleriyle döner.
+
+    Eşleşme semantiği analizcilerdeki `kw in text` kontrolüyle aynıdır (alt metin eşleşmesi,
+    iç içe ve çakışan kelimeler dahil).
+    """
+
+    def __init__(self):
+        self._tags = defaultdict(set)  # keyword -> {(namespace, group, list_name)}
+        self._namespaces = set()
+        self._lock = threading.Lock()
+        self._dirty = True
+        # Derlenmiş otomat ve ona ait etiket tablosu tek nesnede; okuyucular tek atamayla alır
+        self._compiled = None
+
+    def register(self, namespace: str, vocabularies: Dict[str, Dict[str, Iterable[str]]]):
+        """
+        Bir analizcinin sözlüklerini ekle.
+        vocabularies: {grup: {liste_adı: [kelimeler]}} (ör. {'kargo': {'negative': ['geç', ...]}})
+        Aynı namespace tekrar kaydedilirse eski etiketleri değiştirilir.
+        """
+        with self._lock:
+            if namespace in self._namespaces:
+                for keyword in list(self._tags):
+                    self._tags[keyword] = {tag for tag in self._tags[keyword] if tag[0] != namespace}
+                    if not self._tags[keyword]:
+                        del self._tags[keyword]
+
+            for group, lists in vocabularies.items():
+                for list_name, keywords in lists.items():
+                    for keyword in keywords:
+                        if keyword:
+                            self._tags[keyword].add((namespace, group, list_name))
+
+            self._namespaces.add(namespace)
+            self._dirty = True
+
+    def _snapshot(self) -> '_CompiledMatcher':
+        """Güncel derlenmiş otomat (kayıtlar değiştiyse kilit altında yeniden kurulur)"""
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._compiled = _CompiledMatcher(self._tags)
+                    self._dirty = False
+        return self._compiled
+
+    @profiled('keyword_matcher.find')
+    def find(self, text: str, use_cache: bool = True) -> frozenset:
+        """Metinde geçen kayıtlı kelimelerin kümesi (tek seferlik büyük metinler için use_cache=False)"""
+        compiled = self._snapshot()
+        if not text:
+            return frozenset()
+        return compiled.cached_scan(text) if use_cache else compiled.scan(text)
+
+    def clear_cache(self):
+        """Metin sonuç önbelleğini boşalt (ör. soğuk tarama ölçümleri için)"""
+        self._snapshot().cached_scan.cache_clear()
+
+    def with_namespaces(self, namespaces: Dict[str, Dict[str, Dict[str, Iterable[str]]]]) -> 'KeywordMatcher':
+        """
+        Verilen namespace'leri değiştirilmiş yeni bir otomat (mevcut otomat değişmez).
+        Diğer namespace'lerin kelimeleri aynen taşınır; yeni otomat döndürülmeden önce derlenir.
+        """
+        matcher = KeywordMatcher()
+        with self._lock:
+            for keyword, tags in self._tags.items():
+                kept = {tag for tag in tags if tag[0] not in namespaces}
+                if kept:
+                    matcher._tags[keyword] = kept
+            matcher._namespaces = self._namespaces - set(namespaces)
+        for namespace, vocabularies in namespaces.items():
+            matcher.register(namespace, vocabularies)
+        matcher.find('')
+        return matcher
+
+    def match(self, text: str) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Metinde geçen her kelime için (namespace, grup, liste) etiketleri"""
+        # Otomat ve etiketler aynı anlık görüntüden: eşzamanlı register/yeniden yükleme karıştıramaz
+        compiled = self._snapshot()
+        found = compiled.cached_scan(text) if text else frozenset()
+        return {keyword: list(compiled.tags[keyword]) for keyword in found}
+
+    def match_namespace(self, text: str, namespace: str) -> Dict[str, Dict[str, List[str]]]:
+        """Tek bir namespace için {grup: {liste_adı: [bulunan kelimeler]}} döndür"""
+        hits = defaultdict(lambda: defaultdict(list))
+        for keyword, tags in self.match(text).items():
+            for tag_namespace, group, list_name in tags:
+                if tag_namespace == namespace:
+                    hits[group][list_name].append(keyword)
+        return {group: dict(lists) for group, lists in hits.items()}
+
+
+class _CompiledMatcher:
+    """
+    Bir kelime kümesinden derlenmiş, değiştirilmeyen otomat (veya saf Python yedeği),
+    o kümenin etiket tablosu ve metin sonuç önbelleği
+    """
+
+    def __init__(self, tags: Dict[str, set]):
+        keywords = sorted(tags)
+        self.tags = {keyword: tuple(sorted(tags[keyword])) for keyword in keywords}
+        self.automaton = None
+        self.prefixes = {}
+        self.gate = None
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self.automaton = automaton
+        else:
+            # Saf Python yedeği: trie yapısında tek regex, her konumda orada başlayan en uzun
+            # kelimeyi C seviyesinde yakalar; aynı konumda başlayan daha kısa kelimeler
+            # en uzun kelimenin kayıtlı önekleridir
+            trie = {}
+            for keyword in keywords:
+                node = trie
+                for char in keyword:
+                    node = node.setdefault(char, {})
+                node[None] = keyword
+            self.prefixes = {
+                keyword: tuple(other for other in keywords if keyword.startswith(other))
+                for keyword in keywords
+            }
+            self.gate = re.compile(f'(?=({self._trie_pattern(trie)}))') if keywords else None
+
+        self.cached_scan = lru_cache(maxsize=MATCH_CACHE_SIZE)(self.scan)
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict) -> str:
+        """Trie düğümünü, o konumdan başlayan en uzun kelimeyi eşleyen regex'e çevir"""
+        branches = [re.escape(char) + cls._trie_pattern(child) for char, child in node.items() if char is not None]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Kelime bu düğümde bitebiliyorsa devamı opsiyonel (greedy: önce uzun olan denenir)
+        return f'(?:{pattern})?' if None in node else pattern
+
+    def scan(self, text: str) -> frozenset:
+        """Metinde geçen tüm kelimeleri tek geçişte bul"""
+        if AHOCORASICK_AVAILABLE:
+            if len(self.automaton) == 0:
+                return frozenset()
+            return frozenset(keyword for _, keyword in self.automaton.iter(text))
+
+        if self.gate is None:
+            return frozenset()
+
+        found = set()
+        for longest in set(self.gate.findall(text)):
+            found.update(self.prefixes[longest])
+        return frozenset(found)
+
+
+_shared_matcher = KeywordMatcher()
+
+
+def get_shared_matcher() -> KeywordMatcher:
+    """Tüm analizcilerin ortak kullandığı otomat"""
+    return _shared_matcher
+
+
+def replace_shared_namespaces(namespaces: Dict[str, Dict[str, Dict[str, Iterable[str]]]]) -> KeywordMatcher:
+    """
+    Kural namespace'leri değişmiş yeni ortak otomatı derleyip tek atamayla devreye al.
+    Taramadaki çağrılar eski otomatla biter; sonraki get_shared_matcher çağrıları yenisini alır.
+    """
+    global _shared_matcher
+    matcher = _shared_matcher.with_namespaces(namespaces)
+    _shared_matcher = matcher
+    return matcher
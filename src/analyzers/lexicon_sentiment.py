@@ -0,0 +1,183 @@
+from typing import Dict, Iterable, List, Sequence
+
+from keyword_matcher import KeywordMatcher
+
+# Seyrek terim matrisi (opsiyonel); yoksa satır satır Python toplamı kullanılır
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Toplu taramada tek geçişli otomat (opsiyonel); yoksa terim başına str.split taraması
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Yorumlar tek metinde birleştirilirken araya konan ayraç (hiçbir terimde geçmez)
+_SEPARATOR = '\x00'
+
+# RAG arama ve arayüzlerinin ortak duygu sözlüğü (önceden her bileşende ayrı listeler vardı)
+RAG_SENTIMENT_WORDS = {
+    'positive': [
+        'beğendik', 'beğendim', 'mükemmel', 'harika', 'süper', 'tavsiye ederim', 'memnun', 'kaliteli',
+        'güzel', 'başarılı', 'teşekkür', 'stok', 'vazgeçilmez', 'favorim', 'severek', 'mutlu', 'çok iyi'
+    ],
+    'negative': [
+        'sorun', 'problem', 'kötü', 'berbat', 'bozuk', 'defolu', 'şikayet', 'memnun değil', 'kalitesiz',
+        'geç', 'yavaş', 'hasarlı', 'kırık', 'iade', 'beğenmedim', 'beğenmedik', 'tavsiye etmem', 'pişman',
+        'hayal kırıklığı', 'rezalet', 'çöp', 'para israfı', 'aldatmaca', 'sahte', 'taklit'
+    ]
+}
+
+# Etiketleme kuralları: 'majority' olumlu/olumsuz puanı büyük olanı seçer (eşitse nötr);
+# 'exclusive' sadece tek yönde kelime varsa o yönü seçer (ikisi de varsa karışık = nötr)
+LABEL_MODES = ('majority', 'exclusive')
+
+
+class SentimentLexicon:
+    """
+    Ağırlıklı duygu sözlüğü: bir kez derlenir, yorum grupları tek işlemde puanlanır.
+    Yorumlar (yorum x terim) seyrek varlık matrisine çevrilir ve (terim x 2) olumlu/olumsuz
+    ağırlık matrisiyle çarpılır; her yorum için olumlu, olumsuz ve net (polarity) puan dizisi döner.
+
+    Matris için tüm grup küçük harfe çevrilip ayraçla tek metinde birleştirilir ve bir kez taranır;
+    eşleşme konumları ayraç konumlarıyla satırlara dağıtılır (yorum başına Python döngüsü yok).
+    Eşleşme analizcilerdeki `kelime in metin` kontrolüyle aynıdır; her terim yorum başına bir kez sayılır.
+    """
+
+    def __init__(self, weights: Dict[str, float], name: str = 'default'):
+        """weights: {terim: ağırlık} (olumlu terimler > 0, olumsuz terimler < 0)"""
+        self.name = name
+        self.terms = sorted(term for term, weight in weights.items() if term and weight)
+        self.index = {term: i for i, term in enumerate(self.terms)}
+        self.weights = [weights[term] for term in self.terms]
+
+        if SCIPY_AVAILABLE:
+            weight_vector = np.asarray(self.weights, dtype=np.float64)
+            self.weight_matrix = np.column_stack([np.maximum(weight_vector, 0), np.maximum(-weight_vector, 0)])
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for i, term in enumerate(self.terms):
+                self._automaton.add_word(term, i)
+            if self.terms:
+                self._automaton.make_automaton()
+
+        # Tek yorumluk yedek yol için sözlüğe özel küçük otomat (ortak otomattaki diğer kelimeler taramayı yavaşlatmasın)
+        self.keyword_matcher = KeywordMatcher()
+        self.keyword_matcher.register(name, {
+            'sentiment': {
+                'positive': [term for term, weight in zip(self.terms, self.weights) if weight > 0],
+                'negative': [term for term, weight in zip(self.terms, self.weights) if weight < 0],
+            }
+        })
+
+    @classmethod
+    def from_word_lists(cls, words: Dict[str, Iterable[str]], name: str = 'default',
+                        positive_weight: float = 1.0, negative_weight: float = 1.0) -> 'SentimentLexicon':
+        """{'positive': [...], 'negative': [...]} listelerinden sözlük kur (aynı terim ikisinde varsa olumsuz kazanır)"""
+        weights = {term: positive_weight for term in words.get('positive', ())}
+        weights.update({term: -negative_weight for term in words.get('negative', ())})
+        return cls(weights, name=name)
+
+    def _term_ids(self, text: str) -> List[int]:
+        index = self.index
+        return [index[term] for term in self.keyword_matcher.find(text.lower()) if term in index]
+
+    def _blob_matches(self, blob: str):
+        """Birleşik metindeki eşleşmeler: (konum, terim no) dizileri; konum eşleşmenin içindeki herhangi bir karakter olabilir"""
+        if AHOCORASICK_AVAILABLE:
+            matches = np.array(list(self._automaton.iter(blob)) if self.terms else [], dtype=np.int64).reshape(-1, 2)
+            return matches[:, 0], matches[:, 1]
+
+        # Yedek: terim başına metni böl; parça uzunluklarının kümülatif toplamı eşleşme başlangıçlarıdır
+        # (çakışan tekrarlar atlanır, yorum başına varlık için yeterli)
+        positions, term_ids = [], []
+        for i, term in enumerate(self.terms):
+            pieces = blob.split(term)
+            lengths = np.fromiter(map(len, pieces), dtype=np.int64, count=len(pieces))[:-1] + len(term)
+            positions.append(np.cumsum(lengths) - len(term))
+            term_ids.append(np.full(len(pieces) - 1, i, dtype=np.int64))
+        if not positions:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(positions), np.concatenate(term_ids)
+
+    def term_matrix(self, texts: Sequence[str]):
+        """(yorum x terim) seyrek varlık matrisi (CSR)"""
+        shape = (len(texts), len(self.terms))
+        blob = _SEPARATOR.join(text or '' for text in texts).lower()
+        # Ayraç konumları (karakter indeksi); küçük harf dönüşümü uzunluğu değiştirebildiği için sonradan bulunur
+        separators = np.flatnonzero(np.frombuffer(blob.encode('utf-32-le'), dtype=np.uint32) == 0)
+        if len(separators) != max(len(texts) - 1, 0):
+            # Yorum metninde ayraç karakteri var: yorum yorum tara
+            rows = [(i, term_id) for i, text in enumerate(texts) for term_id in self._term_ids(text or '')]
+            row_ids = np.array([row for row, _ in rows], dtype=np.int64)
+            term_ids = np.array([term_id for _, term_id in rows], dtype=np.int64)
+        else:
+            positions, term_ids = self._blob_matches(blob)
+            row_ids = np.searchsorted(separators, positions)
+
+        # Aynı yorumda tekrar eden terim bir kez sayılır
+        width = max(shape[1], 1)
+        cells = np.unique(row_ids * width + term_ids)
+        data = np.ones(len(cells), dtype=np.float64)
+        return sparse.csr_matrix((data, (cells // width, cells % width)), shape=shape)
+
+    def score(self, texts: Sequence[str]) -> Dict:
+        """Her yorum için {'positive', 'negative', 'polarity'} puan dizileri"""
+        texts = list(texts)
+        if SCIPY_AVAILABLE:
+            scores = self.term_matrix(texts) @ self.weight_matrix
+            positive, negative = scores[:, 0], scores[:, 1]
+            return {'positive': positive, 'negative': negative, 'polarity': positive - negative}
+
+        positive, negative = [], []
+        for text in texts:
+            term_weights = [self.weights[i] for i in self._term_ids(text or '')]
+            positive.append(sum(w for w in term_weights if w > 0))
+            negative.append(-sum(w for w in term_weights if w < 0))
+        return {'positive': positive, 'negative': negative,
+                'polarity': [p - n for p, n in zip(positive, negative)]}
+
+    def label(self, texts: Sequence[str], mode: str = 'majority') -> List[str]:
+        """Her yorum için 'positive' / 'negative' / 'neutral' etiketi"""
+        if mode not in LABEL_MODES:
+            raise ValueError(f"Bilinmeyen etiketleme kuralı: {mode}")
+        scores = self.score(texts)
+
+        if SCIPY_AVAILABLE:
+            positive, negative = scores['positive'], scores['negative']
+            if mode == 'majority':
+                is_positive, is_negative = positive > negative, negative > positive
+            else:
+                is_positive, is_negative = (positive > 0) & (negative == 0), (negative > 0) & (positive == 0)
+            labels = np.where(is_positive, 'positive', np.where(is_negative, 'negative', 'neutral'))
+            return labels.tolist()
+
+        labels = []
+        for pos, neg in zip(scores['positive'], scores['negative']):
+            if mode == 'majority':
+                labels.append('positive' if pos > neg else 'negative' if neg > pos else 'neutral')
+            else:
+                labels.append('positive' if pos and not neg else 'negative' if neg and not pos else 'neutral')
+        return labels
+
+    def label_counts(self, texts: Sequence[str], mode: str = 'majority') -> Dict[str, int]:
+        counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        for label in self.label(texts, mode):
+            counts[label] += 1
+        return counts
+
+
+_shared_lexicons: Dict[str, SentimentLexicon] = {}
+
+
+def get_rag_lexicon() -> SentimentLexicon:
+    """RAG bileşenlerinin ortak kullandığı, bir kez derlenen sözlük"""
+    if 'rag' not in _shared_lexicons:
+        _shared_lexicons['rag'] = SentimentLexicon.from_word_lists(RAG_SENTIMENT_WORDS, name='rag')
+    return _shared_lexicons['rag']
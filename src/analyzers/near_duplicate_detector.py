@@ -0,0 +1,188 @@
+import random
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from turkish_text import TURKISH_FOLD, WORD_PATTERN
+
+# Shingle hash'lerini karıştırmak için Mersenne asal
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class NearDuplicateDetector:
+    """
+    Farklı kaynaklardan (API, web, HTML, Selenium) gelen ve küçük farklarla
+    tekrarlanan yorumları MinHash + LSH ile bulup birleştirir.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 5, seed: int = 42):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm, bands'e tam bölünmeli")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME - 1)
+        self._b = rng.randint(0, _MERSENNE_PRIME - 1)
+
+    def normalize(self, text: str) -> str:
+        """Küçük harf, Türkçe karakter katlama, noktalama ve boşluk temizliği"""
+        text = (text or '').translate(TURKISH_FOLD).lower()
+        return ' '.join(WORD_PATTERN.findall(text))
+
+    def shingles(self, normalized: str) -> set:
+        """Normalize metnin karakter k-gram hash'leri"""
+        k = self.shingle_size
+        if len(normalized) <= k:
+            return {zlib.crc32(normalized.encode('utf-8'))} if normalized else set()
+        return {zlib.crc32(normalized[i:i + k].encode('utf-8')) for i in range(len(normalized) - k + 1)}
+
+    def minhash(self, shingles: set) -> Tuple[int, ...]:
+        """
+        Shingle kümesinin MinHash imzası (one-permutation hashing).
+        Her shingle tek bir kez hash'lenip num_perm kovadan birine düşer; kova minimumları
+        imzayı oluşturur. Boş kovalar bir sonraki dolu kovadan doldurulur (densification).
+        """
+        signature = [None] * self.num_perm
+        for x in shingles:
+            h = (self._a * x + self._b) % _MERSENNE_PRIME
+            bin_idx = h % self.num_perm
+            value = h // self.num_perm
+            current = signature[bin_idx]
+            if current is None or value < current:
+                signature[bin_idx] = value
+
+        for i in range(self.num_perm):
+            if signature[i] is None:
+                # Dairesel olarak ilk dolu kovayı bul, mesafeyi ekleyerek ayırt edici tut
+                for offset in range(1, self.num_perm):
+                    donor = signature[(i + offset) % self.num_perm]
+                    if donor is not None and not isinstance(donor, tuple):
+                        signature[i] = (offset, donor)
+                        break
+        return tuple(signature)
+
+    @staticmethod
+    def jaccard(first: set, second: set) -> float:
+        if not first and not second:
+            return 1.0
+        return len(first & second) / len(first | second)
+
+    def find_clusters(self, texts: List[str]) -> List[List[int]]:
+        """Birbirinin yakın kopyası olan metinlerin indeks kümelerini döndür"""
+        # Union-find ile kümeleri birleştir
+        parent = list(range(len(texts)))
+
+        # Normalize hali birebir aynı olan metinler LSH'a girmeden doğrudan birleştirilir
+        first_seen = {}
+        shingle_sets = []
+        for idx, text in enumerate(texts):
+            normalized = self.normalize(text)
+            if normalized and normalized in first_seen:
+                parent[idx] = first_seen[normalized]
+                shingle_sets.append(set())
+            else:
+                first_seen[normalized] = idx
+                shingle_sets.append(self.shingles(normalized))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        signatures = [self.minhash(shingle_set) if shingle_set else None for shingle_set in shingle_sets]
+        # İmza uyumu bu değerin altındaysa gerçek Jaccard hesaplanmaz (ucuz ön eleme)
+        min_agreement = int((self.threshold - 0.2) * self.num_perm)
+
+        buckets = defaultdict(list)
+        for idx, shingle_set in enumerate(shingle_sets):
+            signature = signatures[idx]
+            if signature is None:
+                continue
+            size = len(shingle_set)
+            checked = set()
+            for band in range(self.bands):
+                key = (band, signature[band * self.rows:(band + 1) * self.rows])
+                bucket = buckets[key]
+                merged = False
+                for other in bucket:
+                    root_idx, root_other = find(idx), find(other)
+                    if root_idx == root_other:
+                        merged = True
+                        continue
+                    if other in checked:
+                        continue
+                    checked.add(other)
+
+                    # Boyut farkı büyükse Jaccard eşiğe ulaşamaz
+                    other_size = len(shingle_sets[other])
+                    if min(size, other_size) < self.threshold * max(size, other_size):
+                        continue
+                    other_signature = signatures[other]
+                    if sum(1 for a, b in zip(signature, other_signature) if a == b) < min_agreement:
+                        continue
+
+                    # LSH adayını gerçek Jaccard benzerliği ile doğrula
+                    if self.jaccard(shingle_set, shingle_sets[other]) >= self.threshold:
+                        parent[max(root_idx, root_other)] = min(root_idx, root_other)
+                        merged = True
+                # Kovada zaten temsilcisi olan kopyaları tekrar ekleme (kova büyümesini sınırlar)
+                if not merged:
+                    bucket.append(idx)
+
+        clusters = defaultdict(list)
+        for idx in range(len(texts)):
+            clusters[find(idx)].append(idx)
+        return [members for members in clusters.values()]
+
+    def deduplicate(self, comments: List[Dict], text_key: str = 'comment',
+                    embedding_seconds_per_comment: Optional[float] = None,
+                    return_clusters: bool = False) -> Tuple[List[Dict], Dict]:
+        """
+        Yakın kopya yorumları birleştir.
+        Her kümeden ilk görülen yorum korunur; eksik alanları (kullanıcı, tarih, puan, satıcı)
+        kümedeki diğer kopyalardan doldurulur.
+        return_clusters=True ise raporun 'clusters' alanı, dönen her yorum için kümesindeki
+        giriş indekslerini (ilki korunan yorum) verir; atılan kopyaları kaydetmek için.
+        """
+        texts = [str(comment.get(text_key, '') or '') for comment in comments]
+        clusters = self.find_clusters(texts)
+
+        clusters = sorted(clusters, key=lambda m: m[0])
+        unique_comments = []
+        for members in clusters:
+            representative = dict(comments[members[0]])
+            for other in members[1:]:
+                for key, value in comments[other].items():
+                    if value and not representative.get(key):
+                        representative[key] = value
+            unique_comments.append(representative)
+
+        removed = len(comments) - len(unique_comments)
+        report = {
+            'input_count': len(comments),
+            'unique_count': len(unique_comments),
+            'duplicates_removed': removed,
+            'dedup_ratio': round(removed / len(comments), 4) if comments else 0.0,
+            'duplicate_clusters': sum(1 for members in clusters if len(members) > 1),
+        }
+        if embedding_seconds_per_comment is not None:
+            report['embedding_seconds_saved'] = round(removed * embedding_seconds_per_comment, 3)
+        if return_clusters:
+            report['clusters'] = clusters
+
+        return unique_comments, report
+
+
+def print_dedup_report(report: Dict):
+    """Tekilleştirme raporunu yazdır"""
+    print(f"🧹 Yakın kopya temizliği: {report['input_count']} → {report['unique_count']} yorum "
+          f"(%{report['dedup_ratio'] * 100:.1f} tekrar, {report['duplicate_clusters']} küme)")
+    if 'embedding_seconds_saved' in report:
+        print(f"   ⏱️ Tahmini embedding tasarrufu: {report['embedding_seconds_saved']} saniye")
@@ -0,0 +1,202 @@
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from advanced_comment_analyzer import AdvancedCommentAnalyzer
+from analysis_cache import AnalysisCache
+from comment_summarizer import CommentSummarizer
+from compact_results import merge_compact_results
+from priority_analyzer import PriorityAnalyzer
+from rule_set import get_rule_set, use_rules
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Her işçi süreçte bir kez kurulan analizciler (derlenmiş desenler ve kelime otomatı dahil)
+_worker_advanced = None
+_worker_priority = None
+_worker_summarizer = None
+
+
+def _init_worker(cache_path: Optional[str] = None, rules: Optional[Dict] = None, rules_path: Optional[str] = None):
+    global _worker_advanced, _worker_priority, _worker_summarizer
+    # İlerleme mesajlarını ana süreç bir kez yazar; işçilerin parça başı çıktısı susturulur
+    sys.stdout = open(os.devnull, 'w')
+    # İşçiler ana süreçteki kural setiyle çalışır (havuz açıldıktan sonra dosya değişse bile)
+    if rules is not None:
+        use_rules(rules, rules_path)
+    _worker_advanced = AdvancedCommentAnalyzer(cache=AnalysisCache(cache_path) if cache_path else None)
+    _worker_priority = PriorityAnalyzer()
+    _worker_summarizer = CommentSummarizer()
+    # Otomatı ilk parçayı beklemeden derle
+    _worker_advanced.keyword_matcher.find('')
+
+
+def _analyze_chunk(task) -> Dict:
+    comments, compact = task
+    return _worker_advanced.analyze_all_comments(comments, compact=compact)
+
+
+def _analyze_negative_chunk(task) -> Dict:
+    category, negative_comments, top_k = task
+    return _worker_priority.analyze_negative_comments(category, negative_comments, top_k=top_k)
+
+
+def _summarize_chunk(task) -> Dict:
+    comments, include_beden_renk = task
+    # Kısmi özet süreçler arasında JSON uyumlu durum olarak taşınır
+    return _worker_summarizer.partial_summary(comments, include_beden_renk=include_beden_renk).to_dict()
+
+
+def merge_category_results(partials: List[Dict]) -> Dict:
+    """analyze_all_comments parça sonuçlarını (parça sırasıyla) tek sonuçta birleştir"""
+    merged = {'total_comments': 0, 'category_analysis': {}, 'filtered_comments': {}}
+    for partial in partials:
+        merged['total_comments'] += partial['total_comments']
+        for category, data in partial['category_analysis'].items():
+            target = merged['category_analysis'].setdefault(
+                category, {'total_mentions': 0, 'positive': [], 'negative': [], 'neutral': []}
+            )
+            target['total_mentions'] += data['total_mentions']
+            for sentiment in ('positive', 'negative', 'neutral'):
+                target[sentiment].extend(data[sentiment])
+        for category, data in partial['filtered_comments'].items():
+            target = merged['filtered_comments'].setdefault(category, {'positive': [], 'negative': [], 'neutral': []})
+            for sentiment in ('positive', 'negative', 'neutral'):
+                target[sentiment].extend(data[sentiment])
+    return merged
+
+
+class ParallelCommentAnalyzer:
+    """
+    Yorumları parçalara bölüp analizcileri süreç havuzunda çalıştırır ve kısmi sonuçları
+    seri çalıştırmayla aynı sırada birleştirir.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 cache_path: Optional[str] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Verilirse işçiler aynı SQLite analiz önbelleğini paylaşır
+        self.cache_path = cache_path
+        # Birleştirme adımları (öncelik skoru, özet, aksiyon planı) ana süreçte yapılır
+        self.priority_analyzer = PriorityAnalyzer()
+        self.summarizer = CommentSummarizer()
+        self._executor = None
+        self._executor_rule_version = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """İşçi havuzu; kurallar havuz açıldıktan sonra yeniden yüklendiyse havuz yeni setle kurulur"""
+        rule_set = get_rule_set()
+        if self._executor is not None and self._executor_rule_version != rule_set.version:
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.cache_path, rule_set.rules, rule_set.path)
+            )
+            self._executor_rule_version = rule_set.version
+        return self._executor
+
+    def _chunks(self, items: List) -> List[List]:
+        return [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+
+    def analyze_all_comments(self, comments: List[Dict], compact: bool = False) -> Dict:
+        """AdvancedCommentAnalyzer.analyze_all_comments'in paralel karşılığı"""
+        merge = merge_compact_results if compact else merge_category_results
+        chunks = self._chunks(comments)
+        if not chunks:
+            return merge([AdvancedCommentAnalyzer().analyze_all_comments([], compact=compact)])
+        return merge(list(self._pool().map(_analyze_chunk, [(chunk, compact) for chunk in chunks])))
+
+    def analyze_critical_issues(self, comments: List[Dict], sentiment_analysis: Dict) -> Dict:
+        """PriorityAnalyzer.analyze_critical_issues'in paralel karşılığı"""
+        print("🚨 Kritik sorun analizi başlıyor (paralel)...")
+
+        negative_by_category = self.priority_analyzer.negative_comments_by_category(sentiment_analysis)
+        # Her parça ana süreçteki analizcinin örnek sayısı kadar aday döndürür
+        top_k = self.priority_analyzer.issue_top_k
+        tasks = [
+            (category, chunk, top_k)
+            for category, negative_comments in negative_by_category.items()
+            for chunk in self._chunks(negative_comments)
+        ]
+        results = list(self._pool().map(_analyze_negative_chunk, tasks)) if tasks else []
+
+        partials_by_category = {}
+        for (category, _, _), partial in zip(tasks, results):
+            partials_by_category.setdefault(category, []).append(partial)
+
+        critical_issues = {
+            category: self.priority_analyzer.build_critical_issue(
+                category, self.priority_analyzer.merge_negative_partials(partials)
+            )
+            for category, partials in partials_by_category.items()
+        }
+        return self.priority_analyzer.finalize_critical_issues(critical_issues)
+
+    def generate_ai_summary(self, comments: List[Dict], include_beden_renk: bool = False) -> Dict:
+        """CommentSummarizer.generate_ai_summary'nin paralel karşılığı (parça özetleri sırayla birleştirilir)"""
+        tasks = [(chunk, include_beden_renk) for chunk in self._chunks(comments)]
+        partials = list(self._pool().map(_summarize_chunk, tasks)) if tasks else []
+        if not partials:
+            return self.summarizer.generate_ai_summary([], include_beden_renk=include_beden_renk)
+        return self.summarizer.merge_partial_summaries(partials).ai_summary()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def measure_scaling(comments: List[Dict], worker_counts=(1, 2, 4, 8),
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict]:
+    """
+    Farklı işçi sayılarında kategori + öncelik analizi süresi, hızlanma ve verimlilik.
+    Havuz açılışı ölçüme dahil edilmez (ısınma turu).
+    """
+    report = []
+    baseline = None
+    for workers in worker_counts:
+        with ParallelCommentAnalyzer(workers=workers, chunk_size=chunk_size) as runner:
+            # Isınma: süreçleri başlat ve analizcileri yükle
+            runner.analyze_all_comments(comments[:workers * chunk_size])
+
+            start = time.perf_counter()
+            # Her işçi sayısı için tekrarlanan ilerleme mesajları rapora karışmasın
+            with contextlib.redirect_stdout(io.StringIO()):
+                sentiment = runner.analyze_all_comments(comments)
+                runner.analyze_critical_issues(comments, sentiment)
+            elapsed = time.perf_counter() - start
+
+        # Hızlanma ilk ölçüme göre (ilk ölçüm tek işçiyse klasik t1 / tN)
+        if baseline is None:
+            baseline = elapsed * workers
+        speedup = baseline / elapsed
+        report.append({
+            'workers': workers,
+            'seconds': round(elapsed, 3),
+            'comments_per_second': round(len(comments) / elapsed, 1),
+            'speedup': round(speedup, 2),
+            'efficiency': round(speedup / workers, 2),
+        })
+    return report
+
+
+def print_scaling_report(report: List[Dict]):
+    print("⚙️ PARALEL ANALİZ ÖLÇEKLENME RAPORU")
+    print("=" * 60)
+    print(f"{'İşçi':>5} {'Süre (sn)':>10} {'Yorum/sn':>10} {'Hızlanma':>9} {'Verim':>7}")
+    for row in report:
+        print(f"{row['workers']:>5} {row['seconds']:>10.2f} {row['comments_per_second']:>10.0f} "
+              f"{row['speedup']:>8.2f}x {row['efficiency'] * 100:>6.0f}%")
+    print(f"💻 Bu makinedeki çekirdek sayısı: {os.cpu_count()}")
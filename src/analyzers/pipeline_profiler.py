@@ -0,0 +1,158 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+# Ölçüm isteğe bağlıdır: ANALYSIS_PROFILE=1 ile ya da profiler.enable() ile açılır
+PROFILE_ENABLED = os.getenv('ANALYSIS_PROFILE', '0') == '1'
+
+# items=RESULT: işlenen öğe sayısı fonksiyonun döndürdüğü koleksiyonun uzunluğudur (ör. yüklenen yorumlar)
+RESULT = object()
+
+
+class PipelineProfiler:
+    """
+    Analiz hattının aşama bazında süre, çağrı ve işlenen öğe sayılarını biriktirir.
+    Süreler kapsayıcıdır: iç içe aşamaların süresi dıştaki aşamanın süresine de dahildir.
+    Kapalıyken ölçülen fonksiyonlar sadece tek bir bayrak kontrolü ek maliyetiyle çalışır.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._stages = {}  # aşama -> [çağrı, toplam süre, öğe]
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._stages = {}
+        self.started_at = datetime.now()
+
+    def record(self, stage: str, seconds: float, items: int = 1):
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, seconds, items]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] += items
+
+    def stage(self, name: str, items: int = 1) -> '_StageTimer':
+        """Kod bloğunu ölç: `with profiler.stage('summarizer.keywords', len(comments)):`"""
+        return _StageTimer(self, name, items)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Aşama istatistikleri, toplam süreye göre azalan sırada"""
+        with self._lock:
+            stages = {stage: list(entry) for stage, entry in self._stages.items()}
+        return {
+            stage: {
+                'calls': calls,
+                'seconds': round(seconds, 6),
+                'items': items,
+                'ms_per_call': round(seconds * 1000 / calls, 4),
+                'us_per_item': round(seconds * 1e6 / items, 2) if items else None,
+            }
+            for stage, (calls, seconds, items) in sorted(stages.items(), key=lambda item: -item[1][1])
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'started_at': self.started_at.isoformat(),
+            'exported_at': datetime.now().isoformat(),
+            'stages': self.stats(),
+        }
+
+    def save(self, filename: str = 'pipeline_profile.json'):
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            print(f"📁 Aşama profili {filename} dosyasına kaydedildi")
+        except Exception as e:
+            print(f"❌ Profil kaydetme hatası: {e}")
+
+    def format_report(self, top_n: Optional[int] = None) -> str:
+        stats = self.stats()
+        if not stats:
+            return "⏱️ Aşama profili: ölçüm yok (ANALYSIS_PROFILE=1 ile açın)"
+
+        lines = ["⏱️ AŞAMA PROFİLİ (kapsayıcı süreler)", "=" * 78,
+                 f"{'Aşama':<40}{'Süre (sn)':>11}{'Çağrı':>10}{'Öğe':>10}{'µs/öğe':>7}"]
+        for stage, data in list(stats.items())[:top_n]:
+            per_item = f"{data['us_per_item']:.1f}" if data['us_per_item'] is not None else '-'
+            lines.append(f"{stage:<40}{data['seconds']:>11.3f}{data['calls']:>10}{data['items']:>10}{per_item:>7}")
+        return '\n'.join(lines)
+
+
+class _StageTimer:
+    __slots__ = ('profiler', 'name', 'items', 'start')
+
+    def __init__(self, profiler: PipelineProfiler, name: str, items: int):
+        self.profiler = profiler
+        self.name = name
+        self.items = items
+        self.start = None
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            self.profiler.record(self.name, time.perf_counter() - self.start, self.items)
+        return False
+
+
+# Tüm analizcilerin ortak profilleyicisi
+profiler = PipelineProfiler(enabled=PROFILE_ENABLED)
+
+
+def _count(value) -> int:
+    try:
+        return len(value)
+    except TypeError:
+        # Üreteç gibi uzunluğu bilinmeyen girdiler öğe sayısına katılmaz
+        return 0
+
+
+def profiled(stage: str, items=None) -> Callable:
+    """
+    Fonksiyonu `stage` aşaması olarak ölç.
+    items: None ise her çağrı bir öğedir; argüman adı verilirse o argümanın uzunluğu,
+    RESULT verilirse dönen değerin uzunluğu işlenen öğe sayısı olarak eklenir.
+    """
+    def decorator(func):
+        position = None
+        if isinstance(items, str):
+            position = list(inspect.signature(func).parameters).index(items)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if items is None:
+                count = 1
+            elif items is RESULT:
+                count = _count(result)
+            else:
+                count = _count(args[position] if position < len(args) else kwargs.get(items, ()))
+            profiler.record(stage, elapsed, count)
+            return result
+
+        return wrapper
+    return decorator
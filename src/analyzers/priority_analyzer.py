@@ -1,112 +1,74 @@
 import csv
+import heapq
 import json
+import os
 from collections import Counter, defaultdict
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 import re
-from datetime import datetime, timedelta
+from compact_results import category_comments
+from lexicon_sentiment import SCIPY_AVAILABLE, SentimentLexicon
+from pipeline_profiler import profiled
+from rule_set import get_rule_set
+from turkish_dates import comment_epoch, parse_date_column, recency_cutoff
+
+# Çok ürünlü toplu önceliklendirme için opsiyonel bağımlılıklar
+try:
+    import numpy as np
+    import pandas as pd
+    BATCH_AVAILABLE = SCIPY_AVAILABLE
+except ImportError:
+    BATCH_AVAILABLE = False
+
+# Toplu öncelik tablosunun sütunları (build_critical_issue alanlarıyla aynı adlar)
+PRIORITY_TABLE_COLUMNS = [
+    'product', 'category', 'priority_score', 'total_negative_comments', 'average_negativity',
+    'critical_keyword_mentions', 'recent_complaints', 'business_impact', 'urgency_multiplier',
+    'volume_multiplier', 'time_multiplier', 'department'
+]
+
+# Kategori başına sonuçta saklanan örnek şikayet sayısı (olumsuzluk ve yakınlığa göre en önemli k yorum)
+ISSUE_TOP_K = int(os.getenv('PRIORITY_ISSUE_TOP_K', 5))
 
 class PriorityAnalyzer:
-    def __init__(self):
-        # Öncelik kategorileri ve iş etkisi ağırlıkları
-        self.priority_categories = {
-            'kargo': {
-                'business_impact': 9,  # 1-10 skala (10 en yüksek)
-                'urgency_multiplier': 1.2,
-                'description': 'Teslimat ve lojistik sorunları',
-                'critical_keywords': ['hasarlı', 'kırık', 'geç', 'gelmedi', 'kayıp', 'zarar', 'bozuk paket'],
-                'department': 'Lojistik'
-            },
-            'kalite': {
-                'business_impact': 10,
-                'urgency_multiplier': 1.5,
-                'description': 'Ürün kalitesi ve üretim sorunları',
-                'critical_keywords': ['bozuk', 'defolu', 'kırık', 'çalışmıyor', 'sahte', 'taklit', 'berbat'],
-                'department': 'Kalite Kontrol'
-            },
-            'beden_uyum': {
-                'business_impact': 8,
-                'urgency_multiplier': 1.1,
-                'description': 'Beden ve uyum sorunları (iade riski yüksek)',
-                'critical_keywords': ['hiç uymadı', 'çok büyük', 'çok küçük', 'berbat kalıp', 'iade'],
-                'department': 'Ürün Yönetimi'
-            },
-            'musteri_hizmeti': {
-                'business_impact': 7,
-                'urgency_multiplier': 1.3,
-                'description': 'Müşteri hizmetleri ve destek sorunları',
-                'critical_keywords': ['kaba', 'ilgisiz', 'çözüm yok', 'dönmüyor', 'saygısız'],
-                'department': 'Müşteri Hizmetleri'
-            },
-            'fiyat': {
-                'business_impact': 6,
-                'urgency_multiplier': 0.8,
-                'description': 'Fiyatlandırma ve değer algısı',
-                'critical_keywords': ['çok pahalı', 'değmez', 'fahiş', 'aşırı', 'hırsızlık'],
-                'department': 'Fiyatlandırma'
-            },
-            'urun_ozellikleri': {
-                'business_impact': 8,
-                'urgency_multiplier': 1.2,
-                'description': 'Ürün fonksiyonelliği ve performans',
-                'critical_keywords': ['çalışmıyor', 'bozuk', 'işe yaramaz', 'anlattığı gibi değil'],
-                'department': 'Ürün Geliştirme'
-            },
-            'renk_gorsel': {
-                'business_impact': 5,
-                'urgency_multiplier': 0.9,
-                'description': 'Görsel uyumsuzluk ve renk sorunları',
-                'critical_keywords': ['hiç benzemez', 'bambaşka', 'aldatmaca', 'yanıltıcı'],
-                'department': 'E-ticaret'
-            }
-        }
-        
-        # Olumsuzluk derecesi hesaplama
-        self.negativity_indicators = {
-            'extreme': {
-                'keywords': ['berbat', 'rezalet', 'çöp', 'hiç beğenmedim', 'pişman oldum', 'aldatmaca', 'hırsızlık'],
-                'score': 10,
-                'description': 'Aşırı olumsuz - acil müdahale'
-            },
-            'severe': {
-                'keywords': ['kötü', 'berbat', 'sorunlu', 'memnun değilim', 'beğenmedim', 'iade'],
-                'score': 8,
-                'description': 'Şiddetli olumsuz - hızlı çözüm gerekli'
-            },
-            'moderate': {
-                'keywords': ['idare eder', 'orta', 'beklediğim gibi değil', 'eksik', 'vasat'],
-                'score': 5,
-                'description': 'Orta seviye olumsuz - takip gerekli'
-            },
-            'mild': {
-                'keywords': ['fena değil', 'normal', 'olabilir'],
-                'score': 3,
-                'description': 'Hafif olumsuz - gözlem altında'
-            }
-        }
-        
-        # Aciliyet göstergeleri
-        self.urgency_indicators = {
-            'volume_based': {
-                'high_volume_threshold': 10,  # Bu kategoride 10+ şikayet varsa acil
-                'multiplier': 1.3
-            },
-            'time_based': {
-                'recent_days': 7,  # Son 7 gün
-                'multiplier': 1.2
-            },
-            'repeat_customer': {
-                'multiplier': 1.4  # Aynı müşterinin tekrar şikayet etmesi
-            }
-        }
+    def __init__(self, issue_top_k: int = ISSUE_TOP_K):
+        # Öncelik kategorileri (iş etkisi ağırlıkları), olumsuzluk seviyeleri ve aciliyet göstergeleri
+        # analysis_rules.json'dan gelir; kelimeler ortak otomata kural setiyle birlikte derlenir
+        get_rule_set()
+        self._batch_lexicon = None
+        # Tüm negatif yorumların detayı sonuçta tutulmaz (bkz. iter_issue_details)
+        self.issue_top_k = issue_top_k
+
+    @property
+    def rules(self):
+        return get_rule_set()
+
+    @property
+    def priority_categories(self) -> Dict:
+        return self.rules.priority_categories
+
+    @property
+    def negativity_indicators(self) -> Dict:
+        return self.rules.negativity_indicators
 
+    @property
+    def urgency_indicators(self) -> Dict:
+        return self.rules.urgency_indicators
+
+    @property
+    def keyword_matcher(self):
+        return self.rules.keyword_matcher
+
+    @profiled('priority.negativity_score')
     def calculate_negativity_score(self, comment_text: str) -> Dict:
         """Yorumun olumsuzluk skorunu hesapla"""
-        text_lower = comment_text.lower()
-        
+        return self.negativity_from_keywords(self.keyword_matcher.find(comment_text.lower()))
+
+    def negativity_from_keywords(self, found) -> Dict:
+        """Metinde bulunan anahtar kelime kümesinden olumsuzluk skorunu hesapla"""
         # Her seviye için skorları hesapla
         level_scores = {}
         for level, data in self.negativity_indicators.items():
-            found_keywords = [kw for kw in data['keywords'] if kw in text_lower]
+            found_keywords = [kw for kw in data['keywords'] if kw in found]
             if found_keywords:
                 level_scores[level] = {
                     'score': data['score'],
@@ -133,6 +95,10 @@ class PriorityAnalyzer:
                 'all_levels': {}
             }
 
+    def find_critical_keywords(self, category: str, found) -> List[str]:
+        """Kategorinin kritik kelimelerinden metinde bulunanlar (liste sırasıyla)"""
+        return [keyword for keyword in self.priority_categories[category]['critical_keywords'] if keyword in found]
+
     def calculate_priority_score(self, category: str, negativity_data: Dict, 
                                comment_count: int, recent_count: int) -> Dict:
         """Öncelik skorunu hesapla"""
@@ -178,6 +144,7 @@ class PriorityAnalyzer:
             'description': cat_data['description']
         }
 
+    @profiled('priority.analyze_critical_issues', items='comments')
     def analyze_critical_issues(self, comments: List[Dict], 
                               sentiment_analysis: Dict) -> Dict:
         """Kritik sorunları analiz et ve önceliklendir"""
@@ -185,92 +152,271 @@ class PriorityAnalyzer:
         print("🚨 Kritik sorun analizi başlıyor...")
         
         critical_issues = {}
-        category_analysis = sentiment_analysis.get('category_analysis', {})
         
         # Her kategori için analiz
-        for category, data in category_analysis.items():
-            if category not in self.priority_categories:
-                continue
-                
-            negative_comments = data.get('negative', [])
-            if not negative_comments:
-                continue
-            
+        for category, negative_comments in self.negative_comments_by_category(sentiment_analysis).items():
             print(f"🔍 {category} kategorisi analiz ediliyor...")
             
             # Negatif yorumları detaylı analiz et
-            issue_details = []
-            total_negativity = 0
-            critical_count = 0
-            recent_count = 0
-            
-            # Son 7 gün için tarih kontrolü
-            recent_date = datetime.now() - timedelta(days=7)
-            
-            for comment_data in negative_comments:
-                comment_text = comment_data.get('comment', '')
-                comment_date = comment_data.get('date', '')
-                
-                # Olumsuzluk skorunu hesapla
-                negativity_data = self.calculate_negativity_score(comment_text)
-                total_negativity += negativity_data['negativity_score']
-                
-                # Kritik kelime kontrolü
-                critical_keywords = []
-                for keyword in self.priority_categories[category]['critical_keywords']:
-                    if keyword in comment_text.lower():
-                        critical_keywords.append(keyword)
-                        critical_count += 1
-                
-                # Son 7 gün kontrolü (basit string kontrolü)
-                is_recent = False
-                try:
-                    # Farklı tarih formatlarını dene
-                    for date_format in ['%d %B %Y', '%d.%m.%Y', '%Y-%m-%d']:
-                        try:
-                            comment_dt = datetime.strptime(comment_date, date_format)
-                            if comment_dt >= recent_date:
-                                is_recent = True
-                                recent_count += 1
-                            break
-                        except:
-                            continue
-                except:
-                    pass
-                
-                issue_details.append({
-                    'comment': comment_text[:200] + '...',
-                    'user': comment_data.get('user', 'Anonim'),
-                    'date': comment_date,
-                    'negativity_data': negativity_data,
-                    'critical_keywords': critical_keywords,
-                    'is_recent': is_recent
-                })
-            
-            # Ortalama olumsuzluk skoru
-            avg_negativity = total_negativity / len(negative_comments) if negative_comments else 0
-            
-            # Öncelik skorunu hesapla
-            priority_data = self.calculate_priority_score(
-                category,
-                {'negativity_score': avg_negativity},
-                len(negative_comments),
-                recent_count
-            )
+            partial = self.analyze_negative_comments(category, negative_comments)
+            critical_issues[category] = self.build_critical_issue(category, partial)
+        
+        return self.finalize_critical_issues(critical_issues)
+
+    def negative_comments_by_category(self, sentiment_analysis: Dict) -> Dict[str, List[Dict]]:
+        """Önceliklendirilecek kategorilerin negatif yorumları"""
+        negative_by_category = {}
+        for category in sentiment_analysis.get('category_analysis', {}):
+            if category not in self.priority_categories:
+                continue
+            negative_comments = category_comments(sentiment_analysis, category, 'negative')
+            if negative_comments:
+                negative_by_category[category] = negative_comments
+        return negative_by_category
+
+    def _score_issue(self, category: str, comment_data: Dict, recent_cutoff: int) -> Tuple[Dict, List[str], Optional[int], bool]:
+        """Negatif yorumun olumsuzluk verisi, kritik kelimeleri, epoch tarihi ve son 7 günde olup olmadığı"""
+        comment_text = comment_data.get('comment', '')
+        
+        # Olumsuzluk skorunu hesapla
+        negativity_data = self.calculate_negativity_score(comment_text)
+        
+        # Kritik kelime kontrolü (olumsuzluk taramasıyla aynı önbelleklenmiş geçiş)
+        found = self.keyword_matcher.find(comment_text.lower())
+        critical_keywords = self.find_critical_keywords(category, found)
+        
+        # Son 7 gün kontrolü (Türkçe ay adları dahil, tarih başına bir kez çözülür)
+        epoch = comment_epoch(comment_data)
+        is_recent = epoch is not None and epoch >= recent_cutoff
+        return negativity_data, critical_keywords, epoch, is_recent
+
+    @staticmethod
+    def _issue_detail(comment_data: Dict, negativity_data: Dict, critical_keywords: List[str], is_recent: bool) -> Dict:
+        return {
+            'comment': comment_data.get('comment', '')[:200] + '...',
+            'user': comment_data.get('user', 'Anonim'),
+            'date': comment_data.get('date', ''),
+            'negativity_data': negativity_data,
+            'critical_keywords': critical_keywords,
+            'is_recent': is_recent
+        }
+
+    @profiled('priority.analyze_negative_comments', items='negative_comments')
+    def analyze_negative_comments(self, category: str, negative_comments: List[Dict], top_k: Optional[int] = None) -> Dict:
+        """
+        Bir kategorinin negatif yorumlarını analiz et.
+        Sonuç kısmi bir özettir: aynı kategorinin farklı parçaları merge_negative_partials ile birleştirilebilir.
+        Detaylar sadece en önemli top_k yorum için (olumsuzluk, sonra yakınlık; eşitlikte önce gelen) tutulur.
+        """
+        top_k = self.issue_top_k if top_k is None else top_k
+        total_negativity = 0
+        critical_count = 0
+        recent_count = 0
+        # Sınırlı min-heap: kökte tutulan en az önemli örnek, yenisi daha önemliyse yer değiştirir
+        heap = []
+        
+        # Son 7 gün için tarih kontrolü (epoch karşılaştırması)
+        recent_cutoff = recency_cutoff(days=7)
+        
+        for index, comment_data in enumerate(negative_comments):
+            negativity_data, critical_keywords, epoch, is_recent = self._score_issue(category, comment_data, recent_cutoff)
+            total_negativity += negativity_data['negativity_score']
+            critical_count += len(critical_keywords)
+            if is_recent:
+                recent_count += 1
             
-            critical_issues[category] = {
-                'priority_score': priority_data['priority_score'],
-                'priority_details': priority_data,
-                'total_negative_comments': len(negative_comments),
-                'average_negativity': round(avg_negativity, 1),
-                'critical_keyword_mentions': critical_count,
-                'recent_complaints': recent_count,
-                'issue_details': issue_details[:5],  # En fazla 5 örnek
-                'all_issue_details': issue_details,
-                'category_info': self.priority_categories[category]
-            }
+            rank = (negativity_data['negativity_score'], epoch if epoch is not None else -1, -index)
+            if len(heap) < top_k:
+                heapq.heappush(heap, (rank, self._issue_detail(comment_data, negativity_data, critical_keywords, is_recent)))
+            elif top_k and rank > heap[0][0]:
+                heapq.heapreplace(heap, (rank, self._issue_detail(comment_data, negativity_data, critical_keywords, is_recent)))
         
-        # Öncelik sırasına göre sırala
+        return {
+            'comment_count': len(negative_comments),
+            'total_negativity': total_negativity,
+            'critical_count': critical_count,
+            'recent_count': recent_count,
+            # [olumsuzluk, epoch, parçadaki sıra, detay], en önemliden başlayarak
+            'top_issues': [
+                [score, epoch, -negative_index, detail]
+                for (score, epoch, negative_index), detail in sorted(heap, key=lambda item: item[0], reverse=True)
+            ]
+        }
+
+    def iter_issue_details(self, sentiment_analysis: Dict, category: str) -> Iterator[Dict]:
+        """
+        Kategorinin tüm negatif yorum detayları, yorum sırasıyla ve istendikçe üretilir.
+        analyze_critical_issues sonucunda sadece en önemli issue_top_k örnek bulunur.
+        """
+        recent_cutoff = recency_cutoff(days=7)
+        for comment_data in category_comments(sentiment_analysis, category, 'negative'):
+            negativity_data, critical_keywords, _, is_recent = self._score_issue(category, comment_data, recent_cutoff)
+            yield self._issue_detail(comment_data, negativity_data, critical_keywords, is_recent)
+
+    def _priority_lexicon(self, rules) -> SentimentLexicon:
+        """Olumsuzluk ve kritik kelimelerin toplu tarama sözlüğü (kural sürümü başına bir kez derlenir)"""
+        if self._batch_lexicon is None or self._batch_lexicon[0] != rules.version:
+            terms = {kw for data in rules.negativity_indicators.values() for kw in data['keywords']}
+            terms |= {kw for data in rules.priority_categories.values() for kw in data['critical_keywords']}
+            self._batch_lexicon = (rules.version, SentimentLexicon({term: 1.0 for term in terms}, name='priority'))
+        return self._batch_lexicon[1]
+
+    @profiled('priority.negative_issue_table', items='frame')
+    def negative_issue_table(self, frame: 'pd.DataFrame', batch_result: Dict,
+                             product_column: str = 'product') -> 'pd.DataFrame':
+        """
+        AdvancedCommentAnalyzer.analyze_batch sonucundan önceliklendirilecek negatif (yorum, kategori) satırları.
+        frame analyze_batch'e verilen yorum tablosudur (ör. CommentStore.read_frame); dönen tabloda
+        product, category, comment ve date_epoch (yoksa date) sütunları bulunur.
+        """
+        categories = [c for c in batch_result['categories'] if c in self.priority_categories]
+        columns = [batch_result['categories'].index(c) for c in categories]
+        negative = batch_result['relevant'][:, columns] & (batch_result['sentiment'][:, columns] == -1)
+        rows, category_ids = np.nonzero(negative)
+
+        date_column = 'date_epoch' if 'date_epoch' in frame.columns else 'date'
+        return pd.DataFrame({
+            'product': np.asarray(frame[product_column].astype(object))[rows],
+            'category': np.asarray(categories, dtype=object)[category_ids],
+            'comment': np.asarray(frame['comment'].astype(object))[rows],
+            date_column: np.asarray(frame[date_column].astype(object))[rows],
+        })
+
+    @profiled('priority.prioritize_products', items='issues')
+    def prioritize_products(self, issues: 'pd.DataFrame', product_column: str = 'product',
+                            recent_days: int = 7) -> 'pd.DataFrame':
+        """
+        Çok ürünlü toplu önceliklendirme: her (ürün, kategori) için analyze_critical_issues'daki
+        öncelik skoru, tek tabloda ve öncelik sırasıyla.
+
+        issues her negatif (yorum, kategori) çifti için bir satırdır (bkz. negative_issue_table):
+        product, category, comment ve date_epoch ya da date sütunları. Olumsuzluk ve kritik kelime
+        puanları tekil yorum metinlerinin seyrek terim matrisinden matris çarpımıyla, hacim ve
+        yakınlık sayımları (ürün, kategori) gruplarında bincount ile hesaplanır; ürün başına döngü yoktur.
+        Dönen tablonun sütunları PRIORITY_TABLE_COLUMNS'tur; bir ürünün en acil sorunu ilk satırıdır.
+        Ürünü boş yorumlar ürünü boş (NaN) satırlarda toplanır.
+        """
+        if not BATCH_AVAILABLE:
+            raise RuntimeError("Toplu önceliklendirme için numpy, pandas ve scipy gerekli")
+
+        rules = self.rules
+        categories = list(rules.priority_categories)
+        issues = issues[issues['category'].isin(categories)]
+        if issues.empty:
+            return pd.DataFrame(columns=PRIORITY_TABLE_COLUMNS)
+
+        # 1. Yorum başına olumsuzluk ve kritik kelime puanları (her tekil metin bir kez taranır)
+        lexicon = self._priority_lexicon(rules)
+        text_codes, texts = pd.factorize(issues['comment'].astype(object).fillna('').astype(str))
+        presence = lexicon.term_matrix(list(texts))
+
+        levels = list(rules.negativity_indicators)
+        level_terms = np.zeros((len(lexicon.terms), len(levels)))
+        for j, level in enumerate(levels):
+            level_terms[[lexicon.index[kw] for kw in set(rules.negativity_indicators[level]['keywords'])], j] = 1
+        level_scores = np.array([rules.negativity_indicators[level]['score'] for level in levels])
+        # En yüksek seviyenin skoru (hiç kelime yoksa 0), negativity_from_keywords ile aynı
+        level_hits = np.asarray(presence @ level_terms) > 0
+        text_negativity = np.where(level_hits, level_scores, 0).max(axis=1)
+
+        critical_terms = np.zeros((len(lexicon.terms), len(categories)))
+        for j, category in enumerate(categories):
+            critical_terms[[lexicon.index[kw] for kw in set(rules.priority_categories[category]['critical_keywords'])], j] = 1
+        text_critical = np.asarray(presence @ critical_terms)
+
+        category_ids = pd.Categorical(issues['category'], categories=categories).codes.astype(np.int64)
+        negativity = text_negativity[text_codes]
+        critical = text_critical[text_codes, category_ids]
+
+        # 2. Son recent_days gün içindeki şikayetler
+        if 'date_epoch' in issues.columns:
+            epochs = pd.to_numeric(issues['date_epoch'], errors='coerce').to_numpy(dtype=float)
+        else:
+            epochs = np.array([np.nan if e is None else e for e in parse_date_column(issues['date'])], dtype=float)
+        recent = epochs >= recency_cutoff(days=recent_days)
+
+        # 3. (ürün, kategori) grup toplamları
+        # Ürünü boş (None/NaN) yorumlar atılmaz, tek bir 'ürünsüz' grupta toplanır (-1 kodu bincount'u bozar)
+        product_codes, products = pd.factorize(issues[product_column], use_na_sentinel=False)
+        groups = product_codes.astype(np.int64) * len(categories) + category_ids
+        size = len(products) * len(categories)
+        comment_count = np.bincount(groups, minlength=size)
+        present = np.flatnonzero(comment_count)
+        comment_count = comment_count[present]
+        total_negativity = np.bincount(groups, weights=negativity, minlength=size)[present]
+        critical_count = np.bincount(groups, weights=critical, minlength=size)[present].astype(np.int64)
+        recent_count = np.bincount(groups, weights=recent, minlength=size)[present].astype(np.int64)
+        group_products, group_categories = np.divmod(present, len(categories))
+
+        # 4. calculate_priority_score'un vektörel hali
+        business_impact = np.array([rules.priority_categories[c]['business_impact'] for c in categories])[group_categories]
+        urgency = np.array([rules.priority_categories[c]['urgency_multiplier'] for c in categories])[group_categories]
+        volume = rules.urgency_indicators['volume_based']
+        volume_multiplier = np.where(comment_count >= volume['high_volume_threshold'], volume['multiplier'], 1.0)
+        time_multiplier = np.where(recent_count > 0, rules.urgency_indicators['time_based']['multiplier'], 1.0)
+        average_negativity = total_negativity / comment_count
+        priority_score = (business_impact * 0.4 + average_negativity * 0.6) * urgency * volume_multiplier * time_multiplier
+        priority_score = np.minimum(priority_score * 10, 100)
+
+        table = pd.DataFrame({
+            'product': np.asarray(products, dtype=object)[group_products],
+            'category': np.asarray(categories, dtype=object)[group_categories],
+            'priority_score': [round(score, 1) for score in priority_score.tolist()],
+            'total_negative_comments': comment_count,
+            'average_negativity': [round(value, 1) for value in average_negativity.tolist()],
+            'critical_keyword_mentions': critical_count,
+            'recent_complaints': recent_count,
+            'business_impact': business_impact,
+            'urgency_multiplier': urgency,
+            'volume_multiplier': volume_multiplier,
+            'time_multiplier': time_multiplier,
+            'department': [rules.priority_categories[categories[c]]['department'] for c in group_categories],
+        }, columns=PRIORITY_TABLE_COLUMNS)
+        return table.sort_values('priority_score', ascending=False, kind='stable').reset_index(drop=True)
+
+    def merge_negative_partials(self, partials: List[Dict], top_k: Optional[int] = None) -> Dict:
+        """Aynı kategorinin sıralı parça sonuçlarını tek kısmi sonuçta birleştir (örnekler yine en önemli k)"""
+        top_k = self.issue_top_k if top_k is None else top_k
+        merged = {'comment_count': 0, 'total_negativity': 0, 'critical_count': 0, 'recent_count': 0, 'top_issues': []}
+        candidates = []
+        for partial in partials:
+            # Parça içi sıra, önceki parçaların yorum sayısı kadar kaydırılarak tek geçişteki sıraya çevrilir
+            offset = merged['comment_count']
+            candidates.extend([score, epoch, order + offset, detail] for score, epoch, order, detail in partial['top_issues'])
+            for key in ('comment_count', 'total_negativity', 'critical_count', 'recent_count'):
+                merged[key] += partial[key]
+        merged['top_issues'] = heapq.nlargest(top_k, candidates, key=lambda issue: (issue[0], issue[1], -issue[2]))
+        return merged
+
+    def build_critical_issue(self, category: str, partial: Dict) -> Dict:
+        """Kategorinin kısmi analiz sonucundan öncelik kaydını üret"""
+        comment_count = partial['comment_count']
+        
+        # Ortalama olumsuzluk skoru
+        avg_negativity = partial['total_negativity'] / comment_count if comment_count else 0
+        
+        # Öncelik skorunu hesapla
+        priority_data = self.calculate_priority_score(
+            category,
+            {'negativity_score': avg_negativity},
+            comment_count,
+            partial['recent_count']
+        )
+        
+        return {
+            'priority_score': priority_data['priority_score'],
+            'priority_details': priority_data,
+            'total_negative_comments': comment_count,
+            'average_negativity': round(avg_negativity, 1),
+            'critical_keyword_mentions': partial['critical_count'],
+            'recent_complaints': partial['recent_count'],
+            # Olumsuzluk ve yakınlığa göre en önemli örnekler; tümü için iter_issue_details
+            'issue_details': [detail for _, _, _, detail in partial['top_issues']],
+            'category_info': self.priority_categories[category]
+        }
+
+    def finalize_critical_issues(self, critical_issues: Dict) -> Dict:
+        """Kategori kayıtlarını öncelik sırasına diz, özet ve aksiyon planını ekle"""
         sorted_issues = dict(sorted(
             critical_issues.items(),
             key=lambda x: x[1]['priority_score'],
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from analysis_cache import compute_rule_version
+from contextual_keyword_analyzer import ContextualKeywordAnalyzer
+from keyword_matcher import KeywordMatcher, replace_shared_namespaces
+
+# Kategori, bağlam, öncelik ve özet kuralları kod yerine sürümlü bir dosyada tutulur
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analysis_rules.json')
+RULES_FILE = os.getenv('ANALYSIS_RULES_FILE', DEFAULT_RULES_FILE)
+
+RULE_SECTIONS = (
+    'categories', 'contextual_keywords', 'positive_indicators', 'priority_categories',
+    'negativity_indicators', 'urgency_indicators', 'summary_categories', 'beden_renk_categories',
+    'textile_keywords'
+)
+
+
+class RuleSet:
+    """
+    Kural dosyasının derlenmiş, değiştirilmeyen hali: anahtar kelimeler ortak otomata,
+    bağlamsal desenler birleşik regex'lere bir kez derlenir ve tüm analizciler aynı nesneyi paylaşır.
+    Kurallar değişince yeni bir RuleSet derlenir ve install ile tek atamada devreye alınır;
+    analizciler çağrı başında güncel seti alır, yarım kalmış çağrılar eski setle tamamlanır.
+    """
+
+    def __init__(self, rules: Dict, path: Optional[str] = None, mtime: Optional[int] = None):
+        missing = [section for section in RULE_SECTIONS if section not in rules]
+        if missing:
+            raise ValueError(f"Kural dosyasında eksik bölümler: {', '.join(missing)}")
+
+        self.rules = rules
+        self.path = path
+        self.mtime = mtime
+        self.declared_version = str(rules.get('version', 0))
+        # Dosyadaki sürüm + içerik hash'i: sürüm artırılmasa da kural değişikliği yeni sürüm üretir
+        self.version = f"{self.declared_version}-{compute_rule_version(rules)}"
+
+        self.categories = rules['categories']
+        self.contextual_keywords = rules['contextual_keywords']
+        self.positive_indicators = rules['positive_indicators']
+        self.priority_categories = rules['priority_categories']
+        self.negativity_indicators = rules['negativity_indicators']
+        self.urgency_indicators = rules['urgency_indicators']
+        self.summary_categories = rules['summary_categories']
+        self.beden_renk_categories = rules['beden_renk_categories']
+        self.textile_keywords = rules['textile_keywords']
+
+        # Desenler burada derlenir; geçersiz regex yeni setin devreye alınmasını engeller
+        self.contextual_analyzer = ContextualKeywordAnalyzer(self.contextual_keywords, self.positive_indicators)
+        # install ile ortak otomat atanana kadar sadece bu setin kelimelerini içeren otomat
+        self.keyword_matcher = KeywordMatcher()
+        for namespace, vocabularies in self.vocabularies().items():
+            self.keyword_matcher.register(namespace, vocabularies)
+
+    @classmethod
+    def load(cls, path: str = RULES_FILE) -> 'RuleSet':
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), path=path, mtime=mtime)
+
+    def vocabularies(self) -> Dict[str, Dict[str, Dict[str, list]]]:
+        """Ortak otomata kaydedilen kural namespace'leri"""
+        return {
+            'advanced': self.categories,
+            'contextual': {
+                category: {'primary_keywords': self.contextual_analyzer.get_primary_keywords(category)}
+                for category in self.contextual_keywords
+            },
+            'negativity': {level: {'keywords': data['keywords']} for level, data in self.negativity_indicators.items()},
+            'critical': {
+                category: {'critical_keywords': data['critical_keywords']}
+                for category, data in self.priority_categories.items()
+            },
+            'summary_categories': {
+                'categories': {**self.summary_categories, **self.beden_renk_categories},
+                'textile': {'keywords': self.textile_keywords},
+            },
+        }
+
+    def section_version(self, *sections: str) -> str:
+        """Sadece verilen bölümlerden türeyen sürüm (ör. kategori analizi önbelleği için)"""
+        return f"{self.declared_version}-{compute_rule_version(*(self.rules[section] for section in sections))}"
+
+    def install(self):
+        """Kelimeleri ortak otomatta değiştir (diğer analizcilerin kayıtları korunur)"""
+        self.keyword_matcher = replace_shared_namespaces(self.vocabularies())
+
+
+_current: Optional[RuleSet] = None
+_lock = threading.Lock()
+# Derlenemeyen dosya (yol, değişiklik zamanı): dosya tekrar değişene kadar her kontrolde yeniden denenmez
+_rejected = None
+
+
+def get_rule_set() -> RuleSet:
+    """Güncel derlenmiş kural seti (ilk çağrıda dosyadan yüklenir)"""
+    global _current
+    if _current is None:
+        with _lock:
+            if _current is None:
+                rule_set = RuleSet.load(RULES_FILE)
+                rule_set.install()
+                _current = rule_set
+    return _current
+
+
+def use_rules(rules: Dict, path: Optional[str] = None) -> RuleSet:
+    """Verilen kuralları dosya okumadan derleyip devreye al (ör. işçi süreçlerde ana sürecin seti)"""
+    global _current
+    rule_set = RuleSet(rules, path=path)
+    with _lock:
+        if _current is None or _current.version != rule_set.version:
+            rule_set.install()
+            _current = rule_set
+    return _current
+
+
+def reload_rules(path: Optional[str] = None, force: bool = False) -> bool:
+    """
+    Kural dosyası değiştiyse yeni seti derleyip devreye al; değiştiyse True döner.
+    Dosya okunamaz ya da kurallar derlenemezse eski set kullanılmaya devam eder.
+    """
+    global _current, _rejected
+    current = get_rule_set()
+    path = path or current.path
+    with _lock:
+        mtime = None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            if not force and ((path == current.path and mtime == current.mtime) or (path, mtime) == _rejected):
+                return False
+            rule_set = RuleSet.load(path)
+        except Exception as e:
+            _rejected = (path, mtime)
+            print(f"⚠️ Kurallar yeniden yüklenemedi, mevcut sürüm kullanılıyor ({current.version}): {e}")
+            return False
+
+        if rule_set.version == current.version and not force:
+            # Sadece dosya zamanı değişmiş: tekrar kontrol edilmesin
+            current.mtime = rule_set.mtime
+            current.path = rule_set.path
+            return False
+
+        rule_set.install()
+        _current = rule_set
+    print(f"🔁 Analiz kuralları yeniden yüklendi: {current.version} -> {rule_set.version}")
+    return True
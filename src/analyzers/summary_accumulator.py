@@ -0,0 +1,243 @@
+import random
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+class SummaryAccumulator:
+    """
+    CommentSummarizer.generate_ai_summary'nin tek geçişli hali.
+    Her yorum bir kez temizlenip taranır; özet ifadeleri, artı/eksi ifadeleri, kategori
+    sayıları ve örnekleri, duygu, puan ve satıcı sayaçları aynı adımda güncellenir.
+    Sonuç bölümleri summarizer'ın biçimlendirme metotlarıyla üretilir, böylece çıktı
+    ayrı ayrı çalışan metotlarla birebir aynıdır.
+    """
+
+    def __init__(self, summarizer, include_beden_renk: Optional[bool] = False, top_n_examples: int = 3,
+                 sample_examples: bool = False, seed: int = 42):
+        """
+        include_beden_renk=None ise beden/uyum ve renk/model bölümleri yorumlarda tekstil
+        kelimesi geçtiğinde eklenir (is_textile_product). sample_examples=True ise kategori
+        örnekleri ilk N yorum yerine tüm akıştan rezervuar örneklemesiyle seçilir.
+        """
+        self.summarizer = summarizer
+        self.keyword_matcher = summarizer.keyword_matcher
+        self.include_beden_renk = include_beden_renk
+        self.top_n_examples = top_n_examples
+        self.sample_examples = sample_examples
+        self._rng = random.Random(seed)
+
+        # Beden/renk kategorileri her zaman sayılır, çıktıya eklenip eklenmeyeceği sonda belirlenir
+        self.categories = {**summarizer.summary_categories, **summarizer.beden_renk_categories}
+        self.textile_keywords = set(summarizer.textile_keywords)
+        self.has_textile = False
+
+        self.total = 0
+        self.sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        self.rating_counts = Counter()
+        self.seller_counts = Counter()
+        self.summary_counters = {'positive': {}, 'negative': {}}
+        self.pros_cons_counters = {'positive': {}, 'negative': {}}
+        self.category_counts = {category: 0 for category in self.categories}
+        self.category_examples = {category: [] for category in self.categories}
+
+        # Liste sırasını korumak için ifade -> konum; yorum başına sadece bulunan kelimeler gezilir
+        self._phrase_positions = {
+            (group, polarity): {phrase: i for i, phrase in enumerate(phrases)}
+            for group, lists in (('summary', summarizer.summary_phrases), ('pros_cons', summarizer.pros_cons_phrases))
+            for polarity, phrases in lists.items()
+        }
+        self._keyword_categories = {}
+        for category, keywords in self.categories.items():
+            for kw in keywords:
+                self._keyword_categories.setdefault(kw, set()).add(category)
+
+    def _count_phrases(self, counter: Dict, positions: Dict, found):
+        # Sayaç ekleme sırası ayrı metotlardaki liste sırasıyla aynı olmalı (eşit sayılarda sıralama bunu korur)
+        for phrase in sorted(found.intersection(positions), key=positions.get):
+            counter[phrase] = counter.get(phrase, 0) + 1
+
+    def add(self, comment: Dict):
+        """Tek yorumu tüm sayaçlara işle"""
+        summarizer = self.summarizer
+        text = comment.get('comment', '')
+        self.total += 1
+
+        # Duygu: ham metnin küçük harfli hali (analyze_sentiment ile aynı)
+        lowered = text.lower()
+        if lowered:
+            found = self.keyword_matcher.find(lowered)
+            pos_score = len(found & summarizer.sentiment_words['positive'])
+            neg_score = len(found & summarizer.sentiment_words['negative'])
+            if pos_score > neg_score:
+                self.sentiment_counts['positive'] += 1
+            elif neg_score > pos_score:
+                self.sentiment_counts['negative'] += 1
+            else:
+                self.sentiment_counts['neutral'] += 1
+
+            if not self.has_textile and not found.isdisjoint(self.textile_keywords):
+                self.has_textile = True
+
+        # İfade ve kategori sayaçları: temizlenmiş metin, tek tarama
+        found = self.keyword_matcher.find(summarizer.clean_text(text))
+        for polarity in ('positive', 'negative'):
+            self._count_phrases(self.summary_counters[polarity], self._phrase_positions['summary', polarity], found)
+            self._count_phrases(self.pros_cons_counters[polarity], self._phrase_positions['pros_cons', polarity], found)
+
+        hit_categories = set()
+        for kw in found:
+            hit_categories.update(self._keyword_categories.get(kw, ()))
+        for category in self.categories:
+            if category in hit_categories:
+                self.category_counts[category] += 1
+                self._offer_example(category, text)
+
+        rating = comment.get('rating', '')
+        if rating and rating.isdigit():
+            self.rating_counts[int(rating)] += 1
+        self.seller_counts[comment.get('seller', 'Bilinmiyor')] += 1
+
+    def _offer_example(self, category: str, text: str):
+        """Kategori örneği: ilk N yorum veya rezervuar örneklemesi (Algorithm R)"""
+        examples = self.category_examples[category]
+        if len(examples) < self.top_n_examples:
+            slot = len(examples)
+            examples.append(None)
+        elif self.sample_examples:
+            slot = self._rng.randrange(self.category_counts[category])
+            if slot >= self.top_n_examples:
+                return
+        else:
+            return
+        stripped = text.strip()
+        examples[slot] = stripped[:120] + ("..." if len(stripped) > 120 else "")
+
+    def add_many(self, comments: Iterable[Dict]):
+        for comment in comments:
+            self.add(comment)
+        return self
+
+    def merge(self, other: 'SummaryAccumulator') -> 'SummaryAccumulator':
+        """
+        Başka bir parçanın kısmi özetini bu özete kat (self döner). Birleştirme birleşmelidir:
+        parçalar sırasıyla birleştirildiğinde sayaçlar ve ilk-N örnekleri tek geçişle aynıdır.
+        Rezervuar örneklerinde her parçadan, gördüğü yorum sayısıyla orantılı seçim yapılır.
+        """
+        self.has_textile = self.has_textile or other.has_textile
+        for polarity in ('positive', 'negative'):
+            for target, source in ((self.summary_counters, other.summary_counters),
+                                   (self.pros_cons_counters, other.pros_cons_counters)):
+                for phrase, count in source[polarity].items():
+                    target[polarity][phrase] = target[polarity].get(phrase, 0) + count
+        for sentiment, count in other.sentiment_counts.items():
+            self.sentiment_counts[sentiment] += count
+        self.rating_counts.update(other.rating_counts)
+        self.seller_counts.update(other.seller_counts)
+
+        for category in self.categories:
+            own_count = self.category_counts[category]
+            other_count = other.category_counts.get(category, 0)
+            self.category_examples[category] = self._merge_examples(
+                self.category_examples[category], own_count,
+                other.category_examples.get(category, []), other_count
+            )
+            self.category_counts[category] = own_count + other_count
+
+        self.total += other.total
+        return self
+
+    def _merge_examples(self, own: List[str], own_count: int, other: List[str], other_count: int) -> List[str]:
+        if not self.sample_examples:
+            return (own + other)[:self.top_n_examples]
+
+        own, other = list(own), list(other)
+        merged = []
+        while len(merged) < self.top_n_examples and (own or other):
+            if own and (not other or self._rng.random() * (own_count + other_count) < own_count):
+                merged.append(own.pop(self._rng.randrange(len(own))))
+                own_count -= 1
+            else:
+                merged.append(other.pop(self._rng.randrange(len(other))))
+                other_count -= 1
+        return merged
+
+    def to_dict(self) -> Dict:
+        """JSON'a yazılabilir kısmi özet durumu (süreçler/makineler arası taşıma ve kalıcı saklama)"""
+        return {
+            'include_beden_renk': self.include_beden_renk,
+            'top_n_examples': self.top_n_examples,
+            'sample_examples': self.sample_examples,
+            'has_textile': self.has_textile,
+            'total': self.total,
+            'sentiment_counts': dict(self.sentiment_counts),
+            'rating_counts': {str(rating): count for rating, count in self.rating_counts.items()},
+            'seller_counts': dict(self.seller_counts),
+            'summary_counters': self.summary_counters,
+            'pros_cons_counters': self.pros_cons_counters,
+            'category_counts': self.category_counts,
+            'category_examples': self.category_examples,
+        }
+
+    @classmethod
+    def from_dict(cls, summarizer, state: Dict) -> 'SummaryAccumulator':
+        accumulator = cls(
+            summarizer,
+            include_beden_renk=state.get('include_beden_renk', False),
+            top_n_examples=state.get('top_n_examples', 3),
+            sample_examples=state.get('sample_examples', False)
+        )
+        accumulator.has_textile = state.get('has_textile', False)
+        accumulator.total = state.get('total', 0)
+        accumulator.sentiment_counts.update(state.get('sentiment_counts', {}))
+        accumulator.rating_counts.update({int(rating): count for rating, count in state.get('rating_counts', {}).items()})
+        accumulator.seller_counts.update(state.get('seller_counts', {}))
+        for polarity in ('positive', 'negative'):
+            accumulator.summary_counters[polarity].update(state.get('summary_counters', {}).get(polarity, {}))
+            accumulator.pros_cons_counters[polarity].update(state.get('pros_cons_counters', {}).get(polarity, {}))
+        accumulator.category_counts.update(state.get('category_counts', {}))
+        for category, examples in state.get('category_examples', {}).items():
+            accumulator.category_examples[category] = list(examples)
+        return accumulator
+
+    def sentiment(self) -> Dict:
+        counts = self.sentiment_counts
+        return self.summarizer.sentiment_stats(counts['positive'], counts['negative'], counts['neutral'], self.total)
+
+    def ratings(self) -> Dict:
+        return self.summarizer.rating_stats(self.rating_counts)
+
+    def summary_paragraph(self) -> str:
+        if not self.total:
+            return "No comments found."
+        return self.summarizer.format_summary_paragraph(
+            self.summary_counters['positive'], self.summary_counters['negative'], self.sentiment(), self.ratings()
+        )
+
+    def pros_cons(self, top_n: int = 5) -> Dict:
+        return self.summarizer.format_pros_cons(
+            self.pros_cons_counters['positive'], self.pros_cons_counters['negative'], top_n
+        )
+
+    def includes_beden_renk(self) -> bool:
+        if self.include_beden_renk is None:
+            return self.has_textile
+        return self.include_beden_renk
+
+    def category_analysis(self) -> Dict:
+        categories = list(self.summarizer.summary_categories)
+        if self.includes_beden_renk():
+            categories += list(self.summarizer.beden_renk_categories)
+        return {
+            category: {'count': self.category_counts[category], 'examples': list(self.category_examples[category])}
+            for category in categories
+        }
+
+    def ai_summary(self) -> Dict:
+        """generate_ai_summary ile aynı yapıda özet"""
+        return {
+            'genel_degerlendirme': self.summary_paragraph(),
+            'arti_eksi_ozellikler': self.pros_cons(),
+            'kategorik_analiz': self.category_analysis(),
+            'satici_degerlendirmesi': dict(self.seller_counts.most_common()),
+            'toplam_yorum': self.total,
+        }
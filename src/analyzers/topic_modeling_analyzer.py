@@ -1,7 +1,4 @@
-import csv
 import json
-import re
-from collections import Counter
 from typing import List, Dict, Tuple, Any
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -9,17 +6,15 @@ from sklearn.cluster import KMeans
 from sklearn.decomposition import LatentDirichletAllocation
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from sentence_transformers import SentenceTransformer
 import warnings
+from comment_loader import load_comment_records
+from keyword_extractor import get_document_term_matrix
+from pipeline_profiler import profiled
+from turkish_text import alpha_tokens
 warnings.filterwarnings('ignore')
 
 # NLTK verilerini indir (ilk çalıştırmada)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
@@ -55,50 +50,35 @@ class TopicModelingAnalyzer:
             print("Pip install sentence-transformers komutu ile yükleyebilirsiniz.")
             self.sentence_model = None
     
+    @profiled('topic.preprocess')
     def preprocess_text(self, text: str) -> str:
-        """Metin ön işleme"""
-        if not text:
-            return ""
-        
-        # Küçük harfe çevir
-        text = text.lower()
-        
-        # Özel karakterleri temizle
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', '', text)  # Sayıları kaldır
-        text = re.sub(r'\s+', ' ', text)  # Çoklu boşlukları tek boşluğa çevir
-        
-        # Tokenize et
-        try:
-            words = word_tokenize(text, language='turkish')
-        except:
-            words = text.split()
-        
-        # Stop words'leri filtrele ve kısa kelimeleri kaldır
-        filtered_words = [
-            word for word in words 
-            if word not in self.turkish_stop_words 
-            and len(word) > 2 
-            and word.isalpha()
-        ]
-        
-        return ' '.join(filtered_words)
+        """Metin ön işleme (ortak turkish_text katmanı; aynı metin tekrar işlenmez)"""
+        # Küçük harf, noktalama/rakam temizliği ve tokenize tek derlenmiş desenle;
+        # stop words'ler ve en fazla 2 harfli kelimeler filtrelenir
+        return ' '.join(word for word in alpha_tokens(text) if word not in self.turkish_stop_words)
+    
+    def cluster_top_words(self, processed_texts: List[str], labels, n_words: int = 10) -> Dict[Any, List[str]]:
+        """
+        Her kümenin en sık kelimeleri. processed_texts ön işlenmiş metinler, labels her metnin kümesi;
+        küme sayımları ortak doküman-terim matrisinden tek seyrek çarpımla çıkar.
+        """
+        matrix = get_document_term_matrix(
+            processed_texts, lambda texts: [text.split() for text in texts], 'topic_processed'
+        )
+        tables = matrix.group_top_terms(list(labels), k=n_words)
+        return {label: [word for word, _ in words] for label, words in tables.items()}
     
     def load_comments_from_csv(self, filename: str) -> List[Dict]:
         """CSV'den yorumları yükle"""
-        comments = []
         try:
-            with open(filename, 'r', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row.get('comment', '').strip():
-                        comments.append(row)
+            comments = load_comment_records(filename, skip_empty=True)
             print(f"📊 {len(comments)} yorum yüklendi")
             return comments
         except Exception as e:
             print(f"❌ CSV okuma hatası: {e}")
             return []
     
+    @profiled('topic.lda', items='texts')
     def lda_topic_modeling(self, texts: List[str], n_topics: int = 5, n_words: int = 10, max_iter: int = 100, alpha: float = 0.1, beta: float = 0.01) -> tuple:
         """LDA ile konu modelleme"""
         print(f"🔍 LDA analizi başlıyor ({n_topics} konu)...")
@@ -165,6 +145,7 @@ class TopicModelingAnalyzer:
             print(f"LDA analizi hatası: {e}")
             return [], [], 0
     
+    @profiled('topic.embedding_clustering', items='texts')
     def embedding_clustering(self, texts: List[str], n_clusters: int = 5) -> Dict:
         """Embedding tabanlı clustering"""
         print(f"🧠 Embedding clustering başlıyor ({n_clusters} küme)...")
@@ -176,12 +157,14 @@ class TopicModelingAnalyzer:
         
         # Metinleri temizle
         clean_texts = []
+        processed_texts = []
         original_indices = []
         
         for i, text in enumerate(texts):
             clean_text = self.preprocess_text(text)
             if len(clean_text.split()) >= 3:
                 clean_texts.append(text)  # Orijinal metni kullan
+                processed_texts.append(clean_text)
                 original_indices.append(i)
         
         if len(clean_texts) < n_clusters:
@@ -207,17 +190,11 @@ class TopicModelingAnalyzer:
                     'distance_to_center': np.linalg.norm(embeddings[i] - kmeans.cluster_centers_[label])
                 })
             
-            # Her küme için temsili kelimeler çıkar
+            # Her küme için temsili kelimeler çıkar (tüm kümeler tek matris çarpımıyla)
+            cluster_words = self.cluster_top_words(processed_texts, cluster_labels)
             cluster_topics = []
             for cluster_id, docs in clusters.items():
-                # Kümedeki tüm metinleri birleştir
-                cluster_text = ' '.join([doc['text'] for doc in docs])
-                processed_cluster_text = self.preprocess_text(cluster_text)
-                
-                # En sık geçen kelimeleri bul
-                words = processed_cluster_text.split()
-                word_freq = Counter(words)
-                top_words = [word for word, count in word_freq.most_common(10)]
+                top_words = cluster_words[cluster_id]
                 
                 # Kümenin merkezine en yakın dokümanı bul
                 closest_doc = min(docs, key=lambda x: x['distance_to_center'])
@@ -272,6 +249,7 @@ class TopicModelingAnalyzer:
         # Pattern bulunamazsa ilk 3 kelimeyi kullan
         return ' & '.join(top_words[:3]).title()
     
+    @profiled('topic.analyze_topics', items='comments')
     def analyze_topics(self, comments: List[Dict], lda_topics: int = 6, cluster_topics: int = 6) -> Dict:
         """Kapsamlı konu analizi"""
         texts = [comment.get('comment', '') for comment in comments if comment.get('comment', '').strip()]
@@ -465,19 +443,9 @@ class TopicModelingAnalyzer:
                     'distance_to_center': np.linalg.norm(embeddings[i] - kmeans.cluster_centers_[label])
                 })
             
-            # Her küme için temsili kelimeler çıkar
-            cluster_topics = []
-            for cluster_id, docs in clusters.items():
-                # Kümedeki tüm metinleri birleştir
-                cluster_text = ' '.join([doc['text'] for doc in docs])
-                processed_cluster_text = self.preprocess_text(cluster_text)
-                
-                # En sık geçen kelimeleri bul
-                words = processed_cluster_text.split()
-                word_freq = Counter(words)
-                top_words = [word for word, count in word_freq.most_common(10)]
-                
-                cluster_topics.append(top_words)
+            # Her küme için temsili kelimeler çıkar (metinler zaten ön işlenmiş; tek matris çarpımı)
+            cluster_words = self.cluster_top_words(clean_texts, cluster_labels)
+            cluster_topics = [cluster_words[cluster_id] for cluster_id in clusters]
             
             # Store topic information for UI
             self.topic_sizes = {i: len(clusters.get(i, [])) for i in range(num_topics)}
@@ -544,23 +512,9 @@ class TopicModelingAnalyzer:
                     'original_index': i
                 })
             
-            # Her küme için temsili kelimeler çıkar
-            cluster_topics = []
-            for cluster_id, docs in clusters.items():
-                # Kümedeki tüm metinleri birleştir
-                cluster_text = ' '.join([doc['text'] for doc in docs])
-                processed_cluster_text = self.preprocess_text(cluster_text)
-                
-                # Kümedeki tüm metinleri birleştir
-                cluster_text = ' '.join([doc['text'] for doc in docs])
-                processed_cluster_text = self.preprocess_text(cluster_text)
-                
-                # En sık geçen kelimeleri bul
-                words = processed_cluster_text.split()
-                word_freq = Counter(words)
-                top_words = [word for word, count in word_freq.most_common(10)]
-                
-                cluster_topics.append(top_words)
+            # Her küme için temsili kelimeler çıkar (metinler zaten ön işlenmiş; tek matris çarpımı)
+            cluster_words = self.cluster_top_words(clean_texts, cluster_labels)
+            cluster_topics = [cluster_words[cluster_id] for cluster_id in clusters]
             
             # Store topic information for UI
             self.topic_sizes = {i: len(clusters.get(i, [])) for i in range(num_topics)}
@@ -0,0 +1,83 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from pipeline_profiler import RESULT, profiled
+
+# Ay adları (küçük harf): Türkçe, Türkçe karaktersiz yazımlar ve eski '%d %B %Y' denemesinin
+# yakaladığı İngilizce adlar
+MONTHS = {
+    'ocak': 1, 'şubat': 2, 'subat': 2, 'mart': 3, 'nisan': 4, 'mayıs': 5, 'mayis': 5,
+    'haziran': 6, 'temmuz': 7, 'ağustos': 8, 'agustos': 8, 'eylül': 9, 'eylul': 9,
+    'ekim': 10, 'kasım': 11, 'kasim': 11, 'aralık': 12, 'aralik': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+_DAY_MONTH_YEAR = re.compile(r'^(\d{1,2})\s+(\w+)\s+(\d{4})$')
+_DOTTED = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{4})$')
+_ISO = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+
+# Yorum tarihleri çok tekrar eder (gün bazında); her farklı metin bir kez çözülür
+DATE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> Optional[int]:
+    """
+    '12 Mart 2025', '12.03.2025' veya '2025-03-12' biçimindeki tarihi yerel gece yarısının
+    epoch saniyesine çevir. Çözülemeyen tarihler için None.
+    """
+    text = (value or '').strip()
+    if not text:
+        return None
+
+    match = _DAY_MONTH_YEAR.match(text)
+    if match:
+        day, month_name, year = match.groups()
+        month = MONTHS.get(month_name.lower()) or MONTHS.get(month_name.replace('İ', 'i').replace('I', 'ı').lower())
+        if month is None:
+            return None
+    else:
+        match = _DOTTED.match(text)
+        if match:
+            day, month, year = match.groups()
+        else:
+            match = _ISO.match(text)
+            if not match:
+                return None
+            year, month, day = match.groups()
+
+    try:
+        return int(datetime(int(year), int(month), int(day)).timestamp())
+    except ValueError:
+        return None
+
+
+@profiled('dates.parse_column', items=RESULT)
+def parse_date_column(values: Iterable[str]) -> List[Optional[int]]:
+    """Tarih sütununu toplu çevir (her farklı değer bir kez çözülür)"""
+    values = list(values)
+    unique = {value: parse_date(value) for value in set(values)}
+    return [unique[value] for value in values]
+
+
+def annotate_date_epochs(comments: List[Dict], date_key: str = 'date') -> List[Dict]:
+    """Yüklemede her yoruma 'date_epoch' alanını ekle (yerinde günceller)"""
+    epochs = parse_date_column(str(comment.get(date_key, '') or '') for comment in comments)
+    for comment, epoch in zip(comments, epochs):
+        comment['date_epoch'] = epoch
+    return comments
+
+
+def comment_epoch(comment: Dict) -> Optional[int]:
+    """Yorumun epoch tarihi (yüklemede eklenmediyse tarih metninden çözülür)"""
+    if 'date_epoch' in comment:
+        return comment['date_epoch']
+    return parse_date(str(comment.get('date', '') or ''))
+
+
+def recency_cutoff(days: int = 7, now: Optional[datetime] = None) -> int:
+    """Son `days` günlük pencerenin başlangıcı (epoch saniye)"""
+    return int(((now or datetime.now()) - timedelta(days=days)).timestamp())
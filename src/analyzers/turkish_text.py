@@ -0,0 +1,72 @@
+import re
+from functools import lru_cache
+from typing import Tuple
+
+# Önbellekler uzun süreli servislerde de küçük kalır: tam metin önbelleği sadece aynı isteğin/akışın
+# yakın tekrarları için (birkaç bin yorum), asıl kazanç sınırlı sözcük dağarcığının kelime başı önbelleğinden
+NORMALIZE_CACHE_SIZE = 4096
+TOKEN_CACHE_SIZE = 50000
+
+# Küçük harfe çevrilmiş metin için Türkçe -> ASCII karşılıkları (özet ve anahtar kelime temizliği).
+# Kısa yorumlarda zincirleme str.replace, str.translate'ten belirgin şekilde hızlı olduğu için tablo çift listesidir.
+TURKISH_ASCII = (('ı', 'i'), ('ğ', 'g'), ('ü', 'u'), ('ş', 's'), ('ö', 'o'), ('ç', 'c'))
+
+# Büyük/küçük harf ve şapkalı harfler dahil tam katlama (yakın kopya tespiti, küçük harfe çevirmeden önce)
+TURKISH_FOLD = str.maketrans('ıİğĞüÜşŞöÖçÇâÂîÎûÛ', 'iigguussooccaaiiuu')
+
+# Tek derlenmiş kelime deseni: `[^\w\s]` -> boşluk + boşluk birleştirme + split ile aynı kelimeleri verir
+WORD_PATTERN = re.compile(r'\w+')
+
+_DIGIT_PATTERN = re.compile(r'\d+')
+
+
+def fold_turkish(text: str) -> str:
+    """Küçük harfli metindeki Türkçe karakterleri ASCII karşılıklarına çevirir"""
+    for turkish, ascii_char in TURKISH_ASCII:
+        text = text.replace(turkish, ascii_char)
+    return text
+
+
+# Katlama kelime sınırlarını değiştirmez (Türkçe harfler ve karşılıkları \w), kelime kelime yapılabilir
+_fold_word = lru_cache(maxsize=TOKEN_CACHE_SIZE)(fold_turkish)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def word_tokens(text: str) -> Tuple[str, ...]:
+    """Küçük harf + ASCII katlanmış metnin kelimeleri (CommentSummarizer.clean_text(text).split() ile aynı)"""
+    if not text:
+        return ()
+    return tuple(map(_fold_word, WORD_PATTERN.findall(text.lower())))
+
+
+def normalize_text(text: str) -> str:
+    """Küçük harf, Türkçe karakter katlama, noktalama ve fazla boşluk temizliği"""
+    return ' '.join(word_tokens(text))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def alpha_tokens(text: str, min_length: int = 3) -> Tuple[str, ...]:
+    """
+    Konu modelleme kelimeleri: küçük harf, noktalama ayırıcı, rakamlar silinir (Türkçe karakterler korunur);
+    sadece harflerden oluşan ve en az min_length uzunluktaki kelimeler döner
+    """
+    if not text:
+        return ()
+    return tuple(word for word in map(_alpha_word, WORD_PATTERN.findall(text.lower())) if word and len(word) >= min_length)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _alpha_word(word: str) -> str:
+    """Kelimenin harf kısmı; rakamlar içinden silinir ("abc123def" -> "abcdef"), alt çizgili kelimeler '' olur"""
+    if word.isalpha():
+        return word
+    word = _DIGIT_PATTERN.sub('', word)
+    return word if word.isalpha() else ''
+
+
+def clear_cache():
+    """Normalizasyon önbelleklerini boşalt (benchmark ve uzun süreli servisler için)"""
+    word_tokens.cache_clear()
+    alpha_tokens.cache_clear()
+    _fold_word.cache_clear()
+    _alpha_word.cache_clear()
@@ -9,6 +9,20 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+# Yakın kopya yorum temizliği (opsiyonel)
+try:
+    from near_duplicate_detector import NearDuplicateDetector, print_dedup_report
+    DEDUP_AVAILABLE = True
+except ImportError:
+    DEDUP_AVAILABLE = False
+
+# Parquet yorum deposu (opsiyonel): her çekim ürün/gün bölümüne eklenir
+try:
+    from comment_store import CommentStore, DEFAULT_STORE_DIR
+    STORE_AVAILABLE = True
+except ImportError:
+    STORE_AVAILABLE = False
+
 class TrendyolSeleniumScraper:
     def __init__(self):
         options = webdriver.ChromeOptions()
@@ -374,6 +388,7 @@ class TrendyolSeleniumScraper:
         all_comments = []
         seen = set()
         last_count = 0
+        target_reached = False
         no_new_comments_count = 0
         
         print(f"Hedef: En az {min_comments} yorum toplamak")
@@ -437,9 +452,13 @@ class TrendyolSeleniumScraper:
             
             print(f"Scroll {i+1}: {new_added} yeni yorum eklendi. Toplam: {len(all_comments)}")
             
-            # Hedef sayıya ulaştık mı?
+            # Hedef sayıya ulaştık mı? (yakın kopyalar ayıklandıktan sonraki sayıyla; eksikse kaydırmaya devam)
+            if len(all_comments) >= min_comments and DEDUP_AVAILABLE:
+                all_comments, dedup_report = NearDuplicateDetector().deduplicate(all_comments)
+                print_dedup_report(dedup_report)
             if len(all_comments) >= min_comments:
                 print(f"Hedef sayıya ulaşıldı: {len(all_comments)} yorum")
+                target_reached = True
                 break
             
             # Yeni yorum gelmiyorsa
@@ -461,6 +480,12 @@ class TrendyolSeleniumScraper:
                 self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
                 time.sleep(1)
         
+        # Birebir metin kontrolünün kaçırdığı yakın kopyaları (emoji, noktalama, Türkçe karakter farkı) ayıkla
+        # (hedefe ulaşıldıysa liste hedef kontrolünde zaten ayıklandı)
+        if DEDUP_AVAILABLE and all_comments and not target_reached:
+            all_comments, dedup_report = NearDuplicateDetector().deduplicate(all_comments)
+            print_dedup_report(dedup_report)
+        
         print(f"Toplam {len(all_comments)} benzersiz yorum toplandı.")
         return all_comments
 
@@ -725,6 +750,18 @@ class TrendyolSeleniumScraper:
                 writer.writerow(comment)
         print(f"Toplam {len(to_save)} yorum {filename} dosyasına kaydedildi.")
 
+    def save_to_store(self, comments, product_url, store_dir=None):
+        """Yorumları Parquet yorum deposuna ekle (ürün ve bugünün bölümüne yeni dosya)"""
+        if not STORE_AVAILABLE or not comments:
+            return 0
+        try:
+            count = CommentStore(store_dir or DEFAULT_STORE_DIR).append(comments, product_url)
+            print(f"Toplam {count} yorum yorum deposuna eklendi.")
+            return count
+        except Exception as e:
+            print(f"Yorum deposu kaydetme hatası: {e}")
+            return 0
+
     def close(self):
         if self.driver:
             self.driver.quit()
@@ -752,6 +789,7 @@ if __name__ == "__main__":
     else:
         scraper.save_to_csv(comments, min_comments=target_comments)
         print(f"Toplam {len(comments)} yorum bulundu, ilk {target_comments} tanesi kaydedildi.")
+    scraper.save_to_store(comments[:target_comments], url)
     
     scraper.close()
     print("İşlem tamamlandı.")
\ No newline at end of file